@@ -13,12 +13,17 @@ from app.models import (
     AIModel,
     ModelImage,
     ModelTag,
+    ModelEmbedding,
     Favorite,
     Order,
+    OrderNumberSequence,
     Payment,
     DeliveryFile,
     ChatMessage,
     Settlement,
+    PlatformStats,
+    ModelDailyStats,
+    BrandDailyStats,
 )
 
 config = context.config
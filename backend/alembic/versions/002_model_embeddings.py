@@ -0,0 +1,45 @@
+"""Model embeddings for semantic matching (pgvector + HNSW index).
+
+@TASK P3-R1-T1 - AI Matching (semantic backend)
+@SPEC docs/planning/02-trd.md#ai-matching-api
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+from app.services.embedding import EMBEDDING_DIM
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create model_embeddings with an HNSW cosine index."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    op.create_table(
+        'model_embeddings',
+        sa.Column('model_id', sa.String(36), nullable=False),
+        sa.Column('embedding', Vector(EMBEDDING_DIM), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['model_id'], ['ai_models.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('model_id')
+    )
+    op.execute(
+        "CREATE INDEX idx_model_embedding_hnsw ON model_embeddings "
+        "USING hnsw (embedding vector_cosine_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop model_embeddings (the vector extension is left installed)."""
+    op.drop_index('idx_model_embedding_hnsw', 'model_embeddings')
+    op.drop_table('model_embeddings')
@@ -0,0 +1,38 @@
+"""Composite (sort_key, id) indexes for keyset pagination of ai_models.
+
+@TASK P2-R1-T1 - AI Models API (cursor pagination)
+@SPEC docs/planning/02-trd.md#ai-models-api
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace single-column sort indexes with (sort_key, id) composites."""
+    op.create_index('idx_model_view_count_id', 'ai_models', ['view_count', 'id'])
+    op.create_index('idx_model_rating_id', 'ai_models', ['rating', 'id'])
+    op.create_index('idx_model_created_at_id', 'ai_models', ['created_at', 'id'])
+
+    # Superseded: the composites serve every query these served
+    op.drop_index('idx_model_rating', 'ai_models')
+    op.drop_index('idx_model_created_at', 'ai_models')
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.create_index('idx_model_created_at', 'ai_models', ['created_at'])
+    op.create_index('idx_model_rating', 'ai_models', ['rating'])
+
+    op.drop_index('idx_model_created_at_id', 'ai_models')
+    op.drop_index('idx_model_rating_id', 'ai_models')
+    op.drop_index('idx_model_view_count_id', 'ai_models')
@@ -0,0 +1,99 @@
+"""Full-text keyword search document for ai_models.
+
+@TASK P2-R1-T1 - AI Models API (keyword search)
+@SPEC docs/planning/02-trd.md#ai-models-api
+
+Adds ``search_document`` (bigram tokens of name, description and tags, see
+app/services/search.py) with a GIN index over its ``simple`` tsvector.
+Existing rows are filled here, in keyset batches, with the same
+``build_search_document`` the model service uses; later drift can be repaired
+with ``python -m app.db.backfill_models``.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.search import build_search_document
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+
+_models = sa.table(
+    'ai_models',
+    sa.column('id', sa.String),
+    sa.column('name', sa.String),
+    sa.column('description', sa.Text),
+    sa.column('search_document', sa.Text),
+)
+_tags = sa.table(
+    'model_tags',
+    sa.column('model_id', sa.String),
+    sa.column('tag', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def _backfill_search_documents() -> None:
+    """Compute search_document for every existing model, one batch at a time."""
+    bind = op.get_bind()
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(_models.c.id, _models.c.name, _models.c.description)
+            .where(_models.c.id > last_id)
+            .order_by(_models.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        tags: dict[str, list[str]] = {row.id: [] for row in rows}
+        for model_id, tag in bind.execute(
+            sa.select(_tags.c.model_id, _tags.c.tag)
+            .where(_tags.c.model_id.in_(list(tags)))
+            .order_by(_tags.c.model_id, _tags.c.created_at)
+        ):
+            tags[model_id].append(tag)
+        bind.execute(
+            _models.update()
+            .where(_models.c.id == sa.bindparam('model_id'))
+            .values(search_document=sa.bindparam('document')),
+            [
+                {
+                    'model_id': row.id,
+                    'document': build_search_document(
+                        row.name, row.description, tags[row.id]
+                    ),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Add search_document, backfill it, then build its GIN tsvector index."""
+    op.add_column(
+        'ai_models',
+        sa.Column('search_document', sa.Text(), server_default='', nullable=False),
+    )
+    # Before the index, so rows are indexed once rather than updated in it
+    _backfill_search_documents()
+    op.execute(
+        "CREATE INDEX idx_model_search ON ai_models "
+        "USING gin (to_tsvector('simple'::regconfig, search_document))"
+    )
+
+
+def downgrade() -> None:
+    """Drop the search index and column."""
+    op.execute("DROP INDEX IF EXISTS idx_model_search")
+    op.drop_column('ai_models', 'search_document')
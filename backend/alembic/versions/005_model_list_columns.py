@@ -0,0 +1,54 @@
+"""Denormalized thumbnail_url and tag_names on ai_models.
+
+@TASK P2-R1-T1 - AI Models API (list read model)
+@SPEC docs/planning/02-trd.md#ai-models-api
+
+List endpoints (models, matching, favorites) read these columns instead of
+loading the images/tags collections. Existing rows are filled here; later
+drift can be repaired with ``python -m app.db.backfill_models``.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the columns and backfill them from model_images/model_tags."""
+    op.add_column('ai_models', sa.Column('thumbnail_url', sa.String(500), nullable=True))
+    op.add_column(
+        'ai_models',
+        sa.Column('tag_names', sa.JSON(), server_default='[]', nullable=False),
+    )
+
+    op.execute(
+        """
+        UPDATE ai_models m SET
+            tag_names = COALESCE(
+                (SELECT json_agg(t.tag ORDER BY t.created_at)
+                 FROM model_tags t WHERE t.model_id = m.id),
+                '[]'::json
+            ),
+            thumbnail_url = (
+                SELECT i.image_url FROM model_images i
+                WHERE i.model_id = m.id AND i.is_thumbnail
+                ORDER BY i.display_order, i.created_at
+                LIMIT 1
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the denormalized columns."""
+    op.drop_column('ai_models', 'tag_names')
+    op.drop_column('ai_models', 'thumbnail_url')
@@ -0,0 +1,44 @@
+"""Store refresh tokens as SHA-256 hashes; index expiry for the sweeper.
+
+@TASK P1-R1-T1 - Auth API (refresh token storage)
+@SPEC docs/planning/04-database-design.md#authtoken
+
+Existing rows are hashed in place with PostgreSQL's sha256(), so sessions
+survive the upgrade. Downgrading cannot recover the tokens and empties the
+table (users sign in again).
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace refresh_token with token_hash and add the expiry index."""
+    op.add_column('auth_tokens', sa.Column('token_hash', sa.String(64), nullable=True))
+    op.execute(
+        "UPDATE auth_tokens SET token_hash = encode(sha256(convert_to(refresh_token, 'UTF8')), 'hex')"
+    )
+    op.alter_column('auth_tokens', 'token_hash', nullable=False)
+    op.create_index('idx_auth_token_hash', 'auth_tokens', ['token_hash'], unique=True)
+    op.create_index('idx_auth_token_expires_at', 'auth_tokens', ['expires_at'])
+    op.drop_column('auth_tokens', 'refresh_token')
+
+
+def downgrade() -> None:
+    """Restore the plain refresh_token column (stored tokens are dropped)."""
+    op.execute("DELETE FROM auth_tokens")
+    op.add_column('auth_tokens', sa.Column('refresh_token', sa.String(255), nullable=False))
+    op.create_unique_constraint('auth_tokens_refresh_token_key', 'auth_tokens', ['refresh_token'])
+    op.drop_index('idx_auth_token_expires_at', 'auth_tokens')
+    op.drop_index('idx_auth_token_hash', 'auth_tokens')
+    op.drop_column('auth_tokens', 'token_hash')
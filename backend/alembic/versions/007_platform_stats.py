@@ -0,0 +1,49 @@
+"""Materialized platform_stats row for GET /api/stats.
+
+@TASK P2-R3-T1 - Platform Stats API (materialized counters)
+@SPEC docs/planning/02-trd.md#platform-stats-api
+
+The single row is filled from the current data here; afterwards it is bumped
+by the writing transactions and reconciled periodically.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create platform_stats and compute its row."""
+    op.create_table(
+        'platform_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('total_models', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_bookings', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_brands', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute(
+        """
+        INSERT INTO platform_stats (id, total_models, total_bookings, total_brands, updated_at)
+        SELECT 1,
+            (SELECT COUNT(*) FROM ai_models WHERE status = 'active'),
+            (SELECT COUNT(*) FROM orders WHERE status = 'completed'),
+            (SELECT COUNT(*) FROM users WHERE role = 'brand' AND is_active),
+            now()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop platform_stats."""
+    op.drop_table('platform_stats')
@@ -0,0 +1,72 @@
+"""Daily analytics rollup tables and the indexes their refresh scans.
+
+@TASK P4-R4-T1 - Dashboard analytics (daily rollups)
+@SPEC docs/planning/04-database-design.md#analytics-rollups
+
+The tables start empty; the first refresh at startup backfills them from
+orders and settlements. Views are only recorded from this revision on.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create model_daily_stats and brand_daily_stats."""
+    op.create_table(
+        'model_daily_stats',
+        sa.Column('model_id', sa.String(36), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('creator_id', sa.String(36), nullable=False),
+        sa.Column('orders_created', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('orders_accepted', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('orders_completed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('orders_cancelled', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('gmv', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('settlement_amount', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('views', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['model_id'], ['ai_models.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['creator_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('model_id', 'day'),
+    )
+    op.create_index(
+        'idx_model_daily_stats_creator_day', 'model_daily_stats', ['creator_id', 'day']
+    )
+    op.create_index('idx_model_daily_stats_day', 'model_daily_stats', ['day'])
+
+    op.create_table(
+        'brand_daily_stats',
+        sa.Column('brand_id', sa.String(36), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('orders_created', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('orders_completed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('orders_cancelled', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('spend', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['brand_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('brand_id', 'day'),
+    )
+    op.create_index('idx_brand_daily_stats_day', 'brand_daily_stats', ['day'])
+
+    op.create_index('idx_order_updated_at', 'orders', ['updated_at'])
+    op.create_index('idx_settlement_created_at', 'settlements', ['created_at'])
+
+
+def downgrade() -> None:
+    """Drop the rollup tables and their source indexes."""
+    op.drop_index('idx_settlement_created_at', table_name='settlements')
+    op.drop_index('idx_order_updated_at', table_name='orders')
+    op.drop_index('idx_brand_daily_stats_day', table_name='brand_daily_stats')
+    op.drop_table('brand_daily_stats')
+    op.drop_index('idx_model_daily_stats_day', table_name='model_daily_stats')
+    op.drop_index('idx_model_daily_stats_creator_day', table_name='model_daily_stats')
+    op.drop_table('model_daily_stats')
@@ -0,0 +1,46 @@
+"""Per-day order number sequences.
+
+@TASK P3-R2-T1 - Orders business logic (order number allocation)
+@SPEC docs/planning/02-trd.md#orders-api
+
+Each day's row starts at the highest ORD-YYYYMMDD-NNN suffix already used, so
+numbers allocated after the upgrade never collide with existing orders.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create order_number_sequences and seed it from existing orders."""
+    op.create_table(
+        'order_number_sequences',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('last_value', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('day'),
+    )
+    op.execute(
+        """
+        INSERT INTO order_number_sequences (day, last_value)
+        SELECT to_date(substr(order_number, 5, 8), 'YYYYMMDD'),
+            MAX(CAST(substr(order_number, 14) AS INTEGER))
+        FROM orders
+        WHERE order_number ~ '^ORD-[0-9]{8}-[0-9]+$'
+        GROUP BY 1
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop order_number_sequences."""
+    op.drop_table('order_number_sequences')
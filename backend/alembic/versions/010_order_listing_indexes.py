@@ -0,0 +1,49 @@
+"""Composite indexes for the role-filtered order listing.
+
+@TASK P3-R2-T1 - Orders business logic (listing)
+@SPEC docs/planning/02-trd.md#orders-api
+
+GET /api/orders filters on brand_id or creator_id, optionally status, and
+sorts by (created_at, id) DESC. (party, status, created_at, id) serves the
+filtered listing, its keyset seek and the COUNT from one index; its leading
+column also serves every lookup the single-column party indexes did.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the single-column party indexes with listing composites."""
+    op.create_index(
+        'idx_order_brand_status_created_id',
+        'orders',
+        ['brand_id', 'status', 'created_at', 'id'],
+    )
+    op.create_index(
+        'idx_order_creator_status_created_id',
+        'orders',
+        ['creator_id', 'status', 'created_at', 'id'],
+    )
+
+    # Superseded: the composites lead with the same column
+    op.drop_index('idx_order_brand_id', 'orders')
+    op.drop_index('idx_order_creator_id', 'orders')
+
+
+def downgrade() -> None:
+    """Restore the single-column party indexes."""
+    op.create_index('idx_order_creator_id', 'orders', ['creator_id'])
+    op.create_index('idx_order_brand_id', 'orders', ['brand_id'])
+
+    op.drop_index('idx_order_creator_status_created_id', 'orders')
+    op.drop_index('idx_order_brand_status_created_id', 'orders')
@@ -0,0 +1,51 @@
+"""Transactional outbox for order side effects.
+
+@TASK P3-R2-T1 - Orders business logic (outbox)
+@SPEC docs/planning/04-database-design.md#outbox
+
+Events are written in the transaction of the state change and drained by
+the outbox worker (app/services/outbox.py). The (status, available_at) index
+serves the worker's claim query.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create outbox_events."""
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('event_type', sa.String(50), nullable=False),
+        sa.Column('aggregate_id', sa.String(36), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('idempotency_key', sa.String(100), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('available_at', sa.DateTime(), nullable=False),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('idempotency_key'),
+    )
+    op.create_index(
+        'idx_outbox_status_available_at', 'outbox_events', ['status', 'available_at']
+    )
+
+
+def downgrade() -> None:
+    """Drop outbox_events."""
+    op.drop_index('idx_outbox_status_available_at', 'outbox_events')
+    op.drop_table('outbox_events')
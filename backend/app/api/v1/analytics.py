@@ -0,0 +1,154 @@
+# @TASK P4-R4-T1 - Dashboard analytics endpoints
+# @SPEC docs/planning/04-database-design.md#analytics-rollups
+"""Dashboard analytics API endpoints.
+
+Daily series read from the rollup tables (see app/services/analytics.py);
+the range defaults to the last 30 days and is capped at
+``ANALYTICS_MAX_RANGE_DAYS``. Days are UTC.
+
+Routes:
+    GET /api/analytics/creator            - Creator series over all their models (creator only)
+    GET /api/analytics/models/:model_id   - Series of one model (owner only)
+    GET /api/analytics/brand              - Brand order series (brand only)
+"""
+import logging
+from datetime import date, datetime, timedelta
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.deps import CurrentUser
+from app.db.session import get_read_db
+from app.schemas.analytics import (
+    BrandAnalyticsResponse,
+    ModelAnalyticsResponse,
+)
+from app.services.analytics import (
+    BRAND_METRICS,
+    MODEL_METRICS,
+    get_brand_series,
+    get_creator_series,
+    get_model_creator_id,
+    get_model_series,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+DEFAULT_RANGE_DAYS = 30
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _resolve_range(start: Optional[date], end: Optional[date]) -> tuple[date, date]:
+    """Apply defaults and raise 400 for an inverted or too long range."""
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end",
+        )
+    if (end - start).days + 1 > settings.ANALYTICS_MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range must not exceed {settings.ANALYTICS_MAX_RANGE_DAYS} days",
+        )
+    return start, end
+
+
+def _require_role(user, role: str) -> None:
+    """Raise 403 unless the user has the given role."""
+    if user.role != role:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Only {role}s can view these analytics",
+        )
+
+
+def _totals(items: list[dict], metrics: tuple[str, ...]) -> dict:
+    return {name: sum(item[name] for item in items) for name in metrics}
+
+
+# ---------------------------------------------------------------------------
+# GET /analytics/creator - Creator series
+# ---------------------------------------------------------------------------
+
+
+@router.get("/creator")
+async def creator_analytics(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    start: Optional[date] = Query(None, description="First day (UTC), default end - 29 days"),
+    end: Optional[date] = Query(None, description="Last day (UTC), default today"),
+) -> ModelAnalyticsResponse:
+    """Daily orders, revenue, settlements and views over the creator's models."""
+    _require_role(current_user, "creator")
+    start, end = _resolve_range(start, end)
+
+    items = await get_creator_series(db, current_user.id, start, end)
+    return ModelAnalyticsResponse(
+        start=start, end=end, items=items, totals=_totals(items, MODEL_METRICS)
+    )
+
+
+# ---------------------------------------------------------------------------
+# GET /analytics/models/{model_id} - Model series (owner only)
+# ---------------------------------------------------------------------------
+
+
+@router.get("/models/{model_id}")
+async def model_analytics(
+    model_id: str,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    start: Optional[date] = Query(None, description="First day (UTC), default end - 29 days"),
+    end: Optional[date] = Query(None, description="Last day (UTC), default today"),
+) -> ModelAnalyticsResponse:
+    """Daily orders, revenue, settlements and views of one model."""
+    start, end = _resolve_range(start, end)
+
+    creator_id = await get_model_creator_id(db, model_id)
+    if creator_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Model not found",
+        )
+    if creator_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view analytics of your own models",
+        )
+
+    items = await get_model_series(db, model_id, start, end)
+    return ModelAnalyticsResponse(
+        start=start, end=end, items=items, totals=_totals(items, MODEL_METRICS)
+    )
+
+
+# ---------------------------------------------------------------------------
+# GET /analytics/brand - Brand series
+# ---------------------------------------------------------------------------
+
+
+@router.get("/brand")
+async def brand_analytics(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    start: Optional[date] = Query(None, description="First day (UTC), default end - 29 days"),
+    end: Optional[date] = Query(None, description="Last day (UTC), default today"),
+) -> BrandAnalyticsResponse:
+    """Daily orders and spend of the brand."""
+    _require_role(current_user, "brand")
+    start, end = _resolve_range(start, end)
+
+    items = await get_brand_series(db, current_user.id, start, end)
+    return BrandAnalyticsResponse(
+        start=start, end=end, items=items, totals=_totals(items, BRAND_METRICS)
+    )
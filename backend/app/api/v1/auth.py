@@ -16,8 +16,8 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import CurrentUser
-from app.core.security import verify_password
+from app.core.deps import CurrentUser, CurrentUserRecord
+from app.core.security import verify_password_async
 from app.db.session import get_db
 from app.schemas.auth import (
     LoginRequest,
@@ -136,11 +136,11 @@ async def refresh(
 @router.post("/password/change")
 async def change_password(
     password_data: PasswordChangeRequest,
-    current_user: CurrentUser,
+    current_user: CurrentUserRecord,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Change current user's password."""
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password_async(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password",
@@ -6,23 +6,35 @@ Routes:
     GET   /api/orders/{order_id}/messages      - List messages (JWT, paginated)
     POST  /api/orders/{order_id}/messages      - Send message (JWT, 201)
     PATCH /api/orders/{order_id}/messages/read  - Mark as read (JWT)
+    WS    /api/orders/{order_id}/messages/ws    - New messages, pushed (JWT)
 """
+import asyncio
 import logging
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import CurrentUser
-from app.db.session import get_db
+from app.core.deps import CurrentUser, authenticate_token
+from app.core.pubsub import get_broker
+from app.db.session import get_db, get_read_db
 from app.schemas.chat import (
     MessageCreate,
     MessageListResponse,
     MessageResponse,
 )
 from app.services.chat import (
+    check_order_access,
     list_messages,
     mark_as_read,
+    order_channel,
     send_message,
 )
 
@@ -69,7 +81,7 @@ def _build_message_response(msg) -> dict:
 async def list_order_messages(
     order_id: str,
     current_user: CurrentUser,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
 ) -> MessageListResponse:
@@ -166,3 +178,54 @@ async def mark_messages_as_read(
         )
 
     return {"marked_as_read": count}
+
+
+# ---------------------------------------------------------------------------
+# WS /orders/{order_id}/messages/ws - Stream new chat messages
+# ---------------------------------------------------------------------------
+
+
+@router.websocket("/{order_id}/messages/ws")
+async def stream_order_messages(
+    websocket: WebSocket,
+    order_id: str,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    token: Optional[str] = Query(None, description="Access token (browsers cannot set headers)"),
+) -> None:
+    """Push every new message of an order to one of its parties.
+
+    The access token (``token`` query parameter or ``Authorization: Bearer``
+    header) and the order permission are checked once, at connect; the
+    handshake is refused (policy violation) otherwise. Each message is sent
+    as the JSON of ``MessageResponse``. Frames from the client are ignored.
+    """
+    if token is None:
+        scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else None
+    try:
+        if not token:
+            raise PermissionError("Not authenticated")
+        user = await authenticate_token(db, token)
+        await check_order_access(db, order_id, user)
+    except (HTTPException, PermissionError, ValueError) as e:
+        reason = e.detail if isinstance(e, HTTPException) else str(e)
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=reason)
+        return
+    finally:
+        # The socket may stay open for hours: release the connection now
+        await db.close()
+
+    async with get_broker().subscribe(order_channel(order_id)) as subscription:
+        await websocket.accept()
+
+        async def push() -> None:
+            async for message in subscription:
+                await websocket.send_text(message)
+
+        pusher = asyncio.create_task(push())
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            pusher.cancel()
+            await asyncio.gather(pusher, return_exceptions=True)
@@ -14,7 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import CurrentUser
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.favorite import (
     AIModelBrief,
     FavoriteCreate,
@@ -41,19 +41,7 @@ router = APIRouter(prefix="/favorites", tags=["favorites"])
 
 
 def _model_to_brief(ai_model) -> AIModelBrief:
-    """Convert an AIModel ORM instance to an AIModelBrief schema.
-
-    Extracts thumbnail URL from the model's images relationship if available.
-    """
-    thumbnail = None
-    if hasattr(ai_model, "images") and ai_model.images:
-        for img in ai_model.images:
-            if img.is_thumbnail:
-                thumbnail = img.image_url
-                break
-        if thumbnail is None and ai_model.images:
-            thumbnail = ai_model.images[0].image_url
-
+    """Convert an AIModel ORM instance to an AIModelBrief schema."""
     return AIModelBrief(
         id=ai_model.id,
         name=ai_model.name,
@@ -63,7 +51,7 @@ def _model_to_brief(ai_model) -> AIModelBrief:
         age_range=ai_model.age_range,
         rating=ai_model.rating,
         status=ai_model.status,
-        thumbnail=thumbnail,
+        thumbnail=ai_model.thumbnail_url,
     )
 
 
@@ -111,7 +99,7 @@ async def create_favorite(
 @router.get("", response_model=FavoriteListResponse)
 async def get_favorites(
     current_user: CurrentUser,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
 ):
@@ -3,7 +3,8 @@
 """AI Matching API endpoint: concept-based model recommendation.
 
 Routes:
-    POST /api/matching/recommend - Recommend AI models based on concept description
+    POST /api/matching/recommend       - Recommend AI models based on concept description
+    POST /api/matching/recommend/batch - Recommend AI models for many concepts at once
 """
 import logging
 from typing import Annotated
@@ -13,8 +14,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import CurrentUser
 from app.db.session import get_db
-from app.schemas.matching import MatchingRequest, MatchingResponse
-from app.services.matching import recommend_models
+from app.schemas.matching import (
+    BatchMatchingRequest,
+    BatchMatchingResponse,
+    MatchingRequest,
+    MatchingResponse,
+)
+from app.services.matching import recommend_models, recommend_models_batch
 
 logger = logging.getLogger(__name__)
 
@@ -55,3 +61,30 @@ async def recommend(
     )
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# POST /matching/recommend/batch - Many concepts in one request
+# ---------------------------------------------------------------------------
+
+
+@router.post("/recommend/batch", response_model=BatchMatchingResponse)
+async def recommend_batch(
+    request: BatchMatchingRequest,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> BatchMatchingResponse:
+    """Recommend AI models for up to 50 concept descriptions at once.
+
+    Every concept is scored in a single vectorized pass over the active
+    models. Results are returned in the same order as the concepts.
+
+    Requires JWT authentication.
+    """
+    logger.info(
+        "Batch matching request from user %s: %d concepts",
+        current_user.id,
+        len(request.concepts),
+    )
+
+    return await recommend_models_batch(db, request)
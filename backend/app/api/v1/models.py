@@ -3,8 +3,8 @@
 """AI Models API endpoints.
 
 Routes:
-    GET    /api/models              - List models with filters & pagination
-    GET    /api/models/:id          - Get model detail (view_count++)
+    GET    /api/models              - List models with filters & pagination (offset or cursor)
+    GET    /api/models/:id          - Get model detail (cached, ETag; buffered view_count++)
     POST   /api/models              - Create model (creator only)
     PATCH  /api/models/:id          - Update model (owner only)
     POST   /api/models/:id/images   - Upload image to model (owner only)
@@ -12,11 +12,11 @@ Routes:
 import logging
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import CurrentUser
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.model import (
     AIModelCreate,
     AIModelListItem,
@@ -28,12 +28,14 @@ from app.schemas.model import (
 )
 from app.services.model import (
     add_model_image,
+    cache_model_detail,
     create_model,
+    get_cached_model_detail,
     get_model_by_id,
-    increment_view_count,
     list_models,
     update_model,
 )
+from app.services.view_counter import view_counter
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +91,7 @@ def _build_model_response(model) -> dict:
 
 
 def _build_list_item(model) -> dict:
-    """Build a list item dict from an ORM model."""
+    """Build a list item dict from an ORM model (denormalized columns only)."""
     return {
         "id": model.id,
         "creator_id": model.creator_id,
@@ -100,8 +102,8 @@ def _build_list_item(model) -> dict:
         "view_count": model.view_count,
         "rating": model.rating,
         "status": model.status,
-        "thumbnail_url": _extract_thumbnail_url(model),
-        "tags": _extract_tags(model),
+        "thumbnail_url": model.thumbnail_url,
+        "tags": model.tag_names,
         "creator": (
             CreatorInfo.model_validate(model.creator) if model.creator else None
         ),
@@ -109,6 +111,19 @@ def _build_list_item(model) -> dict:
     }
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
 def _require_creator(user) -> None:
     """Raise 403 if user is not a creator."""
     if user.role != "creator":
@@ -152,26 +167,41 @@ async def create_ai_model(
 
 @router.get("")
 async def list_ai_models(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(12, ge=1, le=100, description="Items per page"),
     style: Optional[str] = Query(None, description="Filter by style"),
     gender: Optional[str] = Query(None, description="Filter by gender"),
     age_range: Optional[str] = Query(None, description="Filter by age range"),
-    keyword: Optional[str] = Query(None, description="Search keyword"),
-    sort: str = Query("recent", description="Sort: popular, recent, rating"),
+    keyword: Optional[str] = Query(None, description="Search keyword (name, description, tags)"),
+    sort: str = Query("recent", description="Sort: popular, recent, rating, relevance"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
+    include_total: bool = Query(True, description="Run the total count query"),
 ) -> AIModelListResponse:
-    """List AI models with optional filters, sorting, and pagination."""
-    models, total = await list_models(
-        db,
-        page=page,
-        limit=limit,
-        style=style,
-        gender=gender,
-        age_range=age_range,
-        keyword=keyword,
-        sort=sort,
-    )
+    """List AI models with optional filters, sorting, and pagination.
+
+    Every response carries ``next_cursor`` (None on the last page). Passing it
+    back as ``cursor`` seeks past the previous page instead of using OFFSET;
+    ``page`` is ignored then. Set ``include_total=false`` to skip the count.
+    """
+    try:
+        models, total, next_cursor = await list_models(
+            db,
+            page=page,
+            limit=limit,
+            style=style,
+            gender=gender,
+            age_range=age_range,
+            keyword=keyword,
+            sort=sort,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     items = [AIModelListItem(**_build_list_item(m)) for m in models]
 
@@ -180,6 +210,7 @@ async def list_ai_models(
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -188,26 +219,44 @@ async def list_ai_models(
 # ---------------------------------------------------------------------------
 
 
-@router.get("/{model_id}")
+@router.get("/{model_id}", response_model=AIModelResponse)
 async def get_ai_model(
     model_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> AIModelResponse:
-    """Get a single AI model by ID. Increments view_count on each access."""
-    model = await get_model_by_id(db, model_id)
-    if not model:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Model not found",
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    """Get a single AI model by ID. Counts one view per access.
+
+    The serialized response is cached per model (read-through) with a weak
+    ETag; a matching ``If-None-Match`` returns 304. The view is buffered (see
+    ``app/services/view_counter.py``); the response shows the stored count
+    plus the views not yet flushed.
+    """
+    entry = await get_cached_model_detail(model_id)
+    if entry is None:
+        model = await get_model_by_id(db, model_id)
+        if not model:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Model not found",
+            )
+        payload = AIModelResponse(**_build_model_response(model))
+        entry = await cache_model_detail(
+            model.id,
+            payload.model_dump_json(exclude={"view_count"}),
+            model.view_count,
         )
 
-    # Increment view count
-    model = await increment_view_count(db, model)
-
-    # Reload relationships after commit
-    model = await get_model_by_id(db, model_id)
+    pending_views = await view_counter.record(model_id)
 
-    return AIModelResponse(**_build_model_response(model))
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=entry.render(entry.view_count + pending_views),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -26,6 +26,7 @@ from app.schemas.order import (
 from app.services.order import (
     create_order,
     get_order_by_id,
+    get_order_parties,
     list_orders,
     update_order_status,
 )
@@ -40,8 +41,12 @@ router = APIRouter(prefix="/orders", tags=["orders"])
 # ---------------------------------------------------------------------------
 
 
-def _build_order_response(order) -> dict:
-    """Build an order response dict from an ORM Order."""
+def _build_order_response(order, parties: Optional[dict] = None) -> dict:
+    """Build an order response dict from an ORM Order.
+
+    ``parties`` (from ``get_order_parties``) replaces the relationships,
+    which write paths do not load.
+    """
     data = {
         "id": order.id,
         "brand_id": order.brand_id,
@@ -64,6 +69,10 @@ def _build_order_response(order) -> dict:
         "model": None,
     }
 
+    if parties is not None:
+        data.update(parties)
+        return data
+
     if order.brand_user:
         data["brand"] = {
             "id": order.brand_user.id,
@@ -149,7 +158,8 @@ async def create_new_order(
         )
 
     order = await create_order(db, current_user.id, order_in)
-    return OrderResponse(**_build_order_response(order))
+    parties = await get_order_parties(db, order)
+    return OrderResponse(**_build_order_response(order, parties))
 
 
 # ---------------------------------------------------------------------------
@@ -164,19 +174,33 @@ async def list_user_orders(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
+    include_total: bool = Query(True, description="Run the total count query"),
 ) -> OrderListResponse:
     """List orders for the current user, filtered by role.
 
     - Brand: sees orders they created
     - Creator: sees orders assigned to them
+
+    Every response carries ``next_cursor`` (None on the last page). Passing it
+    back as ``cursor`` seeks past the previous page instead of using OFFSET;
+    ``page`` is ignored then. Set ``include_total=false`` to skip the count.
     """
-    orders, total = await list_orders(
-        db,
-        current_user,
-        page=page,
-        limit=limit,
-        status_filter=status_filter,
-    )
+    try:
+        orders, total, next_cursor = await list_orders(
+            db,
+            current_user,
+            page=page,
+            limit=limit,
+            status_filter=status_filter,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     items = [OrderListItem(**_build_list_item(o)) for o in orders]
 
@@ -185,6 +209,7 @@ async def list_user_orders(
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -238,23 +263,9 @@ async def update_status(
         - complete: brand or creator (in_progress -> completed)
         - cancel: brand only (pending/accepted/in_progress -> cancelled)
     """
-    order = await get_order_by_id(db, order_id)
-    if not order:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Order not found",
-        )
-
-    # Must be brand or creator of this order
-    if current_user.id not in (order.brand_id, order.creator_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have access to this order",
-        )
-
     try:
-        updated_order = await update_order_status(
-            db, order, status_in.action, current_user
+        order = await update_order_status(
+            db, order_id, status_in.action, current_user
         )
     except PermissionError as e:
         raise HTTPException(
@@ -267,4 +278,11 @@ async def update_status(
             detail=str(e),
         )
 
-    return OrderResponse(**_build_order_response(updated_order))
+    if order is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order not found",
+        )
+
+    parties = await get_order_parties(db, order)
+    return OrderResponse(**_build_order_response(order, parties))
@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import CurrentUser
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.settlement import (
     SettlementListResponse,
     SettlementResponse,
@@ -67,7 +67,7 @@ def _build_settlement_response(settlement) -> dict:
 @router.get("")
 async def list_creator_settlements(
     current_user: CurrentUser,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
 ) -> SettlementListResponse:
@@ -11,7 +11,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.schemas.stats import PlatformStatsResponse
 from app.services.stats import get_platform_stats
 
@@ -27,7 +27,7 @@ router = APIRouter(prefix="/stats", tags=["stats"])
 
 @router.get("", response_model=PlatformStatsResponse)
 async def platform_stats(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> PlatformStatsResponse:
     """Return aggregated platform statistics.
 
@@ -6,13 +6,16 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
 from app.schemas.user import UserResponse, UserUpdate
-from app.core.deps import CurrentUser
+from app.core.deps import CurrentUserRecord
+from app.services.auth import invalidate_user_principal, mark_user_deactivated
+from app.services.order import invalidate_user_summary
+from app.services.stats import bump_platform_stats
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(current_user: CurrentUser):
+async def get_current_user_profile(current_user: CurrentUserRecord):
     """Get current user's profile."""
     return current_user
 
@@ -20,7 +23,7 @@ async def get_current_user_profile(current_user: CurrentUser):
 @router.patch("/me", response_model=UserResponse)
 async def update_current_user_profile(
     user_update: UserUpdate,
-    current_user: CurrentUser,
+    current_user: CurrentUserRecord,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Update current user's profile."""
@@ -30,16 +33,21 @@ async def update_current_user_profile(
         setattr(current_user, field, value)
 
     await db.commit()
+    await invalidate_user_principal(current_user.id)
+    await invalidate_user_summary(current_user.id)
     await db.refresh(current_user)
     return current_user
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_current_user(
-    current_user: CurrentUser,
+    current_user: CurrentUserRecord,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Delete current user's account (soft delete by deactivating)."""
+    if current_user.is_active and current_user.role == "brand":
+        await bump_platform_stats(db, brands=-1)
     current_user.is_active = False
     await db.commit()
+    await mark_user_deactivated(current_user.id)
     return None
@@ -0,0 +1,212 @@
+# @TASK P0-T0.3 - 공통 캐시 (in-process LRU+TTL / Redis)
+# @SPEC docs/planning/02-trd.md#31-성능
+"""Small async cache layer shared by services.
+
+Backends (``settings.CACHE_BACKEND``):
+    memory - per-process LRU with a TTL (default)
+    redis  - shared across workers through ``settings.REDIS_URL``; eviction is
+             left to the server's ``maxmemory-policy`` (use ``allkeys-lru``)
+
+Each cache has a namespace and a version counter. Keys are stored under the
+current version, so ``bump_version()`` invalidates every entry at once (with
+Redis, for every worker). A read-through caller takes ``version()`` before
+reading the source and passes it to ``get``/``set``: a value computed while
+the version was bumped is then dropped (memory) or stored under the old,
+unreachable version (Redis) instead of outliving the invalidation. Hit/miss
+counters are kept per process and exposed through ``cache_stats()``.
+
+Values are strings (serialized JSON), so both backends behave the same.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Cache(Protocol):
+    namespace: str
+    hits: int
+    misses: int
+
+    async def version(self) -> int: ...
+
+    async def get(self, key: str, version: Optional[int] = None) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str, version: Optional[int] = None) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def bump_version(self) -> int: ...
+
+    async def clear(self) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+def _stats(cache: "Cache", size: Optional[int]) -> dict:
+    lookups = cache.hits + cache.misses
+    return {
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "hit_ratio": round(cache.hits / lookups, 4) if lookups else 0.0,
+        "size": size,
+    }
+
+
+# ---------------------------------------------------------------------------
+# In-process backend
+# ---------------------------------------------------------------------------
+
+
+class MemoryCache:
+    """Bounded LRU with per-entry expiry, local to one worker process."""
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float) -> None:
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._version = 0
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def version(self) -> int:
+        return self._version
+
+    async def get(self, key: str, version: Optional[int] = None) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str, version: Optional[int] = None) -> None:
+        if version is not None and version != self._version:
+            return  # Computed before an invalidation
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def bump_version(self) -> int:
+        # Entries are not versioned in memory: dropping them is equivalent
+        self._version += 1
+        self._data.clear()
+        return self._version
+
+    async def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return _stats(self, len(self._data))
+
+
+# ---------------------------------------------------------------------------
+# Redis backend
+# ---------------------------------------------------------------------------
+
+_redis_client = None
+
+
+def get_redis():
+    """Return the process-wide ``redis.asyncio`` client (created lazily)."""
+    global _redis_client
+    if _redis_client is None:
+        import redis.asyncio as redis
+
+        _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+class RedisCache:
+    """Cache entries in Redis so every worker shares hits and invalidations."""
+
+    def __init__(self, namespace: str, ttl: float) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._version_key = f"cache:{namespace}:version"
+
+    async def version(self) -> int:
+        return int(await get_redis().get(self._version_key) or 0)
+
+    async def _key(self, key: str, version: Optional[int] = None) -> str:
+        if version is None:
+            version = await self.version()
+        return f"cache:{self.namespace}:v{version}:{key}"
+
+    async def get(self, key: str, version: Optional[int] = None) -> Optional[str]:
+        value = await get_redis().get(await self._key(key, version))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str, version: Optional[int] = None) -> None:
+        # Under a bumped version the key is never read again and just expires
+        await get_redis().set(
+            await self._key(key, version), value, ex=max(int(self.ttl), 1)
+        )
+
+    async def delete(self, key: str) -> None:
+        await get_redis().delete(await self._key(key))
+
+    async def bump_version(self) -> int:
+        # Old-version keys are never read again and expire through their TTL
+        return int(await get_redis().incr(self._version_key))
+
+    async def clear(self) -> None:
+        await self.bump_version()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return _stats(self, None)
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_caches: dict[str, Cache] = {}
+
+
+def create_cache(namespace: str, *, maxsize: int, ttl: float) -> Cache:
+    """Create (or return the existing) cache for a namespace."""
+    if namespace in _caches:
+        return _caches[namespace]
+    if settings.CACHE_BACKEND == "redis":
+        cache: Cache = RedisCache(namespace, ttl)
+    else:
+        cache = MemoryCache(namespace, maxsize, ttl)
+    _caches[namespace] = cache
+    return cache
+
+
+def cache_stats() -> dict[str, dict]:
+    """Hit/miss counters of every registered cache, keyed by namespace."""
+    return {namespace: cache.stats() for namespace, cache in _caches.items()}
+
+
+async def clear_caches() -> None:
+    """Empty every registered cache and reset its counters."""
+    for cache in _caches.values():
+        await cache.clear()
@@ -1,51 +1,99 @@
-"""Dependencies for authentication."""
+"""Dependencies for authentication.
+
+``get_current_user`` resolves the access token to a ``UserPrincipal``
+(id, role, nickname, is_active) without touching the ``users`` row on most
+requests:
+    - with ``ACCESS_TOKEN_EMBED_CLAIMS`` and the Redis cache backend the
+      principal is built from the token itself; deactivated users are still
+      rejected through the shared ``deactivated_users`` cache
+    - otherwise it is read through the ``user_principal`` cache
+      (``USER_PRINCIPAL_CACHE_TTL_SECONDS``)
+
+Handlers that read or write the full profile use ``CurrentUserRecord``, which
+loads the ORM row.
+"""
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from app.db.session import get_db
 from app.models.user import User
-from app.schemas.auth import TokenPayload
+from app.schemas.auth import TokenPayload, UserPrincipal
 from app.core.config import settings
 from app.core.security import ALGORITHM
+from app.services.auth import (
+    embedded_claims_enabled,
+    get_user_by_id,
+    get_user_principal,
+    is_user_deactivated,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
-async def get_current_user(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    token: Annotated[str, Depends(oauth2_scheme)],
-) -> User:
-    """Get current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
 
+async def authenticate_token(db: AsyncSession, token: str) -> UserPrincipal:
+    """Resolve an access token to an active user's principal.
+
+    Raises:
+        HTTPException: 401 for an invalid token or unknown user, 403 for an
+            inactive user.
+    """
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        token_data = TokenPayload(**payload)
+        if token_data.sub is None:
             raise credentials_exception
-        token_data = TokenPayload(sub=user_id)
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == token_data.sub))
-    user = result.scalar_one_or_none()
+    if embedded_claims_enabled() and token_data.role and token_data.nickname:
+        principal = UserPrincipal(
+            id=token_data.sub,
+            role=token_data.role,
+            nickname=token_data.nickname,
+            is_active=not await is_user_deactivated(token_data.sub),
+        )
+    else:
+        principal = await get_user_principal(db, token_data.sub)
 
-    if user is None:
+    if principal is None:
         raise credentials_exception
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user"
         )
 
+    return principal
+
+
+async def get_current_user(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> UserPrincipal:
+    """Get current authenticated user from JWT token."""
+    return await authenticate_token(db, token)
+
+
+CurrentUser = Annotated[UserPrincipal, Depends(get_current_user)]
+
+
+async def get_current_user_record(
+    principal: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """Load the authenticated user's ORM row (profile reads and writes)."""
+    user = await get_user_by_id(db, principal.id)
+    if user is None:
+        raise credentials_exception
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUserRecord = Annotated[User, Depends(get_current_user_record)]
@@ -0,0 +1,366 @@
+# @TASK P0-T0.3 - 메트릭 (Prometheus 텍스트 포맷)
+# @SPEC docs/planning/02-trd.md#31-성능
+"""In-process metrics exposed at ``GET /metrics`` in the Prometheus text format.
+
+No client library or external service: counters, gauges and histograms live
+in this process and are rendered on scrape (with several workers, each one
+exposes its own numbers).
+
+Recorded:
+    - per route: request count by status, latency histogram, in-flight gauge
+      (``MetricsMiddleware``)
+    - per statement: query duration by verb (SQLAlchemy cursor events)
+    - per request: query count and total query time by route, which is where
+      N+1 patterns show up (many queries on a route that should run a few)
+    - pool checkout wait (``TimedQueuePool``) and pool occupancy
+    - cache hit ratios and the password hashing queue, read on scrape
+
+Query debugging (``DB_QUERY_DEBUG``, defaults to ``DEBUG``): responses carry
+an ``X-DB-Queries`` header, and a statement repeated
+``DB_REPEATED_QUERY_THRESHOLD`` times or more within one request (same shape,
+different parameters) is logged as a likely N+1. Tests lock in query budgets
+with the ``query_budget`` fixture (``tests/conftest.py``).
+"""
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import cache_stats
+from app.core.config import settings
+from app.core.middleware import route_template
+from app.core.security import password_hash_stats
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ---------------------------------------------------------------------------
+# Metric types
+# ---------------------------------------------------------------------------
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _registry.append(self)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            for labels, value in self._values.items()
+        ]
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        self._values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> (per-bucket counts incl. +Inf, [sum, count])
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        item = self._values.get(labels)
+        if item is None:
+            item = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0, 0])
+        item[0][bisect_left(self.buckets, value)] += 1
+        item[1][0] += value
+        item[1][1] += 1
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for labels, (counts, (total, count)) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {int(count)}")
+        return lines
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_registry: list[_Metric] = []
+_collectors: list[Callable[[], None]] = []
+
+
+def add_collector(collector: Callable[[], None]) -> None:
+    """Run ``collector`` before each scrape (to set gauges read on demand)."""
+    _collectors.append(collector)
+
+
+def render_metrics() -> str:
+    """Every registered metric in the Prometheus text exposition format."""
+    for collector in _collectors:
+        collector()
+    lines: list[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    """Forget every recorded value (tests)."""
+    for metric in _registry:
+        metric.clear()
+
+
+http_requests = Counter(
+    "http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")
+)
+http_requests_in_flight = Gauge("http_requests_in_flight", "HTTP requests being served.")
+
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "Duration of single SQL statements by verb.", ("verb",), QUERY_BUCKETS
+)
+db_queries_per_request = Histogram(
+    "db_queries_per_request", "SQL statements executed per HTTP request.", ("route",), COUNT_BUCKETS
+)
+db_query_seconds_per_request = Histogram(
+    "db_query_seconds_per_request", "Total SQL time per HTTP request.", ("route",)
+)
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds", "Time to check a connection out of the pool.", ("pool",), QUERY_BUCKETS
+)
+db_pool_connections = Gauge(
+    "db_pool_connections", "Pooled connections by state.", ("pool", "state")
+)
+
+cache_hits = Gauge("cache_hits", "Cache hits since start.", ("cache",))
+cache_misses = Gauge("cache_misses", "Cache misses since start.", ("cache",))
+cache_hit_ratio = Gauge("cache_hit_ratio", "Cache hits / lookups.", ("cache",))
+password_hash_queue = Gauge("password_hash_queued", "bcrypt calls waiting for a worker.")
+
+
+def _collect_caches() -> None:
+    for namespace, stats in cache_stats().items():
+        cache_hits.set(namespace, value=stats["hits"])
+        cache_misses.set(namespace, value=stats["misses"])
+        cache_hit_ratio.set(namespace, value=stats["hit_ratio"])
+    password_hash_queue.set(value=password_hash_stats()["queued"])
+
+
+add_collector(_collect_caches)
+
+
+# ---------------------------------------------------------------------------
+# Database instrumentation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RequestDBStats:
+    queries: int = 0
+    seconds: float = 0.0
+    shapes: Optional[StatementCounter] = None  # statement shape -> executions (debug)
+
+
+# A run of bind placeholders in parentheses: IN (?, ?, ?) / VALUES ($1, $2)
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|\$\d+|%\(\w+\)s)(?:\s*,\s*(?:\?|\$\d+|%\(\w+\)s))*\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with placeholder lists collapsed, so IN lists of any size match."""
+    return " ".join(_PLACEHOLDER_LIST.sub("(?)", statement).split())
+
+
+def repeated_statements(
+    shapes: StatementCounter, threshold: Optional[int] = None
+) -> list[tuple[str, int]]:
+    """Shapes executed at least ``threshold`` times, most frequent first."""
+    threshold = threshold or settings.DB_REPEATED_QUERY_THRESHOLD
+    return [(shape, count) for shape, count in shapes.most_common() if count >= threshold]
+
+
+def query_debug_enabled() -> bool:
+    return settings.DEBUG if settings.DB_QUERY_DEBUG is None else settings.DB_QUERY_DEBUG
+
+
+# Set by MetricsMiddleware for the duration of one request
+request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context) -> None:
+    # A failed statement never reaches after_cursor_execute: drop its start
+    # time so the connection's stack does not grow with every error
+    conn = context.connection
+    starts = conn.info.get("query_start") if conn is not None else None
+    if starts:
+        starts.pop()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+    db_query_duration.observe(elapsed, verb)
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+        if stats.shapes is not None:
+            stats.shapes[statement_shape(statement)] += 1
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited."""
+
+    metrics_name = "primary"
+
+    def _do_get(self):  # noqa: ANN202
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - start, self.metrics_name)
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+# ---------------------------------------------------------------------------
+# HTTP middleware
+# ---------------------------------------------------------------------------
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route HTTP and per-request DB metrics.
+
+    With query debugging on it also adds ``X-DB-Queries`` and logs repeated
+    statement shapes.
+    """
+
+    def __init__(self, app: ASGIApp, debug_queries: Optional[bool] = None) -> None:
+        self.app = app
+        self.debug_queries = query_debug_enabled() if debug_queries is None else debug_queries
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status = [500]
+        stats = RequestDBStats(shapes=StatementCounter() if self.debug_queries else None)
+        token = request_db_stats.set(stats)
+        http_requests_in_flight.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                if self.debug_queries:
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"x-db-queries", str(stats.queries).encode()),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_db_stats.reset(token)
+            http_requests_in_flight.dec()
+            route = route_template(scope) if "route" in scope else "unmatched"
+            method = scope["method"]
+            http_requests.inc(method, route, str(status[0]))
+            http_request_duration.observe(time.perf_counter() - start_time, method, route)
+            db_queries_per_request.observe(stats.queries, route)
+            db_query_seconds_per_request.observe(stats.seconds, route)
+            if stats.shapes:
+                for shape, count in repeated_statements(stats.shapes):
+                    logger.warning(
+                        "Possible N+1 on %s %s: %d x %s", method, route, count, shape[:300]
+                    )
@@ -1,13 +1,15 @@
 # @TASK P0-T0.3 - 에러 핸들링 미들웨어 및 요청 로깅
 # @SPEC docs/planning/02-trd.md#에러-핸들링
 import logging
+import random
 import time
+from typing import Optional
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
@@ -147,21 +149,68 @@ def register_exception_handlers(app: FastAPI) -> None:
 # ---------------------------------------------------------------------------
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Logs every request with method, path, status code, and duration."""
+def route_template(scope: Scope) -> str:
+    """Template of the matched route (with router prefix), else the raw path."""
+    path = scope["path"]
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return path
+    # Routers included with a prefix may report only their own part of the
+    # template; the prefix is the leading segments of the raw path.
+    segments = path.split("/")
+    prefix = "/".join(segments[: max(len(segments) - template.count("/"), 1)])
+    return template if template.startswith(prefix) else prefix + template
 
-    async def dispatch(self, request: Request, call_next):  # noqa: ANN001
-        start_time = time.perf_counter()
 
-        response = await call_next(request)
+class RequestLoggingMiddleware:
+    """Logs requests with method, route template, status, size and duration.
+
+    Pure ASGI: ``send`` is wrapped in place, so responses are streamed
+    through untouched (no extra task or memory stream per request).
+
+    - ``ttfb`` is measured at ``http.response.start``, the total duration at
+      the last ``http.response.body`` message
+    - the path is the matched route template (``/api/models/{model_id}``),
+      falling back to the raw path for unmatched requests
+    - only a ``REQUEST_LOG_SAMPLE_RATE`` fraction of requests is logged;
+      server errors are always logged
+    """
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
-        logger.info(
-            "%s %s -> %d (%.1fms)",
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration_ms,
+    def __init__(self, app: ASGIApp, sample_rate: Optional[float] = None) -> None:
+        self.app = app
+        self.sample_rate = (
+            settings.REQUEST_LOG_SAMPLE_RATE if sample_rate is None else sample_rate
         )
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        state = {"status": 500, "ttfb": 0.0, "duration": 0.0, "size": 0}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["ttfb"] = time.perf_counter() - start_time
+            elif message["type"] == "http.response.body":
+                state["size"] += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    state["duration"] = time.perf_counter() - start_time
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if state["status"] >= 500 or random.random() < self.sample_rate:
+                duration = state["duration"] or time.perf_counter() - start_time
+                logger.info(
+                    "%s %s -> %d %dB (ttfb %.1fms, %.1fms)",
+                    scope["method"],
+                    route_template(scope),
+                    state["status"],
+                    state["size"],
+                    state["ttfb"] * 1000,
+                    duration * 1000,
+                )
@@ -0,0 +1,63 @@
+# @TASK P0-T0.3 - 공통 페이지네이션 (keyset cursor)
+# @SPEC docs/planning/02-trd.md#8-api-설계-원칙
+"""Opaque cursors for keyset (seek) pagination.
+
+A cursor records the sort key values of the last row a client has seen,
+including a unique tiebreaker (the primary key), e.g. ``("rating", 4.5,
+"<id>")``. The next page is then ``WHERE (sort_key, id) < (4.5, '<id>')``
+on an index over ``(sort_key, id)`` instead of ``OFFSET``, so deep pages cost
+the same as the first one and rows never shift between pages.
+
+Cursors are URL-safe base64 of a small JSON array. They are not signed: a
+tampered cursor can only produce a different page of rows the caller could
+list anyway.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+_DATETIME_TAG = "$dt"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and _DATETIME_TAG in value:
+        return datetime.fromisoformat(value[_DATETIME_TAG])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort key values (str/int/float/datetime) into an opaque cursor."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not hold ``size`` values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise ValueError("Invalid cursor") from None
+
+
+def seek_before(columns: list[ColumnElement], values: list[Any]) -> ColumnElement:
+    """Row-value condition selecting rows after the cursor in DESC order."""
+    return tuple_(*columns) < tuple_(*values)
@@ -0,0 +1,192 @@
+# @TASK P0-T0.3 - 공통 pub/sub (in-process / Redis)
+# @SPEC docs/planning/02-trd.md#31-성능
+"""Channel fan-out for server pushes (e.g. chat messages over WebSocket).
+
+Backends (``settings.PUBSUB_BACKEND``):
+    memory - subscribers of the publishing process only (default; a single
+             worker)
+    redis  - messages go through Redis pub/sub (``settings.REDIS_URL``), so a
+             subscriber on any worker receives them. Each process holds one
+             Redis subscription per channel with local subscribers, however
+             many sockets listen to it.
+
+Subscribers read from a bounded queue (``PUBSUB_QUEUE_SIZE``). A subscriber
+that falls that far behind loses its oldest messages rather than slowing
+down the publisher; clients recover them from the regular list endpoint.
+
+Messages are strings (serialized JSON), so both backends behave the same.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Protocol
+
+from app.core.cache import get_redis
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """Messages published on one channel since subscribing."""
+
+    def __init__(self, channel: str, maxsize: int) -> None:
+        self.channel = channel
+        self.dropped = 0
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+
+    def _put(self, message: str) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(message)
+
+    async def get(self) -> str:
+        """Wait for the next message."""
+        return await self._queue.get()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self.get()
+
+
+class Broker(Protocol):
+    async def publish(self, channel: str, message: str) -> None: ...
+
+    def subscribe(self, channel: str) -> AsyncIterator[Subscription]: ...
+
+    async def close(self) -> None: ...
+
+
+# ---------------------------------------------------------------------------
+# In-process backend
+# ---------------------------------------------------------------------------
+
+
+class MemoryBroker:
+    """Deliver to the subscribers of this process."""
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+
+    def subscriber_count(self, channel: str) -> int:
+        return len(self._subscribers.get(channel, ()))
+
+    def deliver(self, channel: str, message: str) -> None:
+        for subscription in self._subscribers.get(channel, ()):
+            subscription._put(message)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.deliver(channel, message)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        subscription = Subscription(channel, self.queue_size)
+        self._subscribers[channel].add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscribers[channel].discard(subscription)
+            if not self._subscribers[channel]:
+                del self._subscribers[channel]
+
+    async def close(self) -> None:
+        self._subscribers.clear()
+
+
+# ---------------------------------------------------------------------------
+# Redis backend
+# ---------------------------------------------------------------------------
+
+
+class RedisBroker:
+    """Publish through Redis; fan out locally from one subscription per channel."""
+
+    def __init__(self, queue_size: int, prefix: str = "pubsub") -> None:
+        self.prefix = prefix
+        self._local = MemoryBroker(queue_size)
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    def _key(self, channel: str) -> str:
+        return f"{self.prefix}:{channel}"
+
+    async def publish(self, channel: str, message: str) -> None:
+        await get_redis().publish(self._key(channel), message)
+
+    async def _read(self) -> None:
+        offset = len(self.prefix) + 1
+        while True:
+            try:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(0.1)
+                    continue
+                item = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Redis pub/sub read failed")
+                await asyncio.sleep(1.0)
+                continue
+            if item is not None and item["type"] == "message":
+                self._local.deliver(item["channel"][offset:], item["data"])
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        async with self._local.subscribe(channel) as subscription:
+            async with self._lock:
+                if self._pubsub is None:
+                    self._pubsub = get_redis().pubsub()
+                if self._local.subscriber_count(channel) == 1:
+                    await self._pubsub.subscribe(self._key(channel))
+                if self._reader is None or self._reader.done():
+                    self._reader = asyncio.create_task(self._read(), name="pubsub:redis")
+            try:
+                yield subscription
+            finally:
+                async with self._lock:
+                    if self._local.subscriber_count(channel) == 1:
+                        await self._pubsub.unsubscribe(self._key(channel))
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        await self._local.close()
+
+
+# ---------------------------------------------------------------------------
+# Process-wide broker
+# ---------------------------------------------------------------------------
+
+_broker: Optional[Broker] = None
+
+
+def get_broker() -> Broker:
+    """Return the process-wide broker (created lazily from settings)."""
+    global _broker
+    if _broker is None:
+        if settings.PUBSUB_BACKEND == "redis":
+            _broker = RedisBroker(settings.PUBSUB_QUEUE_SIZE)
+        else:
+            _broker = MemoryBroker(settings.PUBSUB_QUEUE_SIZE)
+    return _broker
+
+
+async def close_broker() -> None:
+    """Close the broker (lifespan shutdown, tests)."""
+    global _broker
+    if _broker is not None:
+        await _broker.close()
+        _broker = None
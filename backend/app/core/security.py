@@ -4,9 +4,18 @@
 
 Note: Uses bcrypt directly instead of passlib to avoid bcrypt>=4.1/passlib
 compatibility issues.
+
+bcrypt takes 100ms+ of CPU per call, so request handlers use the async
+wrappers (``verify_password_async`` / ``get_password_hash_async``). They run
+bcrypt on a dedicated pool of ``PASSWORD_HASH_WORKERS`` threads (bcrypt
+releases the GIL) and keep the event loop free; calls beyond the pool size
+queue up, and ``password_hash_stats()`` reports the queue depth.
 """
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 
 import bcrypt
 from jose import jwt
@@ -15,12 +24,15 @@ from app.core.config import settings
 
 ALGORITHM = "HS256"
 
+T = TypeVar("T")
+
 
 def create_access_token(
     subject: Union[str, Any],
     expires_delta: Optional[timedelta] = None,
+    claims: Optional[dict[str, Any]] = None,
 ) -> str:
-    """Create a short-lived JWT access token."""
+    """Create a short-lived JWT access token, with optional extra claims."""
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -28,7 +40,7 @@ def create_access_token(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
         )
 
-    to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
+    to_encode = {**(claims or {}), "exp": expire, "sub": str(subject), "type": "access"}
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
@@ -44,7 +56,8 @@ def create_refresh_token(
             days=settings.REFRESH_TOKEN_EXPIRE_DAYS,
         )
 
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
+    # jti keeps tokens issued within the same second distinct (auth_tokens is unique)
+    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh", "jti": uuid.uuid4().hex}
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
@@ -62,6 +75,58 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
+    """Hash a password using bcrypt with ``BCRYPT_ROUNDS``."""
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a bcrypt hash was made with a cost other than ``BCRYPT_ROUNDS``."""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+
+# ---------------------------------------------------------------------------
+# Hashing pool
+# ---------------------------------------------------------------------------
+
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
+_hash_stats = {"in_flight": 0, "peak_in_flight": 0, "completed": 0}
+
+
+async def _run_in_hash_pool(func: Callable[..., T], *args: Any) -> T:
+    _hash_stats["in_flight"] += 1
+    _hash_stats["peak_in_flight"] = max(_hash_stats["peak_in_flight"], _hash_stats["in_flight"])
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+    finally:
+        _hash_stats["in_flight"] -= 1
+        _hash_stats["completed"] += 1
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` on the hashing pool."""
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """``get_password_hash`` on the hashing pool."""
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
+def password_hash_stats() -> dict:
+    """Hashing pool counters; ``queued`` calls wait for a free worker."""
+    workers = settings.PASSWORD_HASH_WORKERS
+    in_flight = _hash_stats["in_flight"]
+    return {
+        "workers": workers,
+        "in_flight": in_flight,
+        "queued": max(in_flight - workers, 0),
+        "peak_in_flight": _hash_stats["peak_in_flight"],
+        "completed": _hash_stats["completed"],
+    }
@@ -0,0 +1,45 @@
+# @TASK P0-T0.3 - 공통 백그라운드 작업 (periodic jobs)
+# @SPEC docs/planning/02-trd.md#31-성능
+"""Periodic background jobs running inside the application's event loop.
+
+Jobs are started from the lifespan in ``app/main.py`` and stopped on shutdown.
+A failing run is logged and retried on the next tick; it never kills the loop.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[object]]
+
+_tasks: dict[str, asyncio.Task] = {}
+
+
+async def _run_every(name: str, interval: float, job: Job) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Periodic job %s failed", name)
+
+
+def start_periodic(name: str, interval: float, job: Job) -> asyncio.Task:
+    """Run ``job`` every ``interval`` seconds until ``stop_periodic_jobs``."""
+    if name in _tasks and not _tasks[name].done():
+        return _tasks[name]
+    task = asyncio.create_task(_run_every(name, interval, job), name=f"periodic:{name}")
+    _tasks[name] = task
+    return task
+
+
+async def stop_periodic_jobs() -> None:
+    """Cancel every periodic job and wait for it to finish."""
+    tasks = list(_tasks.values())
+    _tasks.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,61 @@
+"""Recompute the denormalized columns of every AI model.
+
+Rebuilds, from each model's images, tags, name and description:
+    - ``thumbnail_url`` / ``tag_names`` (list read model)
+    - ``search_document`` (keyword search tokens)
+
+Run after bulk imports that bypass the model service, after changing the
+search tokenizer, or to repair drift.
+
+Usage:
+    python -m app.db.backfill_models
+"""
+
+
+async def backfill_all(batch_size: int = 500) -> int:
+    """Recompute models in batches. Returns the number of models updated."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from app.db.session import AsyncSessionLocal
+    from app.models.ai_model import AIModel
+    from app.services.search import build_search_document
+
+    total = 0
+    async with AsyncSessionLocal() as session:
+        last_id = ""
+        while True:
+            result = await session.execute(
+                select(AIModel)
+                .where(AIModel.id > last_id)
+                .order_by(AIModel.id)
+                .limit(batch_size)
+                .options(selectinload(AIModel.images), selectinload(AIModel.tags))
+            )
+            models = list(result.scalars().all())
+            if not models:
+                break
+            for model in models:
+                tags = [t.tag for t in sorted(model.tags, key=lambda t: t.created_at)]
+                thumbnails = sorted(
+                    (img for img in model.images if img.is_thumbnail),
+                    key=lambda img: (img.display_order, img.created_at),
+                )
+                model.thumbnail_url = thumbnails[0].image_url if thumbnails else None
+                model.tag_names = tags
+                model.search_document = build_search_document(
+                    model.name, model.description, tags
+                )
+            await session.commit()
+            session.expunge_all()
+            total += len(models)
+            last_id = models[-1].id
+            print(f"  updated {total} models...")
+
+    print(f"✓ Backfilled {total} AI models")
+    return total
+
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(backfill_all())
@@ -1,4 +1,12 @@
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
     pass
+
+
+def dialect_insert(dialect_name: str, model):
+    """INSERT supporting ``on_conflict_do_*`` (PostgreSQL, else SQLite)."""
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
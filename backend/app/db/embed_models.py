@@ -0,0 +1,49 @@
+"""Offline (re)embedding of every AI model for semantic matching.
+
+Computes the local hashed n-gram embedding of each model's name, description,
+tags and categorical values and upserts it into ``model_embeddings``. Run after
+seeding or after editing the encoder (including ``EMBEDDING_DIM``).
+
+Usage:
+    python -m app.db.embed_models
+"""
+
+
+async def embed_all(batch_size: int = 500) -> int:
+    """Re-embed all models in batches. Returns the number of models embedded."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from app.db.session import AsyncSessionLocal
+    from app.models.ai_model import AIModel
+    from app.services.matching import stage_model_embedding
+
+    total = 0
+    async with AsyncSessionLocal() as session:
+        last_id = ""
+        while True:
+            result = await session.execute(
+                select(AIModel)
+                .where(AIModel.id > last_id)
+                .order_by(AIModel.id)
+                .limit(batch_size)
+                .options(selectinload(AIModel.tags))
+            )
+            models = list(result.scalars().all())
+            if not models:
+                break
+            for model in models:
+                await stage_model_embedding(session, model, [t.tag for t in model.tags])
+            await session.commit()
+            session.expunge_all()
+            total += len(models)
+            last_id = models[-1].id
+            print(f"  embedded {total} models...")
+
+    print(f"✓ Embedded {total} AI models")
+    return total
+
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(embed_all())
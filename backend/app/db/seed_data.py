@@ -397,6 +397,7 @@ async def seed_users(session):
 async def seed_ai_models(session):
     """Seed mock AI models with images and tags."""
     from app.models.ai_model import AIModel, ModelImage, ModelTag
+    from app.services.search import build_search_document
 
     for model_data in MOCK_AI_MODELS:
         # Create AI Model
@@ -411,6 +412,11 @@ async def seed_ai_models(session):
             view_count=model_data["view_count"],
             rating=model_data["rating"],
             status=model_data["status"],
+            thumbnail_url=get_thumbnail_url(model_data),
+            tag_names=list(model_data["tags"]),
+            search_document=build_search_document(
+                model_data["name"], model_data["description"], model_data["tags"]
+            ),
         )
         session.add(model)
 
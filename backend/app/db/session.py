@@ -1,16 +1,197 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+# @TASK P0-T0.3 - DB 엔진 / 커넥션 풀 (설정 기반)
+# @SPEC docs/planning/02-trd.md#31-성능
+"""Async engine, connection pool and session factory.
+
+Every knob comes from ``Settings`` (``DB_*``):
+    - pool sizing: ``DB_POOL_SIZE`` + ``DB_MAX_OVERFLOW``, checkout timeout,
+      ``DB_POOL_RECYCLE_SECONDS`` and ``DB_POOL_PRE_PING``
+    - asyncpg statement caches stay on (``DB_STATEMENT_CACHE_SIZE``) so each
+      connection prepares a statement once. They are only turned off behind a
+      PgBouncer transaction pooler, where a prepared statement may land on a
+      different server connection. PgBouncer is assumed when ``DB_PGBOUNCER``
+      is true, or, when unset, if the URL uses port 6432 or a "pgbouncer" host
+    - SQL echo follows ``DB_ECHO``, which defaults to ``DEBUG``
+
+``warm_pool()`` (called from the lifespan) opens ``DB_POOL_WARMUP``
+connections up front, so the first requests do not pay for connecting.
+
+Read replica: when ``DATABASE_REPLICA_URL`` is set, ``get_read_db`` hands out
+sessions on a second engine with the same pool options. Only endpoints that
+tolerate slightly stale data use it; writes and read-your-writes paths keep
+``get_db``. A client whose request committed on the primary is pinned to the
+primary for ``DB_REPLICA_PIN_SECONDS`` (longer than the expected replica lag),
+so it sees its own writes. Clients are identified by their bearer token and
+pins live in the ``replica_pin`` cache, shared between workers with Redis.
+"""
+import asyncio
+import hashlib
+import logging
+import uuid
+from contextlib import AsyncExitStack
+from typing import Any, Optional
+
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.cache import create_cache
 from app.core.config import settings
+from app.core.metrics import TimedQueuePool, add_collector, db_pool_connections
+
+logger = logging.getLogger(__name__)
+
+PGBOUNCER_PORT = 6432
+
+
+def uses_pgbouncer(database_url: str) -> bool:
+    """Whether connections go through a PgBouncer transaction pooler."""
+    if settings.DB_PGBOUNCER is not None:
+        return settings.DB_PGBOUNCER
+    url = make_url(database_url)
+    return url.port == PGBOUNCER_PORT or "pgbouncer" in (url.host or "")
+
+
+def engine_options(database_url: str) -> dict[str, Any]:
+    """Keyword arguments for ``create_async_engine`` derived from Settings."""
+    url = make_url(database_url)
+    echo = settings.DEBUG if settings.DB_ECHO is None else settings.DB_ECHO
+    options: dict[str, Any] = {"echo": echo}
+
+    if url.get_backend_name() == "sqlite":
+        # SQLite picks its own pool class; sizing options do not apply
+        return options
+
+    options.update(
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+    if url.get_driver_name() == "asyncpg":
+        if uses_pgbouncer(database_url):
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # Unique statement names: server connections are shared between clients
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        else:
+            options["connect_args"] = {
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            }
+    return options
+
+
+def create_engine_from_settings(database_url: str) -> AsyncEngine:
+    """Create an async engine configured by ``engine_options``."""
+    return create_async_engine(database_url, **engine_options(database_url))
+
+
+class PrimarySession(Session):
+    """Session on the primary; remembers whether it committed anything."""
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _mark_committed(session: Session) -> None:
+    session.info["committed"] = True
+
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,
-    connect_args={
-        "prepared_statement_cache_size": 0,
-        "statement_cache_size": 0,
-    },
+engine = create_engine_from_settings(settings.DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, sync_session_class=PrimarySession, expire_on_commit=False
 )
-AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-async def get_db():
+replica_engine: Optional[AsyncEngine] = (
+    create_engine_from_settings(settings.DATABASE_REPLICA_URL)
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+if replica_engine is not None and isinstance(replica_engine.pool, TimedQueuePool):
+    replica_engine.pool.metrics_name = "replica"
+ReplicaSessionLocal = (
+    async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
+)
+
+
+def _collect_pool_metrics() -> None:
+    for name, bind in (("primary", engine), ("replica", replica_engine)):
+        pool = bind.pool if bind is not None else None
+        if not isinstance(pool, TimedQueuePool):
+            continue
+        db_pool_connections.set(name, "checked_out", value=pool.checkedout())
+        db_pool_connections.set(name, "idle", value=pool.checkedin())
+        db_pool_connections.set(name, "overflow", value=max(pool.overflow(), 0))
+
+
+add_collector(_collect_pool_metrics)
+
+_replica_pins = create_cache(
+    "replica_pin",
+    maxsize=settings.DB_REPLICA_PIN_MAX_CLIENTS,
+    ttl=settings.DB_REPLICA_PIN_SECONDS,
+)
+
+
+async def warm_pool(bind: AsyncEngine = engine, connections: Optional[int] = None) -> None:
+    """Open pooled connections concurrently, then return them all to the pool."""
+    connections = settings.DB_POOL_WARMUP if connections is None else connections
+    if connections <= 0:
+        return
+
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(
+            *(stack.enter_async_context(bind.connect()) for _ in range(connections))
+        )
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+    logger.info("Warmed %d database connections", connections)
+
+
+def _client_key(request: Request) -> Optional[str]:
+    """Stable key for the calling client (its bearer token), or None if anonymous."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+async def pin_to_primary(request: Request) -> None:
+    """Route the client's reads to the primary for ``DB_REPLICA_PIN_SECONDS``."""
+    key = _client_key(request)
+    if key is None or replica_engine is None or settings.DB_REPLICA_PIN_SECONDS <= 0:
+        return
+    await _replica_pins.set(key, "1")
+
+
+async def is_pinned_to_primary(request: Request) -> bool:
+    """Whether the client wrote recently enough that the replica may lag behind."""
+    key = _client_key(request)
+    if key is None:
+        return False
+    return await _replica_pins.get(key) is not None
+
+
+async def get_db(request: Request):
     async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            if session.info.get("committed"):
+                await pin_to_primary(request)
+
+
+async def get_read_db(request: Request):
+    """Session for stale-tolerant reads: the replica unless the client is pinned."""
+    if ReplicaSessionLocal is None or await is_pinned_to_primary(request):
+        async with AsyncSessionLocal() as session:
+            yield session
+        return
+    async with ReplicaSessionLocal() as session:
         yield session
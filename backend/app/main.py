@@ -2,16 +2,29 @@
 # @SPEC docs/planning/02-trd.md#앱-초기화
 """FastAPI application with authentication."""
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
-from app.api.v1 import auth, chat, delivery, favorites, matching, models, orders, payments, settlements, stats, users
+from app.api.v1 import analytics, auth, chat, delivery, favorites, matching, models, orders, payments, settlements, stats, users
+from app.core.cache import cache_stats
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.metrics import MetricsMiddleware, query_debug_enabled, render_metrics
+from app.core.pubsub import close_broker
 from app.core.middleware import RequestLoggingMiddleware, register_exception_handlers
-from app.db.session import AsyncSessionLocal
+from app.core.security import password_hash_stats
+from app.core.tasks import start_periodic, stop_periodic_jobs
+from app.db.session import AsyncSessionLocal, replica_engine, warm_pool
+from app.services.auth import embedded_claims_enabled, sweep_expired_refresh_tokens
+from app.services.matching import matching_index
+from app.services.model import flush_view_counts
+from app.services.analytics import refresh_daily_rollups
+from app.services.stats import reconcile_platform_stats
+from app.worker import drain_pending_events
 
 # ---------------------------------------------------------------------------
 # Logging (must be configured before anything else logs)
@@ -20,6 +33,99 @@ setup_logging(debug=settings.DEBUG)
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# Lifespan (startup / shutdown)
+# ---------------------------------------------------------------------------
+
+
+async def flush_buffered_views() -> None:
+    """Write buffered model views to the database."""
+    async with AsyncSessionLocal() as session:
+        await flush_view_counts(session)
+
+
+async def sweep_refresh_tokens() -> None:
+    """Delete expired refresh tokens."""
+    async with AsyncSessionLocal() as session:
+        await sweep_expired_refresh_tokens(session)
+
+
+async def reconcile_stats() -> None:
+    """Recompute the materialized platform stats."""
+    async with AsyncSessionLocal() as session:
+        await reconcile_platform_stats(session)
+
+
+async def refresh_analytics() -> None:
+    """Re-aggregate the recent days of the dashboard rollups."""
+    async with AsyncSessionLocal() as session:
+        await refresh_daily_rollups(session)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm process-local state and run background jobs while serving."""
+    if settings.ACCESS_TOKEN_EMBED_CLAIMS and not embedded_claims_enabled():
+        logger.warning(
+            "ACCESS_TOKEN_EMBED_CLAIMS ignored: deactivations only reach every "
+            "worker with CACHE_BACKEND=redis"
+        )
+
+    try:
+        await warm_pool()
+        if replica_engine is not None:
+            await warm_pool(replica_engine)
+    except Exception as exc:
+        logger.warning("Database pool warm-up failed: %s", exc)
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await matching_index.build(session)
+    except Exception as exc:
+        # The index is built lazily on the first matching request instead.
+        logger.warning("Matching index warm-up failed: %s", exc)
+
+    try:
+        await reconcile_stats()
+    except Exception as exc:
+        # GET /api/stats counts from the source tables until the row exists.
+        logger.warning("Platform stats reconciliation failed: %s", exc)
+
+    try:
+        await refresh_analytics()
+    except Exception as exc:
+        # Retried by the periodic job; charts lag until then.
+        logger.warning("Analytics rollup refresh failed: %s", exc)
+
+    start_periodic(
+        "view_counts", settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS, flush_buffered_views
+    )
+    start_periodic(
+        "platform_stats",
+        settings.PLATFORM_STATS_RECONCILE_INTERVAL_SECONDS,
+        reconcile_stats,
+    )
+    start_periodic(
+        "analytics_rollup", settings.ANALYTICS_ROLLUP_INTERVAL_SECONDS, refresh_analytics
+    )
+    start_periodic(
+        "refresh_token_sweep", settings.AUTH_TOKEN_SWEEP_INTERVAL_SECONDS, sweep_refresh_tokens
+    )
+    if settings.OUTBOX_WORKER_IN_PROCESS:
+        start_periodic(
+            "outbox", settings.OUTBOX_POLL_INTERVAL_SECONDS, drain_pending_events
+        )
+
+    yield
+
+    await stop_periodic_jobs()
+    await close_broker()
+    try:
+        await flush_buffered_views()
+    except Exception as exc:
+        logger.warning("Final view count flush failed: %s", exc)
+
+
 # ---------------------------------------------------------------------------
 # Application factory
 # ---------------------------------------------------------------------------
@@ -28,12 +134,15 @@ app = FastAPI(
     title=settings.APP_NAME,
     version="0.1.0",
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # ---------------------------------------------------------------------------
 # Middleware (order matters: last added = first executed)
 # ---------------------------------------------------------------------------
 
+if settings.METRICS_ENABLED or query_debug_enabled():
+    app.add_middleware(MetricsMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -64,6 +173,7 @@ app.include_router(payments.router, prefix=settings.API_V1_PREFIX)
 app.include_router(delivery.router, prefix=settings.API_V1_PREFIX)
 app.include_router(chat.router, prefix=settings.API_V1_PREFIX)
 app.include_router(settlements.router, prefix=settings.API_V1_PREFIX)
+app.include_router(analytics.router, prefix=settings.API_V1_PREFIX)
 
 
 # ---------------------------------------------------------------------------
@@ -73,7 +183,7 @@ app.include_router(settlements.router, prefix=settings.API_V1_PREFIX)
 
 @app.get("/health")
 async def health_check():
-    """Return application health status including database connectivity."""
+    """Return application health status, database connectivity and pool/cache counters."""
     health: dict = {"status": "healthy"}
 
     try:
@@ -85,4 +195,18 @@ async def health_check():
         health["database"] = "disconnected"
         health["status"] = "degraded"
 
+    health["caches"] = cache_stats()
+    health["password_hashing"] = password_hash_stats()
     return health
+
+
+# ---------------------------------------------------------------------------
+# Metrics (Prometheus text format, see app/core/metrics.py)
+# ---------------------------------------------------------------------------
+
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        """Return this process's metrics for a Prometheus scrape."""
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
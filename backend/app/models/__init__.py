@@ -5,11 +5,14 @@
 
 from app.models.user import User
 from app.models.auth import AuthToken
-from app.models.ai_model import AIModel, ModelImage, ModelTag, Favorite
-from app.models.order import Order, Payment
+from app.models.ai_model import AIModel, ModelEmbedding, ModelImage, ModelTag, Favorite
+from app.models.order import Order, OrderNumberSequence, Payment
 from app.models.delivery import DeliveryFile
 from app.models.chat import ChatMessage
 from app.models.settlement import Settlement
+from app.models.stats import PlatformStats
+from app.models.analytics import BrandDailyStats, ModelDailyStats
+from app.models.outbox import OutboxEvent
 
 __all__ = [
     "User",
@@ -17,10 +20,16 @@ __all__ = [
     "AIModel",
     "ModelImage",
     "ModelTag",
+    "ModelEmbedding",
     "Favorite",
     "Order",
+    "OrderNumberSequence",
     "Payment",
     "DeliveryFile",
     "ChatMessage",
     "Settlement",
+    "PlatformStats",
+    "ModelDailyStats",
+    "BrandDailyStats",
+    "OutboxEvent",
 ]
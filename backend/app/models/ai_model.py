@@ -5,9 +5,11 @@
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Float, DateTime, Boolean, Index, ForeignKey, Text
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DDL, JSON, String, Integer, Float, DateTime, Boolean, Index, ForeignKey, Text, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
+from app.services.embedding import EMBEDDING_DIM
 import uuid
 
 
@@ -37,6 +39,16 @@ class AIModel(Base):
     status: Mapped[str] = mapped_column(
         String(20), default="draft", nullable=False  # draft, active, inactive
     )
+    # Denormalized read model for list paths (kept in sync by the model
+    # service; repair with ``python -m app.db.backfill_models``)
+    thumbnail_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    tag_names: Mapped[list[str]] = mapped_column(
+        JSON, default=list, server_default="[]", nullable=False
+    )
+    # Bigram tokens of name/description/tags, see app/services/search.py
+    search_document: Mapped[str] = mapped_column(
+        Text, default="", server_default="", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
@@ -50,14 +62,48 @@ class AIModel(Base):
     tags = relationship("ModelTag", back_populates="model", cascade="all, delete-orphan")
     favorites = relationship("Favorite", back_populates="model", cascade="all, delete-orphan")
     orders = relationship("Order", back_populates="model", cascade="all, delete-orphan")
+    embedding = relationship(
+        "ModelEmbedding", back_populates="model", uselist=False, cascade="all, delete-orphan"
+    )
 
     __table_args__ = (
         Index("idx_model_creator_id", "creator_id"),
         Index("idx_model_status", "status"),
         Index("idx_model_style", "style"),
-        Index("idx_model_rating", "rating"),
-        Index("idx_model_created_at", "created_at"),
-    )
+        # Keyset pagination: (sort_key, id) for every list sort option
+        Index("idx_model_view_count_id", "view_count", "id"),
+        Index("idx_model_rating_id", "rating", "id"),
+        Index("idx_model_created_at_id", "created_at", "id"),
+    )
+
+
+# SQLite keyword search: external-content FTS5 table over search_document,
+# kept in sync by triggers. PostgreSQL uses a GIN index instead (migration 004).
+_SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE ai_models_fts USING fts5("
+    "search_document, content='ai_models', content_rowid='rowid')",
+    "CREATE TRIGGER ai_models_fts_ai AFTER INSERT ON ai_models BEGIN "
+    "INSERT INTO ai_models_fts(rowid, search_document) "
+    "VALUES (new.rowid, new.search_document); END",
+    "CREATE TRIGGER ai_models_fts_ad AFTER DELETE ON ai_models BEGIN "
+    "INSERT INTO ai_models_fts(ai_models_fts, rowid, search_document) "
+    "VALUES ('delete', old.rowid, old.search_document); END",
+    "CREATE TRIGGER ai_models_fts_au AFTER UPDATE OF search_document ON ai_models BEGIN "
+    "INSERT INTO ai_models_fts(ai_models_fts, rowid, search_document) "
+    "VALUES ('delete', old.rowid, old.search_document); "
+    "INSERT INTO ai_models_fts(rowid, search_document) "
+    "VALUES (new.rowid, new.search_document); END",
+)
+
+for _statement in _SQLITE_FTS_DDL:
+    event.listen(
+        AIModel.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    AIModel.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS ai_models_fts").execute_if(dialect="sqlite"),
+)
 
 
 class ModelImage(Base):
@@ -100,6 +146,28 @@ class ModelTag(Base):
     model = relationship("AIModel", back_populates="tags")
 
 
+class ModelEmbedding(Base):
+    """Model Embedding table - semantic vector of a model's name, description and tags.
+
+    Stored as a pgvector ``vector`` (HNSW cosine index, see migration 002) on
+    PostgreSQL and as a JSON array on SQLite.
+    """
+    __tablename__ = "model_embeddings"
+
+    model_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("ai_models.id", ondelete="CASCADE"), primary_key=True
+    )
+    embedding: Mapped[list[float]] = mapped_column(
+        Vector(EMBEDDING_DIM).with_variant(JSON(), "sqlite"), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    # Relationships
+    model = relationship("AIModel", back_populates="embedding")
+
+
 class Favorite(Base):
     """Favorite table - brands can favorite AI models."""
     __tablename__ = "favorites"
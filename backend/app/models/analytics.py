@@ -0,0 +1,56 @@
+"""Daily analytics rollups for the creator and brand dashboards.
+
+@TASK P4-R4-T1 - Dashboard analytics (daily rollups)
+@SPEC docs/planning/04-database-design.md#analytics-rollups
+"""
+from datetime import date
+from sqlalchemy import String, Integer, Date, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class ModelDailyStats(Base):
+    """Model Daily Stats table - per-model, per-day order, revenue and view figures.
+
+    ``creator_id`` is copied from the model so a creator's series is a range
+    read on (creator_id, day). Maintained by app/services/analytics.py.
+    """
+    __tablename__ = "model_daily_stats"
+
+    model_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("ai_models.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    creator_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    orders_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    orders_accepted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    orders_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    orders_cancelled: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    gmv: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # completed orders
+    settlement_amount: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    views: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_model_daily_stats_creator_day", "creator_id", "day"),
+        Index("idx_model_daily_stats_day", "day"),  # refresh window
+    )
+
+
+class BrandDailyStats(Base):
+    """Brand Daily Stats table - per-brand, per-day order and spend figures."""
+    __tablename__ = "brand_daily_stats"
+
+    brand_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    orders_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    orders_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    orders_cancelled: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    spend: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # completed orders
+
+    __table_args__ = (
+        Index("idx_brand_daily_stats_day", "day"),  # refresh window, latest day
+    )
@@ -11,7 +11,12 @@ import uuid
 
 
 class AuthToken(Base):
-    """Auth Token table - stores refresh tokens for user sessions."""
+    """Auth Token table - stores refresh tokens for user sessions.
+
+    Only the SHA-256 of the token is kept (``token_hash``, unique index), so
+    refresh lookups are a short fixed-width index probe and a leaked table
+    holds no usable tokens.
+    """
     __tablename__ = "auth_tokens"
 
     id: Mapped[str] = mapped_column(
@@ -20,9 +25,7 @@ class AuthToken(Base):
     user_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    refresh_token: Mapped[str] = mapped_column(
-        String(255), unique=True, nullable=False, index=True
-    )
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
@@ -32,5 +35,7 @@ class AuthToken(Base):
     user = relationship("User", back_populates="auth_tokens")
 
     __table_args__ = (
+        Index("idx_auth_token_hash", "token_hash", unique=True),
         Index("idx_auth_token_user_id", "user_id"),
+        Index("idx_auth_token_expires_at", "expires_at"),
     )
@@ -3,9 +3,9 @@
 @TASK P0-T0.2 - DB 스키마 및 마이그레이션
 @SPEC docs/planning/04-database-design.md#order-섭외-주문---feat-2
 """
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Index, Text
+from sqlalchemy import String, Integer, Boolean, Date, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 import uuid
@@ -71,14 +71,29 @@ class Order(Base):
     settlement = relationship("Settlement", back_populates="order", uselist=False, cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index("idx_order_brand_id", "brand_id"),
-        Index("idx_order_creator_id", "creator_id"),
+        # Role-filtered listing: WHERE party = ? [AND status = ?]
+        # ORDER BY created_at DESC, id DESC
+        Index("idx_order_brand_status_created_id", "brand_id", "status", "created_at", "id"),
+        Index("idx_order_creator_status_created_id", "creator_id", "status", "created_at", "id"),
         Index("idx_order_model_id", "model_id"),
         Index("idx_order_status", "status"),
         Index("idx_order_created_at", "created_at"),
+        Index("idx_order_updated_at", "updated_at"),  # analytics rollup window
     )
 
 
+class OrderNumberSequence(Base):
+    """Order Number Sequence table - last ORD-YYYYMMDD-NNN sequence handed out per day.
+
+    Workers reserve blocks by incrementing ``last_value`` (see
+    app/services/order_number.py).
+    """
+    __tablename__ = "order_number_sequences"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    last_value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
 class Payment(Base):
     """Payment table - payment information for orders."""
     __tablename__ = "payments"
@@ -0,0 +1,46 @@
+"""Transactional outbox for side effects of order state changes.
+
+@TASK P3-R2-T1 - Orders business logic (outbox)
+@SPEC docs/planning/04-database-design.md#outbox
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import JSON, String, Integer, DateTime, Index, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+import uuid
+
+
+class OutboxEvent(Base):
+    """Outbox table - events written with a state change, drained by the worker.
+
+    See app/services/outbox.py.
+    """
+    __tablename__ = "outbox_events"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    aggregate_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    idempotency_key: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="pending",
+        nullable=False
+        # pending, done, failed
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_outbox_status_available_at", "status", "available_at"),
+    )
@@ -46,4 +46,5 @@ class Settlement(Base):
     __table_args__ = (
         Index("idx_settlement_creator_id", "creator_id"),
         Index("idx_settlement_order_id", "order_id"),
+        Index("idx_settlement_created_at", "created_at"),  # analytics rollup window
     )
@@ -0,0 +1,28 @@
+"""Materialized platform statistics.
+
+@TASK P2-R3-T1 - Platform Stats API (materialized counters)
+@SPEC docs/planning/02-trd.md#platform-stats-api
+"""
+from datetime import datetime
+from sqlalchemy import Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+PLATFORM_STATS_ID = 1
+
+
+class PlatformStats(Base):
+    """Platform Stats table - a single row of counters behind GET /api/stats.
+
+    Bumped in the transactions that change the counted rows and recomputed
+    periodically (see app/services/stats.py).
+    """
+    __tablename__ = "platform_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=PLATFORM_STATS_ID)
+    total_models: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_bookings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_brands: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
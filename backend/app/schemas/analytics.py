@@ -0,0 +1,66 @@
+# @TASK P4-R4-T1 - Dashboard analytics schemas
+# @SPEC docs/planning/04-database-design.md#analytics-rollups
+"""Analytics schemas for the dashboard charts.
+
+Schemas:
+    ModelAnalyticsResponse - Daily series of a creator or one of their models
+    BrandAnalyticsResponse - Daily series of a brand's orders
+"""
+from datetime import date
+
+from pydantic import BaseModel
+
+
+# ---------------------------------------------------------------------------
+# Creator / model figures
+# ---------------------------------------------------------------------------
+
+
+class ModelAnalyticsTotals(BaseModel):
+    """Order, revenue and view figures (summed over the range for totals)."""
+    orders_created: int = 0
+    orders_accepted: int = 0
+    orders_completed: int = 0
+    orders_cancelled: int = 0
+    gmv: int = 0  # total_price of completed orders
+    settlement_amount: int = 0
+    views: int = 0
+
+
+class ModelAnalyticsDay(ModelAnalyticsTotals):
+    """Figures of a single UTC day."""
+    day: date
+
+
+class ModelAnalyticsResponse(BaseModel):
+    """Daily series (one entry per day, zero-filled) with range totals."""
+    start: date
+    end: date
+    items: list[ModelAnalyticsDay] = []
+    totals: ModelAnalyticsTotals
+
+
+# ---------------------------------------------------------------------------
+# Brand figures
+# ---------------------------------------------------------------------------
+
+
+class BrandAnalyticsTotals(BaseModel):
+    """Order and spend figures (summed over the range for totals)."""
+    orders_created: int = 0
+    orders_completed: int = 0
+    orders_cancelled: int = 0
+    spend: int = 0  # total_price of completed orders
+
+
+class BrandAnalyticsDay(BrandAnalyticsTotals):
+    """Figures of a single UTC day."""
+    day: date
+
+
+class BrandAnalyticsResponse(BaseModel):
+    """Daily series (one entry per day, zero-filled) with range totals."""
+    start: date
+    end: date
+    items: list[BrandAnalyticsDay] = []
+    totals: BrandAnalyticsTotals
@@ -3,7 +3,7 @@
 """Authentication schemas with role, refresh token, and validation."""
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator, model_validator
 
 from app.schemas.user import UserResponse
 
@@ -23,6 +23,22 @@ class TokenResponse(Token):
 class TokenPayload(BaseModel):
     sub: Optional[str] = None
     type: Optional[str] = None  # "access" or "refresh"
+    role: Optional[str] = None  # embedded claims (ACCESS_TOKEN_EMBED_CLAIMS)
+    nickname: Optional[str] = None
+
+
+class UserPrincipal(BaseModel):
+    """The authenticated user as seen by request handlers.
+
+    Holds only the fields handlers use, so it can be cached or rebuilt from
+    token claims without loading the ``users`` row.
+    """
+    id: str
+    role: str
+    nickname: str
+    is_active: bool = True
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LoginRequest(BaseModel):
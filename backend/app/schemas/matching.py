@@ -7,6 +7,8 @@ Schemas:
     MatchedModelSummary   - Summary of a matched AI model
     MatchingRecommendation - Single recommendation (model + score)
     MatchingResponse      - List of recommendations
+    BatchMatchingRequest  - Request body with many concept descriptions
+    BatchMatchingResponse - One MatchingResponse per concept
 """
 from typing import Optional
 
@@ -34,6 +36,26 @@ class MatchingRequest(BaseModel):
         return v.strip()
 
 
+MAX_BATCH_CONCEPTS = 50
+
+
+class BatchMatchingRequest(BaseModel):
+    """Request body for matching many concepts in one call."""
+
+    concepts: list[MatchingRequest]
+
+    @field_validator("concepts")
+    @classmethod
+    def validate_concepts(cls, v: list[MatchingRequest]) -> list[MatchingRequest]:
+        if not v:
+            raise ValueError("concepts must not be empty")
+        if len(v) > MAX_BATCH_CONCEPTS:
+            raise ValueError(
+                f"concepts must contain {MAX_BATCH_CONCEPTS} items or fewer"
+            )
+        return v
+
+
 # ---------------------------------------------------------------------------
 # Response components
 # ---------------------------------------------------------------------------
@@ -68,3 +90,9 @@ class MatchingResponse(BaseModel):
     """Response containing a list of model recommendations."""
 
     recommendations: list[MatchingRecommendation] = []
+
+
+class BatchMatchingResponse(BaseModel):
+    """Response for a batch request: results in the same order as concepts."""
+
+    results: list[MatchingResponse] = []
@@ -24,7 +24,7 @@ VALID_STYLES = {"casual", "formal", "sporty", "vintage"}
 VALID_GENDERS = {"male", "female", "neutral"}
 VALID_AGE_RANGES = {"10s", "20s", "30s", "40s+"}
 VALID_STATUSES = {"draft", "active", "inactive"}
-VALID_SORT_OPTIONS = {"popular", "recent", "rating"}
+VALID_SORT_OPTIONS = {"popular", "recent", "rating", "relevance"}
 
 
 # ---------------------------------------------------------------------------
@@ -179,8 +179,13 @@ class AIModelListItem(BaseModel):
 
 
 class AIModelListResponse(BaseModel):
-    """Paginated list response for models."""
+    """Paginated list response for models.
+
+    ``total`` is None when the client passed ``include_total=false``.
+    ``next_cursor`` is None on the last page.
+    """
     items: list[AIModelListItem] = []
-    total: int = 0
+    total: Optional[int] = 0
     page: int = 1
     limit: int = 12
+    next_cursor: Optional[str] = None
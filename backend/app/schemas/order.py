@@ -156,8 +156,13 @@ class OrderListItem(BaseModel):
 
 
 class OrderListResponse(BaseModel):
-    """Paginated list response for orders."""
+    """Paginated list response for orders.
+
+    ``total`` is None when the client passed ``include_total=false``.
+    ``next_cursor`` is None on the last page.
+    """
     items: list[OrderListItem] = []
-    total: int = 0
+    total: Optional[int] = 0
     page: int = 1
     limit: int = 20
+    next_cursor: Optional[str] = None
@@ -0,0 +1,312 @@
+# @TASK P4-R4-T1 - Dashboard analytics (daily rollups)
+# @SPEC docs/planning/04-database-design.md#analytics-rollups
+"""Daily rollups behind the creator and brand dashboard charts.
+
+Range queries read only ``model_daily_stats`` and ``brand_daily_stats``
+(one row per model/brand and UTC day); they never touch orders or
+settlements. The rollups are maintained as follows:
+
+    orders, settlements - ``refresh_daily_rollups`` re-aggregates the days
+        since the last refresh (at least ``ANALYTICS_ROLLUP_LOOKBACK_DAYS``).
+        Every order event (creation, acceptance, completion, cancellation)
+        bumps ``orders.updated_at``, so the window is one indexed range scan
+        of orders plus one of settlements. The refresh is idempotent and
+        runs at startup (backfilling empty tables) and every
+        ``ANALYTICS_ROLLUP_INTERVAL_SECONDS``.
+    views - ``record_daily_views`` adds each view-counter flush to today's
+        rows; the refresh never overwrites them.
+
+Events are bucketed by their own timestamp: created_at, accepted_at,
+completed_at (completed orders), updated_at (cancelled orders) and the
+settlement's created_at.
+
+@TEST tests/api/test_analytics.py
+"""
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import dialect_insert
+from app.models.ai_model import AIModel
+from app.models.analytics import BrandDailyStats, ModelDailyStats
+from app.models.order import Order
+from app.models.settlement import Settlement
+
+logger = logging.getLogger(__name__)
+
+# Columns recomputed by the refresh (``views`` is only ever incremented)
+MODEL_ORDER_METRICS = (
+    "orders_created",
+    "orders_accepted",
+    "orders_completed",
+    "orders_cancelled",
+    "gmv",
+    "settlement_amount",
+)
+MODEL_METRICS = MODEL_ORDER_METRICS + ("views",)
+BRAND_METRICS = ("orders_created", "orders_completed", "orders_cancelled", "spend")
+
+
+def _utc_today() -> date:
+    return datetime.utcnow().date()
+
+
+# ---------------------------------------------------------------------------
+# Refresh (orders, settlements)
+# ---------------------------------------------------------------------------
+
+
+async def _refresh_start(db: AsyncSession) -> date:
+    """First day to re-aggregate.
+
+    ``brand_daily_stats`` is written only by the refresh, so its latest day
+    is a lower bound of the last refresh. With empty rollups the refresh
+    starts at the first order.
+    """
+    latest = (await db.execute(select(func.max(BrandDailyStats.day)))).scalar()
+    if latest is None:
+        first = (await db.execute(select(func.min(Order.created_at)))).scalar()
+        latest = first.date() if first is not None else _utc_today()
+    lookback = _utc_today() - timedelta(days=settings.ANALYTICS_ROLLUP_LOOKBACK_DAYS)
+    return min(latest, lookback)
+
+
+async def refresh_daily_rollups(
+    db: AsyncSession,
+    since: Optional[date] = None,
+) -> date:
+    """Re-aggregate order and settlement figures for every day from ``since``.
+
+    Args:
+        db: Async database session (primary).
+        since: First day to rebuild. Defaults to the day after which
+            nothing can have changed since the previous refresh.
+
+    Returns:
+        The first day rebuilt.
+    """
+    if since is None:
+        since = await _refresh_start(db)
+    start = datetime.combine(since, time.min)
+
+    model_rows: dict[tuple[str, date], dict[str, int]] = defaultdict(
+        lambda: dict.fromkeys(MODEL_ORDER_METRICS, 0)
+    )
+    creators: dict[str, str] = {}
+    brand_rows: dict[tuple[str, date], dict[str, int]] = defaultdict(
+        lambda: dict.fromkeys(BRAND_METRICS, 0)
+    )
+
+    def bump(order, at: datetime, metric: str, n: int = 1, brand_metric: Optional[str] = None):
+        model_rows[order.model_id, at.date()][metric] += n
+        if brand_metric:
+            brand_rows[order.brand_id, at.date()][brand_metric] += n
+
+    orders = await db.execute(
+        select(
+            Order.model_id,
+            Order.creator_id,
+            Order.brand_id,
+            Order.status,
+            Order.total_price,
+            Order.created_at,
+            Order.accepted_at,
+            Order.completed_at,
+            Order.updated_at,
+        ).where(Order.updated_at >= start)
+    )
+    for order in orders:
+        creators[order.model_id] = order.creator_id
+        if order.created_at >= start:
+            bump(order, order.created_at, "orders_created", brand_metric="orders_created")
+        if order.accepted_at is not None and order.accepted_at >= start:
+            bump(order, order.accepted_at, "orders_accepted")
+        if order.status == "completed":
+            completed_at = order.completed_at or order.updated_at
+            if completed_at >= start:
+                bump(order, completed_at, "orders_completed", brand_metric="orders_completed")
+                bump(order, completed_at, "gmv", order.total_price, brand_metric="spend")
+        elif order.status == "cancelled" and order.updated_at >= start:
+            bump(order, order.updated_at, "orders_cancelled", brand_metric="orders_cancelled")
+
+    settlements = await db.execute(
+        select(
+            Order.model_id,
+            Order.creator_id,
+            Settlement.settlement_amount,
+            Settlement.created_at,
+        )
+        .join(Order, Order.id == Settlement.order_id)
+        .where(Settlement.created_at >= start)
+    )
+    for row in settlements:
+        creators[row.model_id] = row.creator_id
+        model_rows[row.model_id, row.created_at.date()]["settlement_amount"] += (
+            row.settlement_amount
+        )
+
+    # Days in the window are rebuilt from scratch; views are left alone
+    await db.execute(
+        update(ModelDailyStats)
+        .where(ModelDailyStats.day >= since)
+        .values(dict.fromkeys(MODEL_ORDER_METRICS, 0))
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        update(BrandDailyStats)
+        .where(BrandDailyStats.day >= since)
+        .values(dict.fromkeys(BRAND_METRICS, 0))
+        .execution_options(synchronize_session=False)
+    )
+
+    if model_rows:
+        stmt = dialect_insert(db.bind.dialect.name, ModelDailyStats)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["model_id", "day"],
+                set_={name: stmt.excluded[name] for name in MODEL_ORDER_METRICS},
+            ),
+            [
+                {"model_id": model_id, "day": day, "creator_id": creators[model_id], **metrics}
+                for (model_id, day), metrics in sorted(model_rows.items())
+            ],
+        )
+    if brand_rows:
+        stmt = dialect_insert(db.bind.dialect.name, BrandDailyStats)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["brand_id", "day"],
+                set_={name: stmt.excluded[name] for name in BRAND_METRICS},
+            ),
+            [
+                {"brand_id": brand_id, "day": day, **metrics}
+                for (brand_id, day), metrics in sorted(brand_rows.items())
+            ],
+        )
+    await db.commit()
+    return since
+
+
+# ---------------------------------------------------------------------------
+# Views
+# ---------------------------------------------------------------------------
+
+
+async def record_daily_views(
+    db: AsyncSession,
+    counts: dict[str, int],
+    day: Optional[date] = None,
+) -> None:
+    """Add flushed view counts (model id -> views) to the day's rollup rows."""
+    counts = {model_id: n for model_id, n in counts.items() if n > 0}
+    if not counts:
+        return
+    day = day or _utc_today()
+    creators = dict(
+        (
+            await db.execute(
+                select(AIModel.id, AIModel.creator_id).where(AIModel.id.in_(counts))
+            )
+        ).all()
+    )
+    params = [
+        {"model_id": model_id, "day": day, "creator_id": creators[model_id], "views": n}
+        for model_id, n in sorted(counts.items())
+        if model_id in creators
+    ]
+    if not params:
+        return
+    stmt = dialect_insert(db.bind.dialect.name, ModelDailyStats)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["model_id", "day"],
+            set_={"views": ModelDailyStats.views + stmt.excluded.views},
+        ),
+        params,
+    )
+    await db.commit()
+
+
+# ---------------------------------------------------------------------------
+# Range queries
+# ---------------------------------------------------------------------------
+
+
+def _dense(rows, start: date, end: date, metrics: tuple[str, ...]) -> list[dict]:
+    """One entry per day from start to end, zero-filled."""
+    by_day = {row.day: row for row in rows}
+    series = []
+    day = start
+    while day <= end:
+        row = by_day.get(day)
+        series.append(
+            {"day": day, **{name: int(getattr(row, name) or 0) if row else 0 for name in metrics}}
+        )
+        day += timedelta(days=1)
+    return series
+
+
+async def get_creator_series(
+    db: AsyncSession,
+    creator_id: str,
+    start: date,
+    end: date,
+) -> list[dict]:
+    """Daily figures summed over the creator's models."""
+    stmt = (
+        select(
+            ModelDailyStats.day,
+            *(func.sum(getattr(ModelDailyStats, name)).label(name) for name in MODEL_METRICS),
+        )
+        .where(
+            ModelDailyStats.creator_id == creator_id,
+            ModelDailyStats.day.between(start, end),
+        )
+        .group_by(ModelDailyStats.day)
+    )
+    return _dense((await db.execute(stmt)).all(), start, end, MODEL_METRICS)
+
+
+async def get_model_series(
+    db: AsyncSession,
+    model_id: str,
+    start: date,
+    end: date,
+) -> list[dict]:
+    """Daily figures of one model."""
+    stmt = select(
+        ModelDailyStats.day,
+        *(getattr(ModelDailyStats, name) for name in MODEL_METRICS),
+    ).where(
+        ModelDailyStats.model_id == model_id,
+        ModelDailyStats.day.between(start, end),
+    )
+    return _dense((await db.execute(stmt)).all(), start, end, MODEL_METRICS)
+
+
+async def get_brand_series(
+    db: AsyncSession,
+    brand_id: str,
+    start: date,
+    end: date,
+) -> list[dict]:
+    """Daily figures of one brand's orders."""
+    stmt = select(
+        BrandDailyStats.day,
+        *(getattr(BrandDailyStats, name) for name in BRAND_METRICS),
+    ).where(
+        BrandDailyStats.brand_id == brand_id,
+        BrandDailyStats.day.between(start, end),
+    )
+    return _dense((await db.execute(stmt)).all(), start, end, BRAND_METRICS)
+
+
+async def get_model_creator_id(db: AsyncSession, model_id: str) -> Optional[str]:
+    """Owner of a model (None if the model does not exist)."""
+    stmt = select(AIModel.creator_id).where(AIModel.id == model_id)
+    return (await db.execute(stmt)).scalar_one_or_none()
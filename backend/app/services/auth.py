@@ -1,6 +1,7 @@
 # @TASK P1-R1-T1 - Authentication service (extended with refresh tokens)
 # @SPEC docs/planning/02-trd.md#auth-api
 """Authentication service: user CRUD, token creation and refresh."""
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
@@ -9,17 +10,20 @@ from jose import JWTError
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import create_cache
 from app.core.config import settings
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
 )
 from app.models.auth import AuthToken
 from app.models.user import User
-from app.schemas.auth import RegisterRequest
+from app.schemas.auth import RegisterRequest, UserPrincipal
+from app.services.stats import bump_platform_stats
 
 logger = logging.getLogger(__name__)
 
@@ -44,15 +48,92 @@ async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[User]:
 async def authenticate_user(
     db: AsyncSession, email: str, password: str
 ) -> Optional[User]:
-    """Authenticate user with email and password."""
+    """Authenticate user with email and password.
+
+    A hash made with an outdated cost (``BCRYPT_ROUNDS`` changed) is replaced
+    while the plain password is at hand.
+    """
     user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await get_password_hash_async(password)
+        await db.commit()
     return user
 
 
+# ---------------------------------------------------------------------------
+# Principal cache
+# ---------------------------------------------------------------------------
+
+# UserPrincipal JSON keyed by user ID, read by get_current_user. Entries are
+# dropped when the user's profile, password or active flag is written.
+principal_cache = create_cache(
+    "user_principal",
+    maxsize=settings.USER_PRINCIPAL_CACHE_SIZE,
+    ttl=settings.USER_PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+# Users deactivated while access tokens with embedded claims may still be
+# valid; kept for the lifetime of an access token. Only a shared (Redis)
+# cache reaches every worker, see embedded_claims_enabled().
+deactivated_users = create_cache(
+    "deactivated_users",
+    maxsize=settings.USER_PRINCIPAL_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+async def get_user_principal(db: AsyncSession, user_id: str) -> Optional[UserPrincipal]:
+    """Read-through lookup of a user's principal (inactive users included)."""
+    raw = await principal_cache.get(user_id)
+    if raw is not None:
+        return UserPrincipal.model_validate_json(raw)
+
+    user = await get_user_by_id(db, user_id)
+    if user is None:
+        return None
+    principal = UserPrincipal.model_validate(user)
+    await principal_cache.set(user_id, principal.model_dump_json())
+    return principal
+
+
+async def invalidate_user_principal(user_id: str) -> None:
+    """Drop the cached principal of a user after writing to the user."""
+    await principal_cache.delete(user_id)
+
+
+async def mark_user_deactivated(user_id: str) -> None:
+    """Reject the user's outstanding tokens, including ones with embedded claims."""
+    await principal_cache.delete(user_id)
+    await deactivated_users.set(user_id, "1")
+
+
+async def is_user_deactivated(user_id: str) -> bool:
+    return await deactivated_users.get(user_id) is not None
+
+
+def embedded_claims_enabled() -> bool:
+    """Whether access tokens carry (and are trusted for) role and nickname.
+
+    Requires ``CACHE_BACKEND=redis``: with per-process caches a deactivation
+    would only reach the worker that handled it, and other workers would keep
+    accepting the user's tokens until they expire. Otherwise
+    ``ACCESS_TOKEN_EMBED_CLAIMS`` is ignored and every request checks
+    ``is_active`` through the principal cache.
+    """
+    return settings.ACCESS_TOKEN_EMBED_CLAIMS and settings.CACHE_BACKEND == "redis"
+
+
+def access_token_claims(user: User) -> Optional[dict]:
+    """Claims embedded in access tokens, see ``embedded_claims_enabled``."""
+    if not embedded_claims_enabled() or not user.is_active:
+        return None
+    return {"role": user.role, "nickname": user.nickname}
+
+
 # ---------------------------------------------------------------------------
 # User creation
 # ---------------------------------------------------------------------------
@@ -62,12 +143,14 @@ async def create_user(db: AsyncSession, user_in: RegisterRequest) -> User:
     """Create new user with role and optional company_name."""
     user = User(
         email=user_in.email,
-        password_hash=get_password_hash(user_in.password),
+        password_hash=await get_password_hash_async(user_in.password),
         nickname=user_in.nickname,
         role=user_in.role,
         company_name=user_in.company_name,
     )
     db.add(user)
+    if user.role == "brand":
+        await bump_platform_stats(db, brands=1)
     await db.commit()
     await db.refresh(user)
     return user
@@ -78,15 +161,23 @@ async def create_user(db: AsyncSession, user_in: RegisterRequest) -> User:
 # ---------------------------------------------------------------------------
 
 
+def hash_refresh_token(refresh_token: str) -> str:
+    """Identifier stored for a refresh token (``auth_tokens.token_hash``)."""
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+
 async def create_tokens(
     db: AsyncSession, user: User
 ) -> Tuple[str, str]:
     """Create access + refresh token pair. Persist refresh token in DB.
 
+    Only the newest ``REFRESH_TOKENS_PER_USER`` refresh tokens of the user are
+    kept; older sessions are signed out.
+
     Returns:
         (access_token, refresh_token)
     """
-    access_token = create_access_token(subject=user.id)
+    access_token = create_access_token(subject=user.id, claims=access_token_claims(user))
     refresh_token = create_refresh_token(subject=user.id)
 
     # Store refresh token in the database
@@ -95,10 +186,23 @@ async def create_tokens(
     )
     auth_token = AuthToken(
         user_id=user.id,
-        refresh_token=refresh_token,
+        token_hash=hash_refresh_token(refresh_token),
         expires_at=expires_at,
     )
     db.add(auth_token)
+    await db.flush()
+
+    newest = (
+        select(AuthToken.id)
+        .where(AuthToken.user_id == user.id)
+        .order_by(AuthToken.created_at.desc(), AuthToken.id.desc())
+        .limit(settings.REFRESH_TOKENS_PER_USER)
+    )
+    await db.execute(
+        delete(AuthToken)
+        .where(AuthToken.user_id == user.id, AuthToken.id.not_in(newest))
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
 
     return access_token, refresh_token
@@ -128,7 +232,7 @@ async def refresh_access_token(
     # Verify token exists in DB (not revoked)
     result = await db.execute(
         select(AuthToken).where(
-            AuthToken.refresh_token == refresh_token,
+            AuthToken.token_hash == hash_refresh_token(refresh_token),
             AuthToken.user_id == user_id,
         )
     )
@@ -144,7 +248,13 @@ async def refresh_access_token(
         return None
 
     # Issue new access token
-    new_access_token = create_access_token(subject=user_id)
+    claims = None
+    if embedded_claims_enabled():
+        user = await get_user_by_id(db, user_id)
+        if user is None or not user.is_active:
+            return None
+        claims = access_token_claims(user)
+    new_access_token = create_access_token(subject=user_id, claims=claims)
     return new_access_token, refresh_token
 
 
@@ -156,6 +266,40 @@ async def revoke_refresh_tokens(db: AsyncSession, user_id: str) -> None:
     await db.commit()
 
 
+async def sweep_expired_refresh_tokens(
+    db: AsyncSession, batch_size: Optional[int] = None
+) -> int:
+    """Delete expired refresh tokens in batches, committing after each one.
+
+    Small batches keep each transaction (and its row locks) short while the
+    expires_at index finds the rows.
+
+    Returns:
+        Number of deleted tokens.
+    """
+    batch_size = batch_size or settings.AUTH_TOKEN_SWEEP_BATCH_SIZE
+    now = datetime.utcnow()
+    deleted = 0
+    while True:
+        batch = (
+            select(AuthToken.id)
+            .where(AuthToken.expires_at < now)
+            .limit(batch_size)
+        )
+        result = await db.execute(
+            delete(AuthToken)
+            .where(AuthToken.id.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            break
+    if deleted:
+        logger.info("Swept %d expired refresh tokens", deleted)
+    return deleted
+
+
 # ---------------------------------------------------------------------------
 # Password update
 # ---------------------------------------------------------------------------
@@ -165,7 +309,8 @@ async def update_password(
     db: AsyncSession, user: User, new_password: str
 ) -> User:
     """Update user password."""
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = await get_password_hash_async(new_password)
     await db.commit()
+    await invalidate_user_principal(user.id)
     await db.refresh(user)
     return user
@@ -6,6 +6,11 @@ Permissions:
     - Only the brand and creator of an order can send/view messages.
     - mark_as_read marks the OTHER party's messages as read.
 
+Delivery: ``send_message`` publishes every new message (as its
+``MessageResponse`` JSON) on the order's channel (``order_channel``), which
+the WebSocket endpoint streams to connected parties (see
+``app/core/pubsub.py``), so clients do not poll ``list_messages``.
+
 @TEST tests/api/test_chat.py
 """
 import logging
@@ -15,10 +20,11 @@ from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pubsub import get_broker
 from app.models.chat import ChatMessage
 from app.models.order import Order
 from app.models.user import User
-from app.schemas.chat import MessageCreate
+from app.schemas.chat import MessageCreate, MessageResponse
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +60,23 @@ async def _get_order_with_permission(
     return order
 
 
+def order_channel(order_id: str) -> str:
+    """Pub/sub channel carrying an order's new messages."""
+    return f"chat:order:{order_id}"
+
+
+async def check_order_access(db: AsyncSession, order_id: str, user: User) -> None:
+    """Verify the user may read the order's messages (WebSocket subscribe).
+
+    Raises:
+        PermissionError: If user is not a party to the order.
+        ValueError: If the order does not exist.
+    """
+    order = await _get_order_with_permission(db, order_id, user)
+    if order is None:
+        raise ValueError("Order not found")
+
+
 # ---------------------------------------------------------------------------
 # List messages
 # ---------------------------------------------------------------------------
@@ -156,7 +179,12 @@ async def send_message(
         .options(selectinload(ChatMessage.sender))
     )
     result = await db.execute(stmt)
-    return result.scalar_one()
+    msg = result.scalar_one()
+
+    await get_broker().publish(
+        order_channel(order_id), MessageResponse.model_validate(msg).model_dump_json()
+    )
+    return msg
 
 
 # ---------------------------------------------------------------------------
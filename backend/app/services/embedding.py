@@ -0,0 +1,147 @@
+# @TASK P3-R1-T1 - Local text embeddings + flat vector index for semantic matching
+# @SPEC docs/planning/02-trd.md#ai-matching-api
+"""Deterministic local text encoder and an in-process vector index.
+
+Encoder:
+    Hashed sparse features projected into ``EMBEDDING_DIM`` buckets with a
+    signed hash (the "hashing trick"): lowercase word unigrams plus character
+    3-grams of every word, so Korean text and partial words still overlap.
+    Term frequencies are sublinear (``1 + log tf``) and the vector is L2
+    normalised, so a dot product is cosine similarity. No model download and
+    no network access: the same text always maps to the same vector, which
+    lets vectors be computed offline and stored (``model_embeddings``).
+
+Index:
+    ``VectorIndex`` is the flat NumPy fallback used when the database cannot
+    run the pgvector ANN query (SQLite). It keeps one row per model and
+    answers top-k with a single matrix-vector product plus ``argpartition``.
+
+@TEST tests/api/test_matching.py
+"""
+import hashlib
+import math
+import re
+from collections import Counter
+from typing import Optional
+
+import numpy as np
+
+# Fixed: the model_embeddings column (migration 002) is a vector of this size.
+# Changing it takes a migration that alters the column plus
+# ``python -m app.db.embed_models``.
+EMBEDDING_DIM = 256
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_NGRAM = 3
+
+
+# ---------------------------------------------------------------------------
+# Encoder
+# ---------------------------------------------------------------------------
+
+
+def _features(text: str) -> Counter:
+    """Word unigrams plus boundary-marked character n-grams."""
+    features: Counter = Counter()
+    for word in _WORD_RE.findall(text.lower()):
+        features[f"w:{word}"] += 1
+        padded = f"<{word}>"
+        for i in range(max(len(padded) - _NGRAM + 1, 1)):
+            features[f"c:{padded[i:i + _NGRAM]}"] += 1
+    return features
+
+
+def _bucket(feature: str) -> tuple[int, float]:
+    """Stable (bucket, sign) for a feature, independent of PYTHONHASHSEED."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % EMBEDDING_DIM, (1.0 if (value >> 63) & 1 else -1.0)
+
+
+def encode_text(text: str) -> np.ndarray:
+    """Embed text into a unit-length ``float32`` vector (zeros for no tokens)."""
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for feature, count in _features(text).items():
+        bucket, sign = _bucket(feature)
+        vector[bucket] += sign * (1.0 + math.log(count))
+    norm = float(np.linalg.norm(vector))
+    if norm > 0.0:
+        vector /= norm
+    return vector
+
+
+# ---------------------------------------------------------------------------
+# Flat in-process index
+# ---------------------------------------------------------------------------
+
+
+class VectorIndex:
+    """Exact cosine top-k over unit vectors held in one NumPy matrix."""
+
+    def __init__(self, dim: int = EMBEDDING_DIM) -> None:
+        self._dim = dim
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self.is_built = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def clear(self) -> None:
+        self._ids = []
+        self._rows = {}
+        self._matrix = np.zeros((0, self._dim), dtype=np.float32)
+        self.is_built = False
+
+    def load(self, items: list[tuple[str, np.ndarray]]) -> None:
+        """Replace the index contents with ``(model_id, vector)`` pairs."""
+        self._ids = [model_id for model_id, _ in items]
+        self._rows = {model_id: row for row, model_id in enumerate(self._ids)}
+        if items:
+            self._matrix = np.vstack([vector for _, vector in items]).astype(np.float32)
+        else:
+            self._matrix = np.zeros((0, self._dim), dtype=np.float32)
+        self.is_built = True
+
+    def upsert(self, model_id: str, vector: np.ndarray) -> None:
+        row = self._rows.get(model_id)
+        if row is not None:
+            self._matrix[row] = vector
+            return
+        self._rows[model_id] = len(self._ids)
+        self._ids.append(model_id)
+        self._matrix = np.vstack([self._matrix, vector[np.newaxis, :]])
+
+    def remove(self, model_id: str) -> None:
+        row = self._rows.pop(model_id, None)
+        if row is None:
+            return
+        # Move the last row into the hole to keep the matrix dense
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._matrix[row] = self._matrix[last]
+            self._rows[moved_id] = row
+        self._ids.pop()
+        self._matrix = self._matrix[:last]
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        min_score: Optional[float] = None,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``k`` ``(model_id, cosine)`` pairs, best first."""
+        if not self._ids or k <= 0:
+            return []
+        sims = self._matrix @ query
+        k = min(k, len(self._ids))
+        top = np.argpartition(-sims, k - 1)[:k] if k < len(self._ids) else np.arange(len(self._ids))
+        ranked = sorted(((float(sims[i]), self._ids[i]) for i in top), reverse=True)
+        return [
+            (model_id, sim)
+            for sim, model_id in ranked
+            if min_score is None or sim > min_score
+        ]
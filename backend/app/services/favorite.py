@@ -71,6 +71,9 @@ async def list_favorites(
 ) -> tuple[list[Favorite], int]:
     """Return paginated favorites for a user with eager-loaded model info.
 
+    The model is joined in the same query; its thumbnail comes from the
+    denormalized ``thumbnail_url`` column.
+
     Returns:
         (list_of_favorites, total_count)
     """
@@ -86,9 +89,7 @@ async def list_favorites(
     items_query = (
         select(Favorite)
         .where(Favorite.user_id == user_id)
-        .options(
-            joinedload(Favorite.model).subqueryload(AIModel.images),
-        )
+        .options(joinedload(Favorite.model))
         .order_by(Favorite.created_at.desc())
         .offset(offset)
         .limit(limit)
@@ -5,25 +5,60 @@
 MVP approach: extract style/gender/description keywords from concept_description,
 then score each active model based on keyword overlap.
 
-Future: Replace with Pinecone vector similarity search.
+Scoring is served from a process-local inverted index (``MatchingIndex``):
+tokens, tags and style/gender/age values map to the active model IDs that carry
+them, so a query only scores the models sharing at least one feature with the
+concept. The index is built once at startup (or lazily on first use), updated
+incrementally by ``create_model``/``update_model`` via ``notify_model_changed``,
+and rebuilt after ``MATCHING_INDEX_MAX_AGE_SECONDS`` to pick up writes made by
+other workers.
+
+Batch requests (many concepts at once) follow ``MATCHING_BACKEND`` too. With
+the index they are scored in a single sparse pass over the postings the
+concepts reach (never a dense concept x catalog matrix), see
+``MatchingIndex.top_k_batch``.
+
+Top-k selection (``_select_top_k``) keeps a bounded min-heap and visits models
+in descending order of a cheap upper-bound score, stopping as soon as no
+remaining model can beat the heap. ``MATCHING_BACKEND=scan`` skips the index
+and runs the same selection over column tuples read fresh from the database,
+for deployments that cannot tolerate index staleness.
+
+Results are cached (``matching_cache``) under the normalized concept tokens plus
+``max_results``/``min_score``. Every model write bumps the cache version, which
+invalidates all entries (across workers with the Redis backend).
+
+Semantic backend (``MATCHING_BACKEND=semantic``): models are embedded with the
+local hashed n-gram encoder in ``app.services.embedding`` and stored in
+``model_embeddings``. PostgreSQL answers top-k with the pgvector HNSW index;
+other databases (SQLite) use the in-process flat ``VectorIndex``.
 
 @TEST tests/api/test_matching.py
 """
+import asyncio
+import heapq
 import logging
 import re
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import Float, bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models.ai_model import AIModel
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.models.ai_model import AIModel, ModelEmbedding, ModelTag
 from app.schemas.matching import (
+    BatchMatchingRequest,
+    BatchMatchingResponse,
     MatchedModelSummary,
     MatchingRecommendation,
     MatchingRequest,
     MatchingResponse,
 )
+from app.services.embedding import VectorIndex, encode_text
 
 logger = logging.getLogger(__name__)
 
@@ -66,12 +101,15 @@ def _extract_words(text: str) -> set[str]:
     return set(re.findall(r"[a-z0-9]+", text.lower()))
 
 
-def _compute_score(
+def _score_features(
     concept_words: set[str],
-    model: AIModel,
-    model_tags: list[str],
+    style: str,
+    gender: str,
+    age_range: str,
+    tag_set: frozenset[str],
+    model_words: frozenset[str],
 ) -> float:
-    """Compute a match score (0.0 - 1.0) between concept keywords and a model.
+    """Score precomputed model features against concept keywords.
 
     Scoring components (max 1.0):
       - Style match:  0.35 (exact style keyword match)
@@ -83,115 +121,668 @@ def _compute_score(
     score = 0.0
 
     # 1. Style match (0.35)
-    style_kws = STYLE_KEYWORDS.get(model.style, set())
+    style_kws = STYLE_KEYWORDS.get(style, set())
     if concept_words & style_kws:
         score += 0.35
 
     # 2. Gender match (0.25)
-    gender_kws = GENDER_KEYWORDS.get(model.gender, set())
+    gender_kws = GENDER_KEYWORDS.get(gender, set())
     if concept_words & gender_kws:
         score += 0.25
 
     # 3. Age range match (0.15)
-    age_kws = AGE_KEYWORDS.get(model.age_range, set())
+    age_kws = AGE_KEYWORDS.get(age_range, set())
     if concept_words & age_kws:
         score += 0.15
 
     # 4. Tag overlap (0.15)
-    if model_tags:
-        tag_set = {t.lower() for t in model_tags}
+    if tag_set:
         overlap = len(concept_words & tag_set)
         tag_ratio = min(overlap / len(tag_set), 1.0)
         score += 0.15 * tag_ratio
 
     # 5. Description/name word overlap (0.10)
-    model_text_parts = []
-    if model.name:
-        model_text_parts.append(model.name)
-    if model.description:
-        model_text_parts.append(model.description)
-    if model_text_parts:
-        model_words = _extract_words(" ".join(model_text_parts))
-        if model_words:
-            overlap = len(concept_words & model_words)
-            desc_ratio = min(overlap / max(len(model_words), 1), 1.0)
-            score += 0.10 * desc_ratio
+    if model_words:
+        overlap = len(concept_words & model_words)
+        desc_ratio = min(overlap / max(len(model_words), 1), 1.0)
+        score += 0.10 * desc_ratio
 
     return round(min(score, 1.0), 4)
 
 
-def _extract_thumbnail_url(model: AIModel) -> Optional[str]:
-    """Extract thumbnail URL from model images."""
-    if not model.images:
-        return None
-    for img in model.images:
-        if img.is_thumbnail:
-            return img.image_url
-    return None
+def _model_words(name: Optional[str], description: Optional[str]) -> frozenset[str]:
+    """Tokenize a model's name + description for the description component."""
+    parts = [part for part in (name, description) if part]
+    if not parts:
+        return frozenset()
+    return frozenset(_extract_words(" ".join(parts)))
 
 
-def _extract_tags(model: AIModel) -> list[str]:
-    """Extract tag names from model tags."""
-    if not model.tags:
-        return []
-    return [tag.tag for tag in model.tags]
+def _compute_score(
+    concept_words: set[str],
+    model: AIModel,
+    model_tags: list[str],
+) -> float:
+    """Compute a match score (0.0 - 1.0) between concept keywords and a model.
+
+    See ``_score_features`` for the scoring components.
+    """
+    return _score_features(
+        concept_words,
+        model.style,
+        model.gender,
+        model.age_range,
+        frozenset(t.lower() for t in model_tags),
+        _model_words(model.name, model.description),
+    )
 
 
 # ---------------------------------------------------------------------------
-# Public API
+# In-memory inverted index
 # ---------------------------------------------------------------------------
 
 
-async def recommend_models(
-    db: AsyncSession,
-    request: MatchingRequest,
-    max_results: int = 5,
+@dataclass(frozen=True)
+class IndexedModel:
+    """Precomputed matching features of one active model."""
+
+    id: str
+    style: str
+    gender: str
+    age_range: str
+    tag_set: frozenset[str]
+    words: frozenset[str]
+
+
+async def _fetch_active_features(db: AsyncSession) -> list[IndexedModel]:
+    """Read matching features of every active model as plain column tuples.
+
+    Two lightweight queries (model columns, then ``(model_id, tag)`` pairs);
+    no ORM objects, images or relationship loads.
+    """
+    model_rows = await db.execute(
+        select(
+            AIModel.id,
+            AIModel.name,
+            AIModel.description,
+            AIModel.style,
+            AIModel.gender,
+            AIModel.age_range,
+        ).where(AIModel.status == "active")
+    )
+    tag_rows = await db.execute(
+        select(ModelTag.model_id, ModelTag.tag)
+        .join(AIModel, AIModel.id == ModelTag.model_id)
+        .where(AIModel.status == "active")
+    )
+    tags_by_model: dict[str, set[str]] = {}
+    for model_id, tag in tag_rows:
+        tags_by_model.setdefault(model_id, set()).add(tag.lower())
+
+    return [
+        IndexedModel(
+            id=model_id,
+            style=style,
+            gender=gender,
+            age_range=age_range,
+            tag_set=frozenset(tags_by_model.get(model_id, ())),
+            words=_model_words(name, description),
+        )
+        for model_id, name, description, style, gender, age_range in model_rows
+    ]
+
+
+def _select_top_k(
+    concept_words: set[str],
+    entries: Iterable[IndexedModel],
+    k: int,
     min_score: float = 0.0,
-) -> MatchingResponse:
-    """Recommend AI models based on concept description keywords.
+) -> list[tuple[str, float]]:
+    """Pick the ``k`` best-scoring entries with a bounded heap.
 
-    Args:
-        db: Async database session.
-        request: Matching request with concept_description.
-        max_results: Maximum number of recommendations (default 5).
-        min_score: Minimum score threshold (default 0.0 - include all).
+    Each entry's upper bound is its exact style/gender/age score plus the
+    full tag (0.15) and description (0.10) weights when it has any. Entries
+    are bucketed by that bound (at most 32 distinct values) and visited from
+    the highest bucket down; once a bucket's bound cannot beat the heap
+    minimum (or ``min_score``), every remaining entry is skipped without
+    computing its set intersections.
 
     Returns:
-        MatchingResponse with sorted recommendations.
+        ``(model_id, score)`` pairs, best first (ties broken by ID, descending).
+    """
+    if k <= 0:
+        return []
+
+    styles = {v for v, kws in STYLE_KEYWORDS.items() if concept_words & kws}
+    genders = {v for v, kws in GENDER_KEYWORDS.items() if concept_words & kws}
+    ages = {v for v, kws in AGE_KEYWORDS.items() if concept_words & kws}
+
+    buckets: dict[float, list[IndexedModel]] = {}
+    for entry in entries:
+        bound = (
+            (0.35 if entry.style in styles else 0.0)
+            + (0.25 if entry.gender in genders else 0.0)
+            + (0.15 if entry.age_range in ages else 0.0)
+            + (0.15 if entry.tag_set else 0.0)
+            + (0.10 if entry.words else 0.0)
+        )
+        buckets.setdefault(bound, []).append(entry)
+
+    heap: list[tuple[float, str]] = []
+    for bound in sorted(buckets, reverse=True):
+        threshold = heap[0][0] if len(heap) == k else min_score
+        # Small epsilon: the bound and the score sum the weights in a
+        # different order and the score is rounded to 4 decimals.
+        if bound + 1e-9 < threshold or bound <= min_score:
+            break
+        for entry in buckets[bound]:
+            model_score = _score_features(
+                concept_words,
+                entry.style,
+                entry.gender,
+                entry.age_range,
+                entry.tag_set,
+                entry.words,
+            )
+            if model_score <= min_score:
+                continue
+            item = (model_score, entry.id)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    return [(model_id, model_score) for model_score, model_id in sorted(heap, reverse=True)]
+
+
+class MatchingIndex:
+    """Process-local inverted index over active models.
+
+    Postings map each description word, lowercase tag, style, gender and
+    age_range value to the IDs of the active models carrying it. A query walks
+    only the postings reachable from the concept words and scores that
+    candidate set with ``_score_features``; models outside it would score 0.0
+    and are never returned anyway.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, IndexedModel] = {}
+        self._words: dict[str, set[str]] = {}
+        self._tags: dict[str, set[str]] = {}
+        self._styles: dict[str, set[str]] = {}
+        self._genders: dict[str, set[str]] = {}
+        self._ages: dict[str, set[str]] = {}
+        self._built_at: Optional[float] = None
+        self._build_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def is_stale(self) -> bool:
+        """True when the index was never built or is older than the max age."""
+        if self._built_at is None:
+            return True
+        max_age = settings.MATCHING_INDEX_MAX_AGE_SECONDS
+        return max_age > 0 and time.monotonic() - self._built_at > max_age
+
+    def get(self, model_id: str) -> Optional[IndexedModel]:
+        return self._entries.get(model_id)
+
+    def entries(self) -> Iterable[IndexedModel]:
+        return self._entries.values()
+
+    def clear(self) -> None:
+        """Drop every entry and mark the index as not built."""
+        self._entries.clear()
+        self._words.clear()
+        self._tags.clear()
+        self._styles.clear()
+        self._genders.clear()
+        self._ages.clear()
+        self._built_at = None
+
+    async def build(self, db: AsyncSession) -> None:
+        """(Re)build the index from the active models in the database.
+
+        Reads plain column tuples plus one tag query instead of ORM objects.
+        """
+        entries = await _fetch_active_features(db)
+        self.clear()
+        for entry in entries:
+            self._add(entry)
+        self._built_at = time.monotonic()
+        logger.info("Matching index built: %d active models", len(self))
+
+    async def ensure_built(self, db: AsyncSession) -> None:
+        """Build the index if it was never built or has expired.
+
+        Concurrent requests that find it stale wait for a single rebuild
+        instead of each reading the catalog.
+        """
+        if not self.is_stale:
+            return
+        async with self._build_lock:
+            if self.is_stale:
+                await self.build(db)
+
+    def upsert(self, model: AIModel, tags: list[str]) -> None:
+        """Insert, replace or drop a single model after it changed."""
+        self.remove(model.id)
+        if model.status != "active":
+            return
+        self._add(
+            IndexedModel(
+                id=model.id,
+                style=model.style,
+                gender=model.gender,
+                age_range=model.age_range,
+                tag_set=frozenset(t.lower() for t in tags),
+                words=_model_words(model.name, model.description),
+            )
+        )
+
+    def remove(self, model_id: str) -> None:
+        entry = self._entries.pop(model_id, None)
+        if entry is None:
+            return
+        for word in entry.words:
+            _discard_posting(self._words, word, model_id)
+        for tag in entry.tag_set:
+            _discard_posting(self._tags, tag, model_id)
+        _discard_posting(self._styles, entry.style, model_id)
+        _discard_posting(self._genders, entry.gender, model_id)
+        _discard_posting(self._ages, entry.age_range, model_id)
+
+    def candidates(self, concept_words: set[str]) -> set[str]:
+        """Collect IDs of models sharing at least one feature with the concept."""
+        found: set[str] = set()
+        for word in concept_words:
+            found |= self._words.get(word, set())
+            found |= self._tags.get(word, set())
+        for postings, keywords in (
+            (self._styles, STYLE_KEYWORDS),
+            (self._genders, GENDER_KEYWORDS),
+            (self._ages, AGE_KEYWORDS),
+        ):
+            for value, kws in keywords.items():
+                if concept_words & kws:
+                    found |= postings.get(value, set())
+        return found
+
+    def top_k(
+        self,
+        concept_words: set[str],
+        k: int,
+        min_score: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``k`` ``(model_id, score)`` pairs, best first."""
+        return _select_top_k(
+            concept_words,
+            (self._entries[mid] for mid in self.candidates(concept_words)),
+            k,
+            min_score,
+        )
+
+    def _feature_postings(
+        self,
+        concept_words: set[str],
+    ) -> list[tuple[tuple[str, str], set[str], Optional[float]]]:
+        """Features the concept activates: ``(key, model IDs, weight)``.
+
+        ``weight`` is None for tag/description terms, whose weight depends on
+        the model (``0.15 / len(tags)``, ``0.10 / len(words)``). The union of
+        the ID sets is ``candidates(concept_words)``.
+        """
+        features = []
+        for kind, postings, keywords, weight in (
+            ("style", self._styles, STYLE_KEYWORDS, 0.35),
+            ("gender", self._genders, GENDER_KEYWORDS, 0.25),
+            ("age", self._ages, AGE_KEYWORDS, 0.15),
+        ):
+            for value, kws in keywords.items():
+                if value in postings and concept_words & kws:
+                    features.append(((kind, value), postings[value], weight))
+        for word in concept_words:
+            if word in self._tags:
+                features.append((("tag", word), self._tags[word], None))
+            if word in self._words:
+                features.append((("word", word), self._words[word], None))
+        return features
+
+    def top_k_batch(
+        self,
+        concepts: list[set[str]],
+        k: int,
+        min_score: float = 0.0,
+    ) -> list[list[tuple[str, float]]]:
+        """Score many concepts in one sparse pass over their candidates.
+
+        Each concept is a sparse row of the features it activates (its
+        style/gender/age values, tag and description terms); each feature is
+        a sparse column holding the weight of every model carrying it. Only
+        those columns are materialized, as (row, weight) arrays over the
+        candidate models, so the work is proportional to the postings the
+        concepts reach, never to the catalog. All (concept, model, weight)
+        contributions are summed with one ``np.bincount`` and ranked per
+        concept with one ``np.lexsort``; the scores equal ``top_k``'s.
+
+        Concept size is bounded by the request schema (500 characters, 50
+        concepts per batch).
+        """
+        if not concepts:
+            return []
+        if k <= 0 or not self._entries:
+            return [[] for _ in concepts]
+
+        rows: dict[str, int] = {}
+        columns: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+        concept_idx, row_idx, data = [], [], []
+        for q, words in enumerate(concepts):
+            for key, model_ids, weight in self._feature_postings(words):
+                column = columns.get(key)
+                if column is None:
+                    col_rows = np.fromiter(
+                        (rows.setdefault(mid, len(rows)) for mid in model_ids),
+                        dtype=np.int64,
+                        count=len(model_ids),
+                    )
+                    if weight is not None:
+                        col_data = np.full(len(model_ids), weight)
+                    elif key[0] == "tag":
+                        col_data = np.fromiter(
+                            (0.15 / len(self._entries[mid].tag_set) for mid in model_ids),
+                            dtype=np.float64,
+                            count=len(model_ids),
+                        )
+                    else:
+                        col_data = np.fromiter(
+                            (0.10 / len(self._entries[mid].words) for mid in model_ids),
+                            dtype=np.float64,
+                            count=len(model_ids),
+                        )
+                    column = columns[key] = (col_rows, col_data)
+                concept_idx.append(np.full(len(column[0]), q, dtype=np.int64))
+                row_idx.append(column[0])
+                data.append(column[1])
+
+        results: list[list[tuple[str, float]]] = [[] for _ in concepts]
+        if not rows:
+            return results
+
+        # Sum duplicate (concept, row) entries: the sparse product Q @ W.T
+        n_rows = len(rows)
+        flat = np.concatenate(concept_idx) * n_rows + np.concatenate(row_idx)
+        pairs, inverse = np.unique(flat, return_inverse=True)
+        scores = np.round(np.minimum(np.bincount(inverse, weights=np.concatenate(data)), 1.0), 4)
+        keep = scores > min_score
+        pairs, scores = pairs[keep], scores[keep]
+        pair_concepts, pair_rows = np.divmod(pairs, n_rows)
+
+        # Best first within each concept; ties broken by ID, descending
+        ids = np.array(list(rows), dtype=object)
+        id_rank = np.empty(n_rows, dtype=np.int64)
+        id_rank[np.argsort(ids)] = np.arange(n_rows)
+        order = np.lexsort((-id_rank[pair_rows], -scores, pair_concepts))
+        pair_concepts, pair_rows, scores = pair_concepts[order], pair_rows[order], scores[order]
+
+        starts = np.searchsorted(pair_concepts, np.arange(len(concepts)), side="left")
+        ends = np.searchsorted(pair_concepts, np.arange(len(concepts)), side="right")
+        for q in range(len(concepts)):
+            stop = min(ends[q], starts[q] + k)
+            results[q] = [
+                (ids[row], float(score))
+                for row, score in zip(pair_rows[starts[q]:stop], scores[starts[q]:stop])
+            ]
+        return results
+
+    def _add(self, entry: IndexedModel) -> None:
+        self._entries[entry.id] = entry
+        for word in entry.words:
+            self._words.setdefault(word, set()).add(entry.id)
+        for tag in entry.tag_set:
+            self._tags.setdefault(tag, set()).add(entry.id)
+        self._styles.setdefault(entry.style, set()).add(entry.id)
+        self._genders.setdefault(entry.gender, set()).add(entry.id)
+        self._ages.setdefault(entry.age_range, set()).add(entry.id)
+
+
+def _discard_posting(postings: dict[str, set[str]], key: str, model_id: str) -> None:
+    ids = postings.get(key)
+    if ids is None:
+        return
+    ids.discard(model_id)
+    if not ids:
+        del postings[key]
+
+
+matching_index = MatchingIndex()
+
+
+# ---------------------------------------------------------------------------
+# Semantic backend
+# ---------------------------------------------------------------------------
+
+vector_index = VectorIndex()
+_vector_index_built_at: Optional[float] = None
+
+
+def _model_document(
+    name: Optional[str],
+    description: Optional[str],
+    style: str,
+    gender: str,
+    age_range: str,
+    tags: Iterable[str],
+) -> str:
+    """Text that gets embedded for a model.
+
+    Style/gender/age values are expanded with their keyword dictionaries so a
+    concept like "beach" lands near casual models without sharing a literal
+    word with them.
+    """
+    parts = [name or "", description or "", " ".join(tags), style, gender, age_range]
+    parts.extend(sorted(STYLE_KEYWORDS.get(style, ())))
+    parts.extend(sorted(GENDER_KEYWORDS.get(gender, ())))
+    parts.extend(sorted(AGE_KEYWORDS.get(age_range, ())))
+    return " ".join(part for part in parts if part)
+
+
+def embed_model(model: AIModel, tags: list[str]) -> np.ndarray:
+    """Embed a model's name, description, tags and categorical values."""
+    return encode_text(
+        _model_document(
+            model.name, model.description, model.style, model.gender, model.age_range, tags
+        )
+    )
+
+
+async def stage_model_embedding(
+    db: AsyncSession,
+    model: AIModel,
+    tags: list[str],
+) -> None:
+    """Add/replace the model's stored embedding in the current transaction."""
+    await db.merge(
+        ModelEmbedding(model_id=model.id, embedding=embed_model(model, tags).tolist())
+    )
+
+
+async def _build_vector_index(db: AsyncSession) -> None:
+    """Load active model embeddings into the flat index.
+
+    Models without a stored embedding (rows written before the embeddings
+    table existed, or seeded directly) are embedded on the fly.
+    """
+    global _vector_index_built_at
+
+    rows = await db.execute(
+        select(
+            AIModel.id,
+            AIModel.name,
+            AIModel.description,
+            AIModel.style,
+            AIModel.gender,
+            AIModel.age_range,
+            ModelEmbedding.embedding,
+        )
+        .outerjoin(ModelEmbedding, ModelEmbedding.model_id == AIModel.id)
+        .where(AIModel.status == "active")
+    )
+    rows = rows.all()
+
+    missing = [row.id for row in rows if row.embedding is None]
+    tags_by_model: dict[str, list[str]] = {}
+    if missing:
+        tag_rows = await db.execute(
+            select(ModelTag.model_id, ModelTag.tag).where(ModelTag.model_id.in_(missing))
+        )
+        for model_id, tag in tag_rows:
+            tags_by_model.setdefault(model_id, []).append(tag)
+
+    items = []
+    for row in rows:
+        if row.embedding is not None:
+            vector = np.asarray(row.embedding, dtype=np.float32)
+        else:
+            vector = encode_text(
+                _model_document(
+                    row.name,
+                    row.description,
+                    row.style,
+                    row.gender,
+                    row.age_range,
+                    tags_by_model.get(row.id, []),
+                )
+            )
+        items.append((row.id, vector))
+
+    vector_index.load(items)
+    _vector_index_built_at = time.monotonic()
+    logger.info("Vector index built: %d active models", len(vector_index))
+
+
+async def _semantic_top_k(
+    db: AsyncSession,
+    concept_description: str,
+    k: int,
+    min_score: float,
+) -> list[tuple[str, float]]:
+    """Rank active models by cosine similarity to the embedded concept."""
+    query = encode_text(concept_description)
+    if not query.any():
+        return []
+
+    if db.bind.dialect.name == "postgresql":
+        distance = ModelEmbedding.embedding.op("<=>", return_type=Float)(
+            bindparam("query_embedding", query.tolist(), type_=ModelEmbedding.embedding.type)
+        )
+        rows = await db.execute(
+            select(ModelEmbedding.model_id, distance)
+            .join(AIModel, AIModel.id == ModelEmbedding.model_id)
+            .where(AIModel.status == "active")
+            .order_by(distance)
+            .limit(k)
+        )
+        ranked = [(model_id, 1.0 - float(dist)) for model_id, dist in rows]
+    else:
+        max_age = settings.MATCHING_INDEX_MAX_AGE_SECONDS
+        if _vector_index_built_at is None or (
+            max_age > 0 and time.monotonic() - _vector_index_built_at > max_age
+        ):
+            await _build_vector_index(db)
+        ranked = vector_index.search(query, k)
+
+    return [
+        (model_id, round(min(sim, 1.0), 4))
+        for model_id, sim in ranked
+        if round(min(sim, 1.0), 4) > min_score
+    ]
+
+
+def reset_vector_index() -> None:
+    """Forget the flat index so the next semantic query rebuilds it."""
+    global _vector_index_built_at
+    vector_index.clear()
+    _vector_index_built_at = None
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+matching_cache = create_cache(
+    "matching",
+    maxsize=settings.MATCHING_CACHE_SIZE,
+    ttl=settings.MATCHING_CACHE_TTL_SECONDS,
+)
+
+_SEMANTIC_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _cache_key(concept_description: str, max_results: int, min_score: float) -> str:
+    """Normalize a concept into a cache key.
+
+    Keyword backends only see the ``_extract_words`` token set, so word order,
+    punctuation and repeats do not matter. The semantic encoder also weighs
+    repeats and non-ASCII words, so its key keeps the full sorted token list.
     """
-    # 1. Extract keywords from concept description
-    concept_words = _extract_words(request.concept_description)
+    backend = settings.MATCHING_BACKEND
+    if backend == "semantic":
+        tokens = sorted(_SEMANTIC_TOKEN_RE.findall(concept_description.lower()))
+    else:
+        tokens = sorted(_extract_words(concept_description))
+    return f"{backend}:{max_results}:{min_score}:{' '.join(tokens)}"
+
+
+async def notify_model_changed(model: AIModel) -> None:
+    """Propagate a committed model change into the indexes and result cache."""
+    await matching_cache.bump_version()
+    tags = list(model.tag_names)
+    matching_index.upsert(model, tags)
+    if _vector_index_built_at is not None:
+        if model.status == "active":
+            vector_index.upsert(model.id, embed_model(model, tags))
+        else:
+            vector_index.remove(model.id)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+async def _load_active_models(
+    db: AsyncSession,
+    model_ids: Iterable[str],
+) -> dict[str, AIModel]:
+    """Load the given active models keyed by ID (single-table read)."""
+    model_ids = list(model_ids)
+    if not model_ids:
+        return {}
 
-    # 2. Fetch all active models with relationships
     stmt = (
         select(AIModel)
+        .where(AIModel.id.in_(model_ids))
         .where(AIModel.status == "active")
-        .options(
-            selectinload(AIModel.images),
-            selectinload(AIModel.tags),
-        )
     )
     result = await db.execute(stmt)
-    active_models = list(result.scalars().all())
+    return {model.id: model for model in result.scalars().all()}
 
-    if not active_models:
-        return MatchingResponse(recommendations=[])
 
-    # 3. Score each model
-    scored: list[tuple[AIModel, list[str], float]] = []
-    for model in active_models:
-        tags = _extract_tags(model)
-        model_score = _compute_score(concept_words, model, tags)
-        if model_score > min_score:
-            scored.append((model, tags, model_score))
+def _build_recommendations(
+    ranked: list[tuple[str, float]],
+    models_by_id: dict[str, AIModel],
+) -> list[MatchingRecommendation]:
+    """Pair ranked ``(model_id, score)`` entries with their loaded models.
 
-    # 4. Sort by score descending, take top N
-    scored.sort(key=lambda x: x[2], reverse=True)
-    top = scored[:max_results]
-
-    # 5. Build response
+    Models that stopped being active since the index was built are skipped.
+    """
     recommendations = []
-    for model, tags, model_score in top:
+    for model_id, model_score in ranked:
+        model = models_by_id.get(model_id)
+        if model is None:
+            continue
         summary = MatchedModelSummary(
             id=model.id,
             name=model.name,
@@ -202,11 +793,119 @@ async def recommend_models(
             view_count=model.view_count,
             rating=model.rating,
             status=model.status,
-            thumbnail_url=_extract_thumbnail_url(model),
-            tags=tags,
+            thumbnail_url=model.thumbnail_url,
+            tags=list(model.tag_names),
         )
         recommendations.append(
             MatchingRecommendation(model=summary, score=model_score)
         )
+    return recommendations
 
-    return MatchingResponse(recommendations=recommendations)
+
+async def recommend_models(
+    db: AsyncSession,
+    request: MatchingRequest,
+    max_results: int = 5,
+    min_score: float = 0.0,
+) -> MatchingResponse:
+    """Recommend AI models for a concept description.
+
+    Dispatches on ``settings.MATCHING_BACKEND``: ``keyword`` (default) scores
+    keyword overlap through the inverted index, ``scan`` scores the same
+    keywords over a fresh column-tuple read, ``semantic`` ranks by cosine
+    similarity of local embeddings. In every mode only the final top-k models
+    are loaded with their images and tags.
+
+    Args:
+        db: Async database session.
+        request: Matching request with concept_description.
+        max_results: Maximum number of recommendations (default 5).
+        min_score: Minimum score threshold (default 0.0 - include all).
+
+    Returns:
+        MatchingResponse with sorted recommendations.
+    """
+    cache_key = _cache_key(request.concept_description, max_results, min_score)
+    # Taken before reading the catalog: a write landing meanwhile bumps it
+    cache_version = await matching_cache.version()
+    cached = await matching_cache.get(cache_key, cache_version)
+    if cached is not None:
+        return MatchingResponse.model_validate_json(cached)
+
+    if settings.MATCHING_BACKEND == "semantic":
+        ranked = await _semantic_top_k(
+            db, request.concept_description, max_results, min_score
+        )
+    elif settings.MATCHING_BACKEND == "scan":
+        concept_words = _extract_words(request.concept_description)
+        entries = await _fetch_active_features(db)
+        ranked = _select_top_k(concept_words, entries, max_results, min_score)
+    else:
+        # 1. Extract keywords from concept description
+        concept_words = _extract_words(request.concept_description)
+
+        # 2. Score candidate postings from the in-memory index
+        await matching_index.ensure_built(db)
+        ranked = matching_index.top_k(concept_words, max_results, min_score)
+
+    # 3. Load only the winners
+    models_by_id = await _load_active_models(db, (mid for mid, _ in ranked))
+    response = MatchingResponse(
+        recommendations=_build_recommendations(ranked, models_by_id)
+    )
+    await matching_cache.set(cache_key, response.model_dump_json(), cache_version)
+    return response
+
+
+async def recommend_models_batch(
+    db: AsyncSession,
+    request: BatchMatchingRequest,
+    max_results: int = 5,
+    min_score: float = 0.0,
+) -> BatchMatchingResponse:
+    """Recommend AI models for many concept descriptions at once.
+
+    Dispatches on ``settings.MATCHING_BACKEND`` like ``recommend_models``:
+    ``keyword`` scores all concepts in one sparse pass over the index,
+    ``scan`` reads the column tuples once and selects per concept,
+    ``semantic`` ranks each concept by embedding similarity. The winners of
+    every concept are loaded with a single query.
+
+    Args:
+        db: Async database session.
+        request: Batch request with one MatchingRequest per concept.
+        max_results: Maximum number of recommendations per concept.
+        min_score: Minimum score threshold (default 0.0 - include all).
+
+    Returns:
+        BatchMatchingResponse with one MatchingResponse per concept, in order.
+    """
+    if settings.MATCHING_BACKEND == "semantic":
+        ranked_per_concept = [
+            await _semantic_top_k(db, c.concept_description, max_results, min_score)
+            for c in request.concepts
+        ]
+    elif settings.MATCHING_BACKEND == "scan":
+        entries = await _fetch_active_features(db)
+        ranked_per_concept = [
+            _select_top_k(
+                _extract_words(c.concept_description), entries, max_results, min_score
+            )
+            for c in request.concepts
+        ]
+    else:
+        concepts = [_extract_words(c.concept_description) for c in request.concepts]
+        await matching_index.ensure_built(db)
+        ranked_per_concept = matching_index.top_k_batch(concepts, max_results, min_score)
+
+    winner_ids = {mid for ranked in ranked_per_concept for mid, _ in ranked}
+    models_by_id = await _load_active_models(db, winner_ids)
+
+    return BatchMatchingResponse(
+        results=[
+            MatchingResponse(
+                recommendations=_build_recommendations(ranked, models_by_id)
+            )
+            for ranked in ranked_per_concept
+        ]
+    )
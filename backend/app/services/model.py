@@ -1,19 +1,30 @@
 # @TASK P2-R1-T1 - AI Models business logic (CRUD, filters, pagination)
 # @SPEC docs/planning/02-trd.md#ai-models-api
-"""AI Model service: CRUD operations, filtering, and pagination.
+"""AI Model service: CRUD operations, filtering, pagination, detail caching.
 
 @TEST tests/api/test_models.py
 """
+import hashlib
 import logging
 import uuid
+from dataclasses import dataclass
 from typing import Optional
 
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor, seek_before
 from app.models.ai_model import AIModel, ModelImage, ModelTag
 from app.schemas.model import AIModelCreate, AIModelUpdate
+from app.services.matching import notify_model_changed, stage_model_embedding
+from app.services.order import invalidate_model_summary
+from app.services.search import apply_keyword_search, build_search_document
+from app.services.stats import bump_platform_stats
+from app.services.analytics import record_daily_views
+from app.services.view_counter import view_counter
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +59,10 @@ async def create_model(
         status="draft",
         view_count=0,
         rating=0.0,
+        tag_names=list(model_in.tags),
+        search_document=build_search_document(
+            model_in.name, model_in.description, model_in.tags
+        ),
     )
     db.add(ai_model)
     await db.flush()
@@ -57,10 +72,13 @@ async def create_model(
         tag = ModelTag(model_id=ai_model.id, tag=tag_name)
         db.add(tag)
 
+    await stage_model_embedding(db, ai_model, model_in.tags)
     await db.commit()
 
     # Reload with relationships
-    return await get_model_by_id(db, ai_model.id)
+    ai_model = await get_model_by_id(db, ai_model.id)
+    await notify_model_changed(ai_model)
+    return ai_model
 
 
 # ---------------------------------------------------------------------------
@@ -94,23 +112,87 @@ async def get_model_by_id(
     return result.scalar_one_or_none()
 
 
-async def increment_view_count(
-    db: AsyncSession,
-    model: AIModel,
-) -> AIModel:
-    """Increment the view_count of a model by 1.
+# ---------------------------------------------------------------------------
+# Detail response cache
+# ---------------------------------------------------------------------------
 
-    Args:
-        db: Async database session.
-        model: The AIModel instance.
+# Serialized detail responses keyed by model ID. Entries are dropped by
+# update_model / add_model_image, and after the model's views are flushed so
+# the stored view_count they carry stays current. Creator profile changes
+# are picked up when the entry expires (TTL).
+model_detail_cache = create_cache(
+    "model_detail",
+    maxsize=settings.MODEL_DETAIL_CACHE_SIZE,
+    ttl=settings.MODEL_DETAIL_CACHE_TTL_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class CachedModelDetail:
+    """A cached detail response.
+
+    ``body`` is the JSON object without ``view_count``, which changes on every
+    view and is appended per request. The ETag is therefore weak: it tracks
+    the profile, not the counter.
+    """
+
+    etag: str
+    view_count: int
+    body: str
+
+    def render(self, view_count: int) -> bytes:
+        """Return the response body with ``view_count`` spliced in."""
+        return f'{self.body[:-1]},"view_count":{view_count}}}'.encode("utf-8")
+
+    def encode(self) -> str:
+        return f"{self.etag} {self.view_count}\n{self.body}"
+
+    @classmethod
+    def decode(cls, raw: str) -> "CachedModelDetail":
+        header, body = raw.split("\n", 1)
+        etag, view_count = header.rsplit(" ", 1)
+        return cls(etag=etag, view_count=int(view_count), body=body)
+
+
+async def get_cached_model_detail(model_id: str) -> Optional[CachedModelDetail]:
+    """Return the cached detail response of a model, if any."""
+    raw = await model_detail_cache.get(model_id)
+    return CachedModelDetail.decode(raw) if raw is not None else None
+
+
+async def cache_model_detail(
+    model_id: str,
+    body: str,
+    view_count: int,
+) -> CachedModelDetail:
+    """Store a serialized detail response (JSON object without view_count)."""
+    digest = hashlib.blake2b(body.encode("utf-8"), digest_size=12).hexdigest()
+    entry = CachedModelDetail(etag=f'W/"{digest}"', view_count=view_count, body=body)
+    await model_detail_cache.set(model_id, entry.encode())
+    return entry
+
+
+async def invalidate_model_detail(model_id: str) -> None:
+    """Drop the cached detail response of a model."""
+    await model_detail_cache.delete(model_id)
+
+
+async def flush_view_counts(db: AsyncSession) -> int:
+    """Write buffered views and drop the detail entries they made stale.
 
     Returns:
-        Updated AIModel.
+        The number of views written.
     """
-    model.view_count = model.view_count + 1
-    await db.commit()
-    await db.refresh(model)
-    return model
+    flushed = await view_counter.flush(db)
+    for model_id in flushed:
+        await invalidate_model_detail(model_id)
+    try:
+        await record_daily_views(db, flushed)
+    except Exception:
+        # view_count is already written; only the daily chart misses them
+        await db.rollback()
+        logger.exception("Recording %d daily views failed", sum(flushed.values()))
+    return sum(flushed.values())
 
 
 # ---------------------------------------------------------------------------
@@ -118,6 +200,15 @@ async def increment_view_count(
 # ---------------------------------------------------------------------------
 
 
+# sort option -> column ordered DESC, always followed by AIModel.id DESC so
+# that every row has a unique position (see idx_model_*_id indexes)
+SORT_COLUMNS = {
+    "popular": AIModel.view_count,
+    "rating": AIModel.rating,
+    "recent": AIModel.created_at,
+}
+
+
 async def list_models(
     db: AsyncSession,
     *,
@@ -128,22 +219,42 @@ async def list_models(
     age_range: Optional[str] = None,
     keyword: Optional[str] = None,
     sort: str = "recent",
-) -> tuple[list[AIModel], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[AIModel], Optional[int], Optional[str]]:
     """List AI models with optional filters, sorting, and pagination.
 
+    Two pagination modes share the same ordering (sort column DESC, id DESC):
+      - offset: ``page``/``limit`` (used when ``cursor`` is None)
+      - keyset: ``cursor`` from a previous response's ``next_cursor``; seeks
+        with ``WHERE (sort_key, id) < (...)`` and ignores ``page``
+
+    ``keyword`` uses the full-text index (see ``app/services/search.py``).
+    ``sort="relevance"`` orders keyword results by rank; it is offset-only
+    and behaves like "recent" without a keyword.
+
     Args:
         db: Async database session.
-        page: Page number (1-based).
+        page: Page number (1-based, offset mode only).
         limit: Items per page.
         style: Filter by style.
         gender: Filter by gender.
         age_range: Filter by age_range.
-        keyword: Search keyword for name/description.
-        sort: Sort order - "popular", "recent", or "rating".
+        keyword: Search keyword for name/description/tags.
+        sort: Sort order - "popular", "recent", "rating", or "relevance".
+        cursor: Opaque keyset cursor.
+        include_total: Run the COUNT query. When False, total is None.
 
     Returns:
-        Tuple of (list of AIModel, total count).
+        Tuple of (list of AIModel, total count or None, next cursor or None).
+
+    Raises:
+        ValueError: If the cursor is invalid or was issued for another sort.
     """
+    sort_column = SORT_COLUMNS.get(sort, AIModel.created_at)
+    sort_key = sort if sort in SORT_COLUMNS else "recent"
+    relevance = None
+
     # Base query
     base_stmt = select(AIModel)
     count_stmt = select(func.count(AIModel.id))
@@ -156,45 +267,60 @@ async def list_models(
         conditions.append(AIModel.gender == gender)
     if age_range:
         conditions.append(AIModel.age_range == age_range)
-    if keyword:
-        keyword_filter = or_(
-            AIModel.name.ilike(f"%{keyword}%"),
-            AIModel.description.ilike(f"%{keyword}%"),
-        )
-        conditions.append(keyword_filter)
 
     if conditions:
         for condition in conditions:
             base_stmt = base_stmt.where(condition)
             count_stmt = count_stmt.where(condition)
 
-    # Get total count
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar_one()
-
-    # Apply sorting
-    if sort == "popular":
-        base_stmt = base_stmt.order_by(AIModel.view_count.desc())
-    elif sort == "rating":
-        base_stmt = base_stmt.order_by(AIModel.rating.desc())
-    else:  # "recent" (default)
-        base_stmt = base_stmt.order_by(AIModel.created_at.desc())
-
-    # Apply pagination
-    offset = (page - 1) * limit
-    base_stmt = base_stmt.offset(offset).limit(limit)
-
-    # Load relationships
-    base_stmt = base_stmt.options(
-        selectinload(AIModel.creator),
-        selectinload(AIModel.images),
-        selectinload(AIModel.tags),
-    )
+    if keyword:
+        dialect_name = db.bind.dialect.name
+        base_stmt, relevance = apply_keyword_search(base_stmt, dialect_name, keyword)
+        count_stmt, _ = apply_keyword_search(count_stmt, dialect_name, keyword)
+
+    # Get total count (optional: cursor clients rarely need it)
+    total = None
+    if include_total:
+        count_result = await db.execute(count_stmt)
+        total = count_result.scalar_one()
+
+    # Apply sorting with a unique tiebreaker
+    by_relevance = sort == "relevance" and relevance is not None
+    if by_relevance:
+        base_stmt = base_stmt.order_by(relevance.desc(), AIModel.id.desc())
+    else:
+        base_stmt = base_stmt.order_by(sort_column.desc(), AIModel.id.desc())
+
+    # Apply pagination (fetch one extra row to know whether a next page exists)
+    if cursor is not None:
+        if by_relevance:
+            raise ValueError("Cursor pagination is not supported for relevance sort")
+        cursor_sort, sort_value, last_id = decode_cursor(cursor, 3)
+        if cursor_sort != sort_key:
+            raise ValueError("Cursor was issued for a different sort order")
+        base_stmt = base_stmt.where(
+            seek_before([sort_column, AIModel.id], [sort_value, last_id])
+        )
+    else:
+        base_stmt = base_stmt.offset((page - 1) * limit)
+    base_stmt = base_stmt.limit(limit + 1)
+
+    # Thumbnail and tags come from the denormalized columns: one query per page
+    base_stmt = base_stmt.options(joinedload(AIModel.creator))
 
     result = await db.execute(base_stmt)
     models = list(result.scalars().all())
 
-    return models, total
+    next_cursor = None
+    if len(models) > limit:
+        models = models[:limit]
+        last = models[-1]
+        if not by_relevance:
+            next_cursor = encode_cursor(
+                sort_key, getattr(last, sort_column.key), last.id
+            )
+
+    return models, total, next_cursor
 
 
 # ---------------------------------------------------------------------------
@@ -218,6 +344,7 @@ async def update_model(
         Updated AIModel with relationships loaded.
     """
     update_data = model_in.model_dump(exclude_unset=True)
+    was_active = model.status == "active"
 
     # Handle tags separately
     tags_data = update_data.pop("tags", None)
@@ -240,7 +367,12 @@ async def update_model(
         for tag_name in tags_data:
             new_tag = ModelTag(model_id=model.id, tag=tag_name)
             db.add(new_tag)
+        model.tag_names = list(tags_data)
 
+    tags = tags_data if tags_data is not None else [t.tag for t in model.tags]
+    model.search_document = build_search_document(model.name, model.description, tags)
+    await stage_model_embedding(db, model, tags)
+    await bump_platform_stats(db, models=(model.status == "active") - was_active)
     await db.commit()
 
     # Expire all cached state to ensure fresh relationship loading
@@ -248,7 +380,11 @@ async def update_model(
     db.expunge_all()
 
     # Reload with relationships (fresh query, no stale cache)
-    return await get_model_by_id(db, model_id)
+    model = await get_model_by_id(db, model_id)
+    await invalidate_model_detail(model_id)
+    await invalidate_model_summary(model_id)
+    await notify_model_changed(model)
+    return model
 
 
 # ---------------------------------------------------------------------------
@@ -295,7 +431,16 @@ async def add_model_image(
         is_thumbnail=is_thumbnail,
     )
     db.add(image)
+
+    # The first thumbnail wins, as in the detail response
+    if is_thumbnail:
+        await db.execute(
+            update(AIModel)
+            .where(AIModel.id == model_id, AIModel.thumbnail_url.is_(None))
+            .values(thumbnail_url=stub_url)
+        )
     await db.commit()
     await db.refresh(image)
+    await invalidate_model_detail(model_id)
 
     return image
@@ -11,19 +11,38 @@ State machine:
     in_progress -> completed (brand or creator completes)
     in_progress -> cancelled (brand cancels)
 
+Writes return the order without reloading it: ``create_order`` keeps the
+instance it inserted and ``update_order_status`` applies the transition as
+one conditional ``UPDATE .. WHERE status IN (:expected) RETURNING``, which
+also makes concurrent transitions of the same order safe (the loser matches
+no row). Responses take the brand, creator and model summaries from
+``get_order_parties`` (cached) instead of loading the relationships.
+
+Side effects of a transition (the settlement of a completed order) are not
+run in the request: it enqueues an outbox event in the same transaction (see
+``app/services/outbox.py``).
+
 @TEST tests/api/test_orders.py
 """
+import json
 import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import or_, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor, seek_before
+from app.models.ai_model import AIModel
 from app.models.order import Order
 from app.models.user import User
 from app.schemas.order import OrderCreate
+from app.services.order_number import order_number_allocator
+from app.services.outbox import enqueue_event
+from app.services.stats import bump_platform_stats
 
 logger = logging.getLogger(__name__)
 
@@ -51,31 +70,6 @@ ACTION_PERMISSIONS = {
 }
 
 
-# ---------------------------------------------------------------------------
-# Order number generation
-# ---------------------------------------------------------------------------
-
-
-async def _generate_order_number(db: AsyncSession) -> str:
-    """Generate a unique order number in ORD-YYYYMMDD-NNN format.
-
-    Uses today's date and counts existing orders for today to determine
-    the sequence number.
-    """
-    today = datetime.utcnow().strftime("%Y%m%d")
-    prefix = f"ORD-{today}-"
-
-    # Count orders with today's prefix
-    count_stmt = select(func.count(Order.id)).where(
-        Order.order_number.like(f"{prefix}%")
-    )
-    result = await db.execute(count_stmt)
-    count = result.scalar_one()
-
-    sequence = count + 1
-    return f"{prefix}{sequence:03d}"
-
-
 # ---------------------------------------------------------------------------
 # Create
 # ---------------------------------------------------------------------------
@@ -96,7 +90,7 @@ async def create_order(
     Returns:
         The newly created Order with relationships loaded.
     """
-    order_number = await _generate_order_number(db)
+    order_number = await order_number_allocator.next_number()
 
     order = Order(
         brand_id=brand_id,
@@ -113,9 +107,76 @@ async def create_order(
     )
     db.add(order)
     await db.commit()
+    return order
+
+
+# ---------------------------------------------------------------------------
+# Party summaries (brand, creator, model) for write responses
+# ---------------------------------------------------------------------------
+
+# JSON summaries keyed "user:<id>" / "model:<id>"; dropped when the user's
+# profile or the model's name/style is written.
+order_party_cache = create_cache(
+    "order_party",
+    maxsize=settings.ORDER_PARTY_CACHE_SIZE,
+    ttl=settings.ORDER_PARTY_CACHE_TTL_SECONDS,
+)
 
-    # Reload with relationships
-    return await get_order_by_id(db, order.id)
+
+async def get_order_parties(db: AsyncSession, order: Order) -> dict[str, Optional[dict]]:
+    """Brand, creator and model summaries of an order (read-through cache).
+
+    Returns:
+        ``{"brand": ..., "creator": ..., "model": ...}``; an entry is None
+        when its row does not exist.
+    """
+    keys = {
+        "brand": f"user:{order.brand_id}",
+        "creator": f"user:{order.creator_id}",
+        "model": f"model:{order.model_id}",
+    }
+    found: dict[str, dict] = {}
+    for key in set(keys.values()):
+        raw = await order_party_cache.get(key)
+        if raw is not None:
+            found[key] = json.loads(raw)
+
+    user_ids = [
+        key.split(":", 1)[1]
+        for key in {keys["brand"], keys["creator"]}
+        if key not in found
+    ]
+    if user_ids:
+        rows = await db.execute(
+            select(User.id, User.nickname, User.company_name, User.profile_image)
+            .where(User.id.in_(user_ids))
+        )
+        for row in rows:
+            found[f"user:{row.id}"] = dict(row._mapping)
+            await order_party_cache.set(f"user:{row.id}", json.dumps(dict(row._mapping)))
+
+    if keys["model"] not in found:
+        row = (
+            await db.execute(
+                select(AIModel.id, AIModel.name, AIModel.style)
+                .where(AIModel.id == order.model_id)
+            )
+        ).one_or_none()
+        if row is not None:
+            found[keys["model"]] = dict(row._mapping)
+            await order_party_cache.set(keys["model"], json.dumps(dict(row._mapping)))
+
+    return {role: found.get(key) for role, key in keys.items()}
+
+
+async def invalidate_user_summary(user_id: str) -> None:
+    """Drop the cached order-party summary of a user after a profile write."""
+    await order_party_cache.delete(f"user:{user_id}")
+
+
+async def invalidate_model_summary(model_id: str) -> None:
+    """Drop the cached order-party summary of a model after a write."""
+    await order_party_cache.delete(f"model:{model_id}")
 
 
 # ---------------------------------------------------------------------------
@@ -154,6 +215,30 @@ async def get_order_by_id(
 # ---------------------------------------------------------------------------
 
 
+def build_order_list_query(
+    user: User,
+    *,
+    status_filter: Optional[str] = None,
+    after: Optional[tuple[datetime, str]] = None,
+):
+    """Role-filtered order listing, newest first (created_at DESC, id DESC).
+
+    The filter and ordering match ``idx_order_brand_status_created_id`` /
+    ``idx_order_creator_status_created_id``; ``after`` is the
+    ``(created_at, id)`` of the last row already seen (keyset mode).
+    """
+    stmt = select(Order)
+    if user.role == "brand":
+        stmt = stmt.where(Order.brand_id == user.id)
+    elif user.role == "creator":
+        stmt = stmt.where(Order.creator_id == user.id)
+    if status_filter:
+        stmt = stmt.where(Order.status == status_filter)
+    if after is not None:
+        stmt = stmt.where(seek_before([Order.created_at, Order.id], list(after)))
+    return stmt.order_by(Order.created_at.desc(), Order.id.desc())
+
+
 async def list_orders(
     db: AsyncSession,
     user: User,
@@ -161,60 +246,73 @@ async def list_orders(
     page: int = 1,
     limit: int = 20,
     status_filter: Optional[str] = None,
-) -> tuple[list[Order], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[Order], Optional[int], Optional[str]]:
     """List orders filtered by user role.
 
     - brand: sees orders where brand_id == user.id
     - creator: sees orders where creator_id == user.id
 
+    Two pagination modes share the same ordering (created_at DESC, id DESC):
+      - offset: ``page``/``limit`` (used when ``cursor`` is None)
+      - keyset: ``cursor`` from a previous response's ``next_cursor``; seeks
+        with ``WHERE (created_at, id) < (...)`` and ignores ``page``
+
     Args:
         db: Async database session.
         user: Current authenticated user.
-        page: Page number (1-based).
+        page: Page number (1-based, offset mode only).
         limit: Items per page.
         status_filter: Optional status filter.
+        cursor: Opaque keyset cursor.
+        include_total: Run the COUNT query. When False, total is None.
 
     Returns:
-        Tuple of (list of Order, total count).
-    """
-    base_stmt = select(Order)
-    count_stmt = select(func.count(Order.id))
-
-    # Role-based filtering
-    if user.role == "brand":
-        base_stmt = base_stmt.where(Order.brand_id == user.id)
-        count_stmt = count_stmt.where(Order.brand_id == user.id)
-    elif user.role == "creator":
-        base_stmt = base_stmt.where(Order.creator_id == user.id)
-        count_stmt = count_stmt.where(Order.creator_id == user.id)
+        Tuple of (list of Order, total count or None, next cursor or None).
 
-    # Status filter
-    if status_filter:
-        base_stmt = base_stmt.where(Order.status == status_filter)
-        count_stmt = count_stmt.where(Order.status == status_filter)
-
-    # Get total count
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar_one()
-
-    # Sort by newest first
-    base_stmt = base_stmt.order_by(Order.created_at.desc())
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    after = None
+    if cursor is not None:
+        created_at, last_id = decode_cursor(cursor, 2)
+        if not isinstance(created_at, datetime) or not isinstance(last_id, str):
+            raise ValueError("Invalid cursor")
+        after = (created_at, last_id)
+
+    # Get total count (optional: cursor clients rarely need it)
+    total = None
+    if include_total:
+        count_stmt = (
+            build_order_list_query(user, status_filter=status_filter)
+            .with_only_columns(func.count(Order.id))
+            .order_by(None)
+        )
+        total = (await db.execute(count_stmt)).scalar_one()
 
-    # Pagination
-    offset = (page - 1) * limit
-    base_stmt = base_stmt.offset(offset).limit(limit)
+    # Pagination (fetch one extra row to know whether a next page exists)
+    stmt = build_order_list_query(user, status_filter=status_filter, after=after)
+    if after is None:
+        stmt = stmt.offset((page - 1) * limit)
+    stmt = stmt.limit(limit + 1)
 
     # Load relationships
-    base_stmt = base_stmt.options(
+    stmt = stmt.options(
         selectinload(Order.brand_user),
         selectinload(Order.creator_user),
         selectinload(Order.model),
     )
 
-    result = await db.execute(base_stmt)
+    result = await db.execute(stmt)
     orders = list(result.scalars().all())
 
-    return orders, total
+    next_cursor = None
+    if len(orders) > limit:
+        orders = orders[:limit]
+        next_cursor = encode_cursor(orders[-1].created_at, orders[-1].id)
+
+    return orders, total, next_cursor
 
 
 # ---------------------------------------------------------------------------
@@ -224,58 +322,81 @@ async def list_orders(
 
 async def update_order_status(
     db: AsyncSession,
-    order: Order,
+    order_id: str,
     action: str,
     user: User,
-) -> Order:
-    """Update order status based on action.
+) -> Optional[Order]:
+    """Apply an action to an order with one conditional UPDATE .. RETURNING.
 
-    Validates:
-        1. The action is a valid transition from the current status.
-        2. The user has permission to perform this action.
+    The UPDATE matches only when the order is in a status the action can
+    leave and the user is its brand or creator. When nothing matches, one
+    lookup tells the cases apart.
 
     Args:
         db: Async database session.
-        order: The Order to update.
+        order_id: UUID of the order.
         action: The action to perform (accept/reject/start/complete/cancel).
         user: The user performing the action.
 
     Returns:
-        Updated Order.
+        The updated Order (relationships not loaded), or None if the order
+        does not exist.
 
     Raises:
-        ValueError: If transition is invalid.
-        PermissionError: If user lacks permission.
+        ValueError: If the transition is invalid for the current status
+            (including a concurrent transition that got there first).
+        PermissionError: If the user is not a party of the order or lacks
+            permission for the action.
     """
-    # Check permission
+    transitions = STATE_TRANSITIONS.get(action, {})
     allowed_roles = ACTION_PERMISSIONS.get(action, set())
+
+    if transitions and user.role in allowed_roles:
+        # Every action leads to a single status
+        new_status = next(iter(transitions.values()))
+        now = datetime.utcnow()
+        values = {"status": new_status, "updated_at": now}
+        if new_status == "accepted":
+            values["accepted_at"] = now
+        elif new_status == "completed":
+            values["completed_at"] = now
+
+        stmt = (
+            update(Order)
+            .where(
+                Order.id == order_id,
+                Order.status.in_(list(transitions)),
+                or_(Order.brand_id == user.id, Order.creator_id == user.id),
+            )
+            .values(**values)
+            .returning(Order)
+            .execution_options(populate_existing=True)
+        )
+        order = (await db.scalars(stmt)).one_or_none()
+        if order is not None:
+            if new_status == "completed":
+                # @TASK P4-R3-T1 - Settlement is created by the outbox worker
+                await enqueue_event(
+                    db, "order.completed", order.id, {"creator_id": order.creator_id}
+                )
+                await bump_platform_stats(db, bookings=1)
+            await db.commit()
+            return order
+
+    row = (
+        await db.execute(
+            select(Order.status, Order.brand_id, Order.creator_id)
+            .where(Order.id == order_id)
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    if user.id not in (row.brand_id, row.creator_id):
+        raise PermissionError("You do not have access to this order")
     if user.role not in allowed_roles:
         raise PermissionError(
             f"Role '{user.role}' is not allowed to perform '{action}'"
         )
-
-    # Check transition
-    transitions = STATE_TRANSITIONS.get(action, {})
-    new_status = transitions.get(order.status)
-    if new_status is None:
-        raise ValueError(
-            f"Cannot perform '{action}' on order with status '{order.status}'"
-        )
-
-    # Apply transition
-    order.status = new_status
-    now = datetime.utcnow()
-
-    if new_status == "accepted":
-        order.accepted_at = now
-    elif new_status == "completed":
-        order.completed_at = now
-        # @TASK P4-R3-T1 - Auto-create settlement on order completion
-        from app.services.settlement import create_settlement_for_order
-        await create_settlement_for_order(db, order)
-
-    await db.commit()
-    await db.refresh(order)
-
-    # Reload with relationships
-    return await get_order_by_id(db, order.id)
+    raise ValueError(
+        f"Cannot perform '{action}' on order with status '{row.status}'"
+    )
@@ -0,0 +1,101 @@
+# @TASK P3-R2-T1 - Orders business logic (order number allocation)
+# @SPEC docs/planning/02-trd.md#orders-api
+"""Order number allocator: ORD-YYYYMMDD-NNN without counting orders.
+
+Each UTC day has one ``order_number_sequences`` row. A worker reserves a
+block of ``ORDER_NUMBER_BLOCK_SIZE`` sequences with a single atomic upsert::
+
+    INSERT INTO order_number_sequences (day, last_value) VALUES (:day, :n)
+    ON CONFLICT (day) DO UPDATE SET last_value = last_value + :n
+    RETURNING last_value
+
+on the allocator's own engine (the primary by default), committed
+immediately, so the row lock is never held for the duration of an order's
+transaction. Numbers are then handed out from memory until the block runs
+out or the day changes. SQLite has a single writer, so reservations against
+it are serialized within the process.
+
+Numbers are unique but not gapless: a block unused when the process stops,
+or a number taken by an order whose transaction fails, is skipped. Orders
+from different workers are not numbered in creation order.
+
+@TEST tests/api/test_orders.py
+"""
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.db.base import dialect_insert
+from app.db.session import engine as primary_engine
+from app.models.order import OrderNumberSequence
+
+logger = logging.getLogger(__name__)
+
+_sqlite_lock = asyncio.Lock()
+
+
+def format_order_number(day: date, sequence: int) -> str:
+    """ORD-YYYYMMDD-NNN (at least three digits)."""
+    return f"ORD-{day:%Y%m%d}-{sequence:03d}"
+
+
+async def reserve_sequences(bind: AsyncEngine, day: date, count: int) -> int:
+    """Reserve ``count`` sequences of ``day``. Returns the last one reserved."""
+    stmt = dialect_insert(bind.dialect.name, OrderNumberSequence).values(
+        day=day, last_value=count
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["day"],
+        set_={"last_value": OrderNumberSequence.last_value + count},
+    ).returning(OrderNumberSequence.last_value)
+    if bind.dialect.name == "sqlite":
+        async with _sqlite_lock, bind.begin() as conn:
+            return (await conn.execute(stmt)).scalar_one()
+    async with bind.begin() as conn:
+        return (await conn.execute(stmt)).scalar_one()
+
+
+class OrderNumberAllocator:
+    """Hands out order numbers from blocks reserved in the database.
+
+    ``engine`` must not be shared with the caller's transaction: the
+    reservation commits on its own connection.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine = primary_engine,
+        block_size: Optional[int] = None,
+    ) -> None:
+        self.engine = engine
+        self.block_size = block_size or settings.ORDER_NUMBER_BLOCK_SIZE
+        self._lock = asyncio.Lock()
+        self._day: Optional[date] = None
+        self._next = 0
+        self._last = -1
+
+    async def next_number(self) -> str:
+        """Return the next unused order number for today (UTC)."""
+        today = datetime.utcnow().date()
+        async with self._lock:
+            if self._day != today or self._next > self._last:
+                last = await reserve_sequences(self.engine, today, self.block_size)
+                self._day = today
+                self._next = last - self.block_size + 1
+                self._last = last
+            sequence = self._next
+            self._next += 1
+        return format_order_number(today, sequence)
+
+    def reset(self) -> None:
+        """Drop the current block (its remaining numbers are skipped)."""
+        self._day = None
+        self._next = 0
+        self._last = -1
+
+
+order_number_allocator = OrderNumberAllocator()
@@ -0,0 +1,149 @@
+# @TASK P3-R2-T1 - Orders business logic (outbox)
+# @SPEC docs/planning/04-database-design.md#outbox
+"""Transactional outbox: side effects of state changes, off the request path.
+
+A state change calls ``enqueue_event`` before its commit, so the event row is
+written in the same transaction (one extra INSERT) and exists if and only if
+the change does. ``drain_outbox`` then runs the registered handler of every
+due event:
+
+    claim - one ``UPDATE .. WHERE id IN (SELECT .. FOR UPDATE SKIP LOCKED
+        LIMIT batch) RETURNING`` pushes ``available_at`` forward by
+        ``OUTBOX_LEASE_SECONDS``, so concurrent workers never share an event
+        and events of a crashed worker reappear after the lease.
+    run - each event's handler and its ``done`` mark commit together. A
+        failure rolls the handler back and retries after
+        ``OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)``; after
+        ``OUTBOX_MAX_ATTEMPTS`` the event is parked as ``failed``.
+
+Delivery is at least once (a lease can expire while a slow handler is still
+running), so handlers must be idempotent. ``idempotency_key`` (unique) makes
+enqueueing the same logical event twice a no-op, and handlers key their own
+writes on it or on the aggregate.
+
+The worker runs in-process (periodic job, ``OUTBOX_WORKER_IN_PROCESS``) or
+as ``python -m app.worker``.
+
+@TEST tests/api/test_outbox.py
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import dialect_insert
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[AsyncSession, OutboxEvent], Awaitable[object]]
+
+_handlers: dict[str, Handler] = {}
+
+
+def outbox_handler(event_type: str) -> Callable[[Handler], Handler]:
+    """Register the handler of ``event_type`` events (one per type)."""
+    def register(handler: Handler) -> Handler:
+        _handlers[event_type] = handler
+        return handler
+    return register
+
+
+async def enqueue_event(
+    db: AsyncSession,
+    event_type: str,
+    aggregate_id: str,
+    payload: Optional[dict] = None,
+    idempotency_key: Optional[str] = None,
+) -> None:
+    """Add an event to the caller's transaction (not committed here).
+
+    ``idempotency_key`` defaults to ``"<event_type>:<aggregate_id>"``; an
+    event with an existing key is dropped.
+    """
+    stmt = dialect_insert(db.bind.dialect.name, OutboxEvent).values(
+        event_type=event_type,
+        aggregate_id=aggregate_id,
+        payload=payload or {},
+        idempotency_key=idempotency_key or f"{event_type}:{aggregate_id}",
+    )
+    await db.execute(stmt.on_conflict_do_nothing(index_elements=["idempotency_key"]))
+
+
+async def _claim(db: AsyncSession, batch_size: int) -> list[OutboxEvent]:
+    now = datetime.utcnow()
+    due = (
+        select(OutboxEvent.id)
+        .where(OutboxEvent.status == "pending", OutboxEvent.available_at <= now)
+        .order_by(OutboxEvent.available_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(OutboxEvent)
+        .where(OutboxEvent.id.in_(due.scalar_subquery()))
+        .values(available_at=now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS))
+        .returning(OutboxEvent)
+        .execution_options(populate_existing=True)
+    )
+    events = list((await db.scalars(stmt)).all())
+    await db.commit()
+    # Detached, so a failed event's rollback does not expire the rest
+    for event in events:
+        db.expunge(event)
+    return sorted(events, key=lambda event: event.created_at)
+
+
+async def _record_failure(db: AsyncSession, event_id: str, attempts: int, error: str) -> None:
+    attempts += 1
+    parked = attempts >= settings.OUTBOX_MAX_ATTEMPTS
+    delay = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    await db.execute(
+        update(OutboxEvent)
+        .where(OutboxEvent.id == event_id)
+        .values(
+            attempts=attempts,
+            last_error=error[:2000],
+            status="failed" if parked else "pending",
+            available_at=datetime.utcnow() + timedelta(seconds=delay),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+async def drain_outbox(db: AsyncSession, batch_size: Optional[int] = None) -> int:
+    """Claim and run one batch of due events.
+
+    Args:
+        db: Async database session (primary); committed per event.
+        batch_size: Events claimed at once. Defaults to ``OUTBOX_BATCH_SIZE``.
+
+    Returns:
+        Number of events claimed (processed or rescheduled).
+    """
+    events = await _claim(db, batch_size or settings.OUTBOX_BATCH_SIZE)
+    for event in events:
+        handler = _handlers.get(event.event_type)
+        try:
+            if handler is None:
+                raise LookupError(f"No outbox handler for '{event.event_type}'")
+            await handler(db, event)
+            await db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == event.id)
+                .values(status="done", processed_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            logger.warning(
+                "Outbox event %s (%s) failed on attempt %d: %s",
+                event.id, event.event_type, event.attempts + 1, exc,
+            )
+            await _record_failure(db, event.id, event.attempts, repr(exc))
+    return len(events)
@@ -0,0 +1,117 @@
+# @TASK P2-R1-T1 - AI Models keyword search (full-text index)
+# @SPEC docs/planning/02-trd.md#ai-models-api
+"""Indexed keyword search over model name, description and tags.
+
+Tokenization:
+    Documents and queries are split into words (lowercase, any run of
+    letters/digits) and every word becomes its character bigrams:
+    "summer" -> su um mm me er, "캐주얼한" -> 캐주 주얼 얼한. Bigrams need no
+    stemmer or morphological analyser, work for Korean (where particles and
+    endings are glued to the word), and turn a substring query ("Summ") into
+    an AND of exact index lookups. One-letter query words are dropped; a
+    keyword with no bigram at all falls back to ILIKE.
+
+Storage and index:
+    The token string is kept in ``ai_models.search_document`` (written by the
+    model service) and indexed per database:
+        PostgreSQL - GIN index on ``to_tsvector('simple', search_document)``
+                     (migration 004), ranked with ``ts_rank``
+        SQLite     - FTS5 table ``ai_models_fts`` synced by triggers (see
+                     ``app/models/ai_model.py``), ranked with ``bm25``
+
+@TEST tests/api/test_models.py
+"""
+import re
+from typing import Optional
+
+from sqlalchemy import Select, column, func, literal_column, or_, table, text
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.ai_model import AIModel
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+# Must match the expression of idx_model_search (migration 004)
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+_fts = table("ai_models_fts", column("rowid"), column("rank"))
+
+
+# ---------------------------------------------------------------------------
+# Tokenization
+# ---------------------------------------------------------------------------
+
+
+def _bigrams(word: str) -> list[str]:
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def _tokens(text_value: Optional[str]) -> list[str]:
+    tokens: list[str] = []
+    for word in _WORD_RE.findall((text_value or "").lower()):
+        tokens.extend(_bigrams(word))
+    return tokens
+
+
+def build_search_document(
+    name: str,
+    description: Optional[str],
+    tags: list[str],
+) -> str:
+    """Token string stored in ``ai_models.search_document``."""
+    parts = [name, description, *tags]
+    return " ".join(token for part in parts for token in _tokens(part))
+
+
+def query_tokens(keyword: str) -> list[str]:
+    """Distinct bigrams of a keyword (one-letter words are ignored)."""
+    seen: dict[str, None] = {}
+    for token in _tokens(keyword):
+        if len(token) >= 2:
+            seen.setdefault(token, None)
+    return list(seen)
+
+
+# ---------------------------------------------------------------------------
+# Query building
+# ---------------------------------------------------------------------------
+
+
+def apply_keyword_search(
+    stmt: Select,
+    dialect_name: str,
+    keyword: str,
+) -> tuple[Select, Optional[ColumnElement]]:
+    """Restrict a ``select`` over ``AIModel`` to models matching a keyword.
+
+    Args:
+        stmt: Statement selecting from ``ai_models`` (rows or a count).
+        dialect_name: ``db.bind.dialect.name``.
+        keyword: Raw user keyword.
+
+    Returns:
+        Tuple of (filtered statement, relevance expression or None). Higher
+        relevance is better; None means the ILIKE fallback was used.
+    """
+    tokens = query_tokens(keyword)
+    if not tokens:
+        condition = or_(
+            AIModel.name.ilike(f"%{keyword}%"),
+            AIModel.description.ilike(f"%{keyword}%"),
+        )
+        return stmt.where(condition), None
+
+    if dialect_name == "postgresql":
+        document = func.to_tsvector(_TS_CONFIG, AIModel.search_document)
+        query = func.to_tsquery(_TS_CONFIG, " & ".join(tokens))
+        return stmt.where(document.op("@@")(query)), func.ts_rank(document, query)
+
+    # SQLite FTS5: quoted tokens separated by spaces are AND-ed
+    match = " ".join(f'"{token}"' for token in tokens)
+    stmt = stmt.join_from(
+        AIModel, _fts, _fts.c.rowid == literal_column("ai_models.rowid")
+    ).where(text("ai_models_fts MATCH :search_match").bindparams(search_match=match))
+    # bm25 rank: lower (more negative) is better
+    return stmt, -_fts.c.rank
@@ -5,6 +5,7 @@
 Business rules:
     - Only creator can view their own settlements
     - Settlement is auto-created when order status transitions to 'completed'
+      (by the outbox worker, from the ``order.completed`` event)
     - platform_fee = total_amount * 10%
     - settlement_amount = total_amount - platform_fee
 
@@ -18,8 +19,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.order import Order
+from app.models.outbox import OutboxEvent
 from app.models.settlement import Settlement
 from app.models.user import User
+from app.services.outbox import outbox_handler
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +137,8 @@ async def create_settlement_for_order(
 ) -> Settlement:
     """Create a settlement record when an order is completed.
 
+    Idempotent: an order's existing settlement is returned unchanged.
+
     Calculates:
         total_amount = order.total_price
         platform_fee = total_amount * 10%
@@ -144,8 +149,14 @@ async def create_settlement_for_order(
         order: The completed Order.
 
     Returns:
-        Newly created Settlement.
+        The order's Settlement.
     """
+    existing = (
+        await db.execute(select(Settlement).where(Settlement.order_id == order.id))
+    ).scalar_one_or_none()
+    if existing is not None:
+        return existing
+
     total_amount = order.total_price
     platform_fee = int(total_amount * PLATFORM_FEE_RATE)
     settlement_amount = total_amount - platform_fee
@@ -162,3 +173,13 @@ async def create_settlement_for_order(
     await db.flush()
 
     return settlement
+
+
+@outbox_handler("order.completed")
+async def settle_completed_order(db: AsyncSession, event: OutboxEvent) -> None:
+    """Outbox handler: create the settlement of a completed order."""
+    order = await db.get(Order, event.aggregate_id)
+    if order is None or order.status != "completed":
+        logger.info("Order %s is no longer completed; no settlement", event.aggregate_id)
+        return
+    await create_settlement_for_order(db, order)
@@ -1,28 +1,101 @@
-# @TASK P2-R3-T1 - Platform Stats business logic (aggregate queries)
+# @TASK P2-R3-T1 - Platform Stats business logic (materialized counters)
 # @SPEC docs/planning/02-trd.md#platform-stats-api
-"""Platform statistics service: aggregate counts for public dashboard.
+"""Platform statistics service: counters for the public dashboard.
+
+The figures live in the single ``platform_stats`` row, so GET /api/stats is
+one primary-key read. Services that change a counted row call
+``bump_platform_stats`` before their commit, so the counter moves in the same
+transaction. ``reconcile_platform_stats`` recomputes the row from the source
+tables; it runs at startup and periodically
+(``PLATFORM_STATS_RECONCILE_INTERVAL_SECONDS``) to correct drift. Reads never
+write (they may run on the replica): without the row they fall back to
+counting.
+
+Counted:
+    total_models:   AIModel WHERE status = 'active'
+    total_bookings: Order   WHERE status = 'completed'
+    total_brands:   User    WHERE role = 'brand' AND is_active = True
 
 @TEST tests/api/test_stats.py
 """
 import logging
+from datetime import datetime
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.ai_model import AIModel
 from app.models.order import Order
+from app.models.stats import PLATFORM_STATS_ID, PlatformStats
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
 
-async def get_platform_stats(db: AsyncSession) -> dict[str, int]:
-    """Compute platform-wide statistics.
+async def count_platform_stats(db: AsyncSession) -> dict[str, int]:
+    """Compute the statistics from the source tables (one round trip)."""
+    stmt = select(
+        select(func.count(AIModel.id))
+        .where(AIModel.status == "active")
+        .scalar_subquery()
+        .label("total_models"),
+        select(func.count(Order.id))
+        .where(Order.status == "completed")
+        .scalar_subquery()
+        .label("total_bookings"),
+        select(func.count(User.id))
+        .where(User.role == "brand", User.is_active == True)  # noqa: E712
+        .scalar_subquery()
+        .label("total_brands"),
+    )
+    row = (await db.execute(stmt)).one()
+    return dict(row._mapping)
+
 
-    Queries:
-        total_models:   COUNT of AIModel WHERE status = 'active'
-        total_bookings: COUNT of Order   WHERE status = 'completed'
-        total_brands:   COUNT of User    WHERE role = 'brand' AND is_active = True
+async def reconcile_platform_stats(db: AsyncSession) -> dict[str, int]:
+    """Recompute the counters and store them (creating the row if needed)."""
+    counts = await count_platform_stats(db)
+    result = await db.execute(
+        update(PlatformStats)
+        .where(PlatformStats.id == PLATFORM_STATS_ID)
+        .values(**counts, updated_at=datetime.utcnow())
+    )
+    if result.rowcount == 0:
+        db.add(PlatformStats(id=PLATFORM_STATS_ID, **counts))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Another request created the row first; its counts are as fresh
+        await db.rollback()
+    return counts
+
+
+async def bump_platform_stats(
+    db: AsyncSession,
+    *,
+    models: int = 0,
+    bookings: int = 0,
+    brands: int = 0,
+) -> None:
+    """Add deltas to the counters within the caller's transaction (no commit)."""
+    if not (models or bookings or brands):
+        return
+    await db.execute(
+        update(PlatformStats)
+        .where(PlatformStats.id == PLATFORM_STATS_ID)
+        .values(
+            total_models=PlatformStats.total_models + models,
+            total_bookings=PlatformStats.total_bookings + bookings,
+            total_brands=PlatformStats.total_brands + brands,
+            updated_at=datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_platform_stats(db: AsyncSession) -> dict[str, int]:
+    """Return platform-wide statistics from the materialized row.
 
     Args:
         db: Async database session.
@@ -30,30 +103,12 @@ async def get_platform_stats(db: AsyncSession) -> dict[str, int]:
     Returns:
         Dictionary with total_models, total_bookings, and total_brands.
     """
-    # Count active AI models
-    models_stmt = select(func.count(AIModel.id)).where(
-        AIModel.status == "active"
-    )
-    models_result = await db.execute(models_stmt)
-    total_models = models_result.scalar_one()
-
-    # Count completed orders (bookings)
-    bookings_stmt = select(func.count(Order.id)).where(
-        Order.status == "completed"
-    )
-    bookings_result = await db.execute(bookings_stmt)
-    total_bookings = bookings_result.scalar_one()
-
-    # Count active brand users
-    brands_stmt = select(func.count(User.id)).where(
-        User.role == "brand",
-        User.is_active == True,  # noqa: E712
-    )
-    brands_result = await db.execute(brands_stmt)
-    total_brands = brands_result.scalar_one()
-
-    return {
-        "total_models": total_models,
-        "total_bookings": total_bookings,
-        "total_brands": total_brands,
-    }
+    stmt = select(
+        PlatformStats.total_models,
+        PlatformStats.total_bookings,
+        PlatformStats.total_brands,
+    ).where(PlatformStats.id == PLATFORM_STATS_ID)
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return await count_platform_stats(db)
+    return dict(row._mapping)
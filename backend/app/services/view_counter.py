@@ -0,0 +1,154 @@
+# @TASK P2-R1-T1 - AI Models view counting (write-behind)
+# @SPEC docs/planning/02-trd.md#31-성능
+"""Buffered, write-behind view counter for model detail pages.
+
+A detail view only records ``+1`` in a buffer; a periodic job
+(``app/main.py``) flushes the buffer as one batched statement::
+
+    UPDATE ai_models SET view_count = view_count + :n WHERE id = :model_id
+
+The increment is applied by the database, so concurrent workers never lose
+updates the way a read-modify-write does. Backends (``settings.CACHE_BACKEND``):
+
+    memory - per-process ``Counter``; each worker flushes its own counts
+    redis  - ``HINCRBY`` into one shared hash. A flush atomically ``RENAME``s
+             the hash away, so increments arriving meanwhile go to a fresh one
+
+Counts recorded since the last flush are visible through ``pending()`` and are
+added to the stored value in responses. Counts still buffered when a process
+dies are lost (at most one flush interval).
+
+@TEST tests/api/test_models.py
+"""
+import logging
+import uuid
+from collections import Counter
+from typing import Protocol
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import get_redis
+from app.core.config import settings
+from app.models.ai_model import AIModel
+
+logger = logging.getLogger(__name__)
+
+_ai_models = AIModel.__table__
+
+# Keep updated_at untouched: a view is not a change to the model
+_FLUSH_STMT = (
+    update(_ai_models)
+    .where(_ai_models.c.id == bindparam("model_id"))
+    .values(
+        view_count=_ai_models.c.view_count + bindparam("n"),
+        updated_at=_ai_models.c.updated_at,
+    )
+)
+
+
+class ViewCounter(Protocol):
+    async def record(self, model_id: str) -> int: ...
+
+    async def pending(self, model_id: str) -> int: ...
+
+    async def flush(self, db: AsyncSession) -> dict[str, int]: ...
+
+    async def clear(self) -> None: ...
+
+
+async def _apply(db: AsyncSession, counts: dict[str, int]) -> None:
+    """Write buffered counts in one executemany, in id order (lock ordering)."""
+    params = [
+        {"model_id": model_id, "n": n}
+        for model_id, n in sorted(counts.items())
+        if n > 0
+    ]
+    if not params:
+        return
+    await db.execute(_FLUSH_STMT, params)
+    await db.commit()
+
+
+# ---------------------------------------------------------------------------
+# In-process backend
+# ---------------------------------------------------------------------------
+
+
+class MemoryViewCounter:
+    """Counts buffered in this worker process."""
+
+    def __init__(self) -> None:
+        self._counts: Counter = Counter()
+
+    async def record(self, model_id: str) -> int:
+        """Add one view. Returns the views pending for the model."""
+        self._counts[model_id] += 1
+        return self._counts[model_id]
+
+    async def pending(self, model_id: str) -> int:
+        return self._counts.get(model_id, 0)
+
+    async def flush(self, db: AsyncSession) -> dict[str, int]:
+        """Apply and reset the buffer. Returns the views written per model."""
+        counts, self._counts = self._counts, Counter()
+        try:
+            await _apply(db, counts)
+        except Exception:
+            await db.rollback()
+            self._counts.update(counts)
+            raise
+        return dict(counts)
+
+    async def clear(self) -> None:
+        self._counts.clear()
+
+
+# ---------------------------------------------------------------------------
+# Redis backend
+# ---------------------------------------------------------------------------
+
+
+class RedisViewCounter:
+    """Counts buffered in a Redis hash shared by every worker."""
+
+    pending_key = "views:pending"
+
+    async def record(self, model_id: str) -> int:
+        return int(await get_redis().hincrby(self.pending_key, model_id, 1))
+
+    async def pending(self, model_id: str) -> int:
+        return int(await get_redis().hget(self.pending_key, model_id) or 0)
+
+    async def flush(self, db: AsyncSession) -> dict[str, int]:
+        from redis.exceptions import ResponseError
+
+        redis = get_redis()
+        flushing_key = f"views:flushing:{uuid.uuid4()}"
+        try:
+            await redis.rename(self.pending_key, flushing_key)
+        except ResponseError:
+            return {}  # nothing buffered
+        counts = {k: int(v) for k, v in (await redis.hgetall(flushing_key)).items()}
+        try:
+            await _apply(db, counts)
+        except Exception:
+            await db.rollback()
+            for model_id, n in counts.items():
+                await redis.hincrby(self.pending_key, model_id, n)
+            raise
+        finally:
+            await redis.delete(flushing_key)
+        return counts
+
+    async def clear(self) -> None:
+        await get_redis().delete(self.pending_key)
+
+
+def _create_view_counter() -> ViewCounter:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisViewCounter()
+    return MemoryViewCounter()
+
+
+view_counter = _create_view_counter()
@@ -0,0 +1,61 @@
+# @TASK P3-R2-T1 - Orders business logic (outbox worker)
+# @SPEC docs/planning/04-database-design.md#outbox
+"""Outbox worker: ``python -m app.worker``.
+
+Drains ``outbox_events`` (see app/services/outbox.py) until SIGINT/SIGTERM.
+Run it next to API processes started with ``OUTBOX_WORKER_IN_PROCESS=false``;
+otherwise each API process drains the outbox from a periodic job. Any number
+of workers can run side by side: claims never overlap.
+"""
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.core.logging import setup_logging
+from app.db.session import AsyncSessionLocal
+from app.services.outbox import drain_outbox
+
+# Modules whose import registers outbox handlers
+import app.services.settlement  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+async def drain_pending_events() -> int:
+    """Drain batches until the outbox has no due event. Returns events claimed."""
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            claimed = await drain_outbox(session)
+        total += claimed
+        if claimed < settings.OUTBOX_BATCH_SIZE:
+            return total
+
+
+async def run_worker(stop: asyncio.Event) -> None:
+    """Poll the outbox every ``OUTBOX_POLL_INTERVAL_SECONDS`` until ``stop`` is set."""
+    while not stop.is_set():
+        try:
+            await drain_pending_events()
+        except Exception:
+            logger.exception("Outbox drain failed")
+        try:
+            await asyncio.wait_for(stop.wait(), settings.OUTBOX_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    logger.info("Outbox worker started")
+    await run_worker(stop)
+    logger.info("Outbox worker stopped")
+
+
+if __name__ == "__main__":
+    setup_logging(debug=settings.DEBUG)
+    asyncio.run(main())
@@ -0,0 +1,346 @@
+# @TASK P4-R4-T1 - Dashboard analytics API tests
+# @SPEC docs/planning/04-database-design.md#analytics-rollups
+"""Tests for the dashboard analytics endpoints and their daily rollups.
+
+Covers:
+    1. Creator series after the rollup refresh (orders, GMV, settlements)
+    2. Brand series (orders, spend)
+    3. Model series: owner only (403), unknown model (404)
+    4. Views recorded from the view-counter flush
+    5. Refresh is idempotent and follows status changes
+    6. Range validation and zero-filled days
+    7. Range queries read the rollups only
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.analytics import refresh_daily_rollups
+
+
+# ---------------------------------------------------------------------------
+# URLs
+# ---------------------------------------------------------------------------
+
+SIGNUP_URL = "/api/auth/signup"
+LOGIN_URL = "/api/auth/login"
+ORDERS_URL = "/api/orders"
+ANALYTICS_URL = "/api/analytics"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _brand_payload(email: str = "brand@example.com") -> dict:
+    return {
+        "email": email,
+        "password": "StrongPass1!",
+        "nickname": "BrandUser",
+        "role": "brand",
+        "company_name": "TestCorp",
+    }
+
+
+def _creator_payload(email: str = "creator@example.com") -> dict:
+    return {
+        "email": email,
+        "password": "StrongPass1!",
+        "nickname": "CreatorUser",
+        "role": "creator",
+    }
+
+
+async def _signup_and_login(client: AsyncClient, payload: dict) -> dict:
+    """Sign up then login, return full token response JSON."""
+    await client.post(SIGNUP_URL, json=payload)
+    resp = await client.post(
+        LOGIN_URL,
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    return resp.json()
+
+
+def _auth_header(tokens: dict) -> dict:
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+async def _create_model(client: AsyncClient, creator_tokens: dict) -> str:
+    resp = await client.post(
+        "/api/models",
+        headers=_auth_header(creator_tokens),
+        json={
+            "name": "TestModel",
+            "description": "A test AI model",
+            "style": "casual",
+            "gender": "female",
+            "age_range": "20s",
+        },
+    )
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+async def _create_order(
+    client: AsyncClient,
+    brand_tokens: dict,
+    creator_tokens: dict,
+    model_id: str,
+    total_price: int = 500000,
+) -> str:
+    resp = await client.post(
+        ORDERS_URL,
+        headers=_auth_header(brand_tokens),
+        json={
+            "model_id": model_id,
+            "creator_id": creator_tokens["user"]["id"],
+            "concept_description": "Summer fashion campaign for social media",
+            "package_type": "standard",
+            "image_count": 10,
+            "is_exclusive": False,
+            "total_price": total_price,
+        },
+    )
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+async def _act(client: AsyncClient, tokens: dict, order_id: str, action: str) -> None:
+    resp = await client.patch(
+        f"{ORDERS_URL}/{order_id}/status",
+        headers=_auth_header(tokens),
+        json={"action": action},
+    )
+    assert resp.status_code == 200
+
+
+async def _setup(client: AsyncClient):
+    """Brand + creator + model, one completed and one cancelled order."""
+    creator = await _signup_and_login(client, _creator_payload())
+    brand = await _signup_and_login(client, _brand_payload())
+    model_id = await _create_model(client, creator)
+
+    completed = await _create_order(client, brand, creator, model_id, total_price=500000)
+    for action in ("accept", "start"):
+        await _act(client, creator, completed, action)
+    await _act(client, creator, completed, "complete")
+
+    cancelled = await _create_order(client, brand, creator, model_id, total_price=300000)
+    await _act(client, brand, cancelled, "cancel")
+    return brand, creator, model_id
+
+
+def _today() -> str:
+    return datetime.utcnow().date().isoformat()
+
+
+# ---------------------------------------------------------------------------
+# 1. Creator series
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_creator_analytics_after_refresh(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    run_outbox,
+):
+    """The refresh rolls today's orders and settlement up for the creator."""
+    brand, creator, model_id = await _setup(client)
+    await run_outbox()
+    await refresh_daily_rollups(db_session)
+
+    resp = await client.get(f"{ANALYTICS_URL}/creator", headers=_auth_header(creator))
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data["items"]) == 30
+    assert data["end"] == _today()
+
+    today = data["items"][-1]
+    assert today["day"] == _today()
+    assert today["orders_created"] == 2
+    assert today["orders_accepted"] == 1
+    assert today["orders_completed"] == 1
+    assert today["orders_cancelled"] == 1
+    assert today["gmv"] == 500000
+    assert today["settlement_amount"] == 450000
+    assert data["totals"]["gmv"] == 500000
+
+
+@pytest.mark.asyncio
+async def test_creator_analytics_brand_forbidden(client: AsyncClient):
+    """Brands cannot read creator analytics."""
+    brand = await _signup_and_login(client, _brand_payload())
+    resp = await client.get(f"{ANALYTICS_URL}/creator", headers=_auth_header(brand))
+    assert resp.status_code == 403
+
+
+# ---------------------------------------------------------------------------
+# 2. Brand series
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_brand_analytics_after_refresh(client: AsyncClient, db_session: AsyncSession):
+    """Brand series count the brand's orders and completed spend."""
+    brand, creator, model_id = await _setup(client)
+    await refresh_daily_rollups(db_session)
+
+    resp = await client.get(f"{ANALYTICS_URL}/brand", headers=_auth_header(brand))
+    assert resp.status_code == 200
+    totals = resp.json()["totals"]
+    assert totals == {
+        "orders_created": 2,
+        "orders_completed": 1,
+        "orders_cancelled": 1,
+        "spend": 500000,
+    }
+
+    resp = await client.get(f"{ANALYTICS_URL}/brand", headers=_auth_header(creator))
+    assert resp.status_code == 403
+
+
+# ---------------------------------------------------------------------------
+# 3. Model series
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_model_analytics_owner_only(client: AsyncClient, db_session: AsyncSession):
+    """Only the model's creator sees its series; unknown models are 404."""
+    brand, creator, model_id = await _setup(client)
+    other = await _signup_and_login(client, _creator_payload("other@example.com"))
+    await refresh_daily_rollups(db_session)
+
+    resp = await client.get(
+        f"{ANALYTICS_URL}/models/{model_id}", headers=_auth_header(creator)
+    )
+    assert resp.status_code == 200
+    assert resp.json()["totals"]["orders_created"] == 2
+
+    resp = await client.get(
+        f"{ANALYTICS_URL}/models/{model_id}", headers=_auth_header(other)
+    )
+    assert resp.status_code == 403
+
+    resp = await client.get(
+        f"{ANALYTICS_URL}/models/nonexistent", headers=_auth_header(creator)
+    )
+    assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# 4. Views
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_views_recorded_on_flush(client: AsyncClient, db_session: AsyncSession):
+    """Flushed views land on today's row and survive a refresh."""
+    from app.services.model import flush_view_counts
+
+    creator = await _signup_and_login(client, _creator_payload())
+    model_id = await _create_model(client, creator)
+    for _ in range(3):
+        await client.get(f"/api/models/{model_id}")
+    await flush_view_counts(db_session)
+    await refresh_daily_rollups(db_session)
+
+    resp = await client.get(
+        f"{ANALYTICS_URL}/models/{model_id}", headers=_auth_header(creator)
+    )
+    assert resp.json()["totals"]["views"] == 3
+
+
+# ---------------------------------------------------------------------------
+# 5. Refresh idempotency
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_idempotent_and_follows_status(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """Refreshing twice does not double count; a later cancel moves the counts."""
+    creator = await _signup_and_login(client, _creator_payload())
+    brand = await _signup_and_login(client, _brand_payload())
+    model_id = await _create_model(client, creator)
+    order_id = await _create_order(client, brand, creator, model_id)
+
+    await refresh_daily_rollups(db_session)
+    await refresh_daily_rollups(db_session)
+    resp = await client.get(f"{ANALYTICS_URL}/brand", headers=_auth_header(brand))
+    assert resp.json()["totals"]["orders_created"] == 1
+    assert resp.json()["totals"]["orders_cancelled"] == 0
+
+    await _act(client, brand, order_id, "cancel")
+    await refresh_daily_rollups(db_session)
+    resp = await client.get(f"{ANALYTICS_URL}/brand", headers=_auth_header(brand))
+    assert resp.json()["totals"]["orders_created"] == 1
+    assert resp.json()["totals"]["orders_cancelled"] == 1
+
+
+# ---------------------------------------------------------------------------
+# 6. Range handling
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_analytics_range_validation(client: AsyncClient):
+    """Inverted and over-long ranges are rejected; days are zero-filled."""
+    creator = await _signup_and_login(client, _creator_payload())
+    headers = _auth_header(creator)
+
+    resp = await client.get(
+        f"{ANALYTICS_URL}/creator",
+        params={"start": "2026-02-10", "end": "2026-02-01"},
+        headers=headers,
+    )
+    assert resp.status_code == 400
+
+    resp = await client.get(
+        f"{ANALYTICS_URL}/creator",
+        params={"start": "2024-01-01", "end": "2026-01-01"},
+        headers=headers,
+    )
+    assert resp.status_code == 400
+
+    resp = await client.get(
+        f"{ANALYTICS_URL}/creator",
+        params={"start": "2026-02-01", "end": "2026-02-07"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    items = resp.json()["items"]
+    assert [item["day"] for item in items][:2] == ["2026-02-01", "2026-02-02"]
+    assert len(items) == 7
+    assert all(item["orders_created"] == 0 for item in items)
+
+
+# ---------------------------------------------------------------------------
+# 7. Query budget
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_creator_analytics_query_budget(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    query_budget,
+):
+    """A year of creator analytics is one rollup query (plus the principal)."""
+    brand, creator, model_id = await _setup(client)
+    await refresh_daily_rollups(db_session)
+    end = datetime.utcnow().date()
+    params = {"start": (end - timedelta(days=364)).isoformat(), "end": end.isoformat()}
+    headers = _auth_header(creator)
+    await client.get(f"{ANALYTICS_URL}/creator", params=params, headers=headers)
+
+    with query_budget(1) as statements:
+        resp = await client.get(f"{ANALYTICS_URL}/creator", params=params, headers=headers)
+    assert resp.status_code == 200
+    assert all("FROM orders" not in statement for statement in statements)
@@ -303,3 +303,156 @@ async def test_social_kakao_stub(client: AsyncClient):
         json={"access_token": "kakao-token"},
     )
     assert resp.status_code == 501
+
+
+# ---------------------------------------------------------------------------
+# 9. Principal cache and embedded claims
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_deleted_user_rejected_despite_cached_principal(client: AsyncClient):
+    """Deactivating the account drops the cached principal immediately."""
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+    assert (await client.post(LOGOUT_URL, headers=headers)).status_code == 200
+
+    assert (await client.delete(ME_URL, headers=headers)).status_code == 204
+    resp = await client.post(LOGOUT_URL, headers=headers)
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_embedded_claims_skip_lookup_and_honor_deactivation(
+    client: AsyncClient, monkeypatch
+):
+    """With embedded claims the token carries the role; deletion still rejects it."""
+    from app.core.config import settings
+    from app.core.security import decode_token
+
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_EMBED_CLAIMS", True)
+    # Caches were created in-process; the flag only gates trusting the claims
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "redis")
+    tokens = await _signup_and_login(client)
+    payload = decode_token(tokens["access_token"])
+    assert payload["role"] == "brand"
+    assert payload["nickname"] == "BrandUser"
+
+    headers = _auth_header(tokens["access_token"])
+    assert (await client.post(LOGOUT_URL, headers=headers)).status_code == 200
+    assert (await client.delete(ME_URL, headers=headers)).status_code == 204
+    assert (await client.post(LOGOUT_URL, headers=headers)).status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_embedded_claims_need_shared_cache(client: AsyncClient, monkeypatch):
+    """With per-process caches the claims are neither issued nor trusted."""
+    from app.core.config import settings
+    from app.core.security import create_access_token, decode_token
+
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_EMBED_CLAIMS", True)
+    tokens = await _signup_and_login(client)
+    payload = decode_token(tokens["access_token"])
+    assert "role" not in payload
+
+    # A claims token minted elsewhere still goes through the is_active check
+    forged = create_access_token(
+        subject=tokens["user"]["id"], claims={"role": "brand", "nickname": "BrandUser"}
+    )
+    headers = _auth_header(forged)
+    assert (await client.delete(ME_URL, headers=headers)).status_code == 204
+    assert (await client.post(LOGOUT_URL, headers=headers)).status_code == 403
+
+
+# ---------------------------------------------------------------------------
+# 10. Password hashing cost
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_password_when_cost_changes(
+    client: AsyncClient, db_session, monkeypatch
+):
+    """A hash made with an old BCRYPT_ROUNDS is upgraded on successful login."""
+    from sqlalchemy import select
+
+    from app.core.config import settings
+    from app.models.user import User
+
+    payload = _brand_payload()
+    await client.post(SIGNUP_URL, json=payload)
+    old_hash = (
+        await db_session.execute(select(User.password_hash).where(User.email == payload["email"]))
+    ).scalar_one()
+
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", settings.BCRYPT_ROUNDS + 1)
+    resp = await client.post(
+        LOGIN_URL,
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    assert resp.status_code == 200
+
+    new_hash = (
+        await db_session.execute(select(User.password_hash).where(User.email == payload["email"]))
+    ).scalar_one()
+    assert new_hash != old_hash
+    assert new_hash.split("$")[2] == f"{settings.BCRYPT_ROUNDS:02d}"
+
+    # The upgraded hash still verifies
+    resp = await client.post(
+        LOGIN_URL,
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    assert resp.status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# 11. Refresh token storage
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_capped_per_user(client: AsyncClient, monkeypatch):
+    """Logging in beyond the cap signs out the oldest session."""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "REFRESH_TOKENS_PER_USER", 2)
+    payload = _brand_payload()
+    first = await _signup_and_login(client, payload)
+    credentials = {"email": payload["email"], "password": payload["password"]}
+    second = (await client.post(LOGIN_URL, json=credentials)).json()
+    third = (await client.post(LOGIN_URL, json=credentials)).json()
+
+    resp = await client.post(REFRESH_URL, json={"refresh_token": first["refresh_token"]})
+    assert resp.status_code == 401
+    for tokens in (second, third):
+        resp = await client.post(REFRESH_URL, json={"refresh_token": tokens["refresh_token"]})
+        assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_sweep_expired_refresh_tokens(client: AsyncClient, db_session):
+    """The sweeper deletes expired tokens in batches and keeps live ones."""
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import func, select
+
+    from app.models.auth import AuthToken
+    from app.services.auth import sweep_expired_refresh_tokens
+
+    tokens = await _signup_and_login(client)
+    user_id = (await client.get(ME_URL, headers=_auth_header(tokens["access_token"]))).json()["id"]
+    expired_at = datetime.utcnow() - timedelta(days=1)
+    db_session.add_all(
+        AuthToken(user_id=user_id, token_hash=f"{i:064x}", expires_at=expired_at)
+        for i in range(5)
+    )
+    await db_session.commit()
+
+    deleted = await sweep_expired_refresh_tokens(db_session, batch_size=2)
+    assert deleted == 5
+
+    remaining = (await db_session.execute(select(func.count()).select_from(AuthToken))).scalar_one()
+    assert remaining == 1
+    resp = await client.post(REFRESH_URL, json={"refresh_token": tokens["refresh_token"]})
+    assert resp.status_code == 200
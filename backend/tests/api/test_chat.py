@@ -15,10 +15,20 @@ Covers:
     10. Message with attachment
     11. Mark messages as read
     12. Order not found (404)
+    13. WebSocket delivery (auth at connect, pushed messages, broker fan-out)
 """
+import asyncio
+import json
+import os
+
 import pytest
 from httpx import AsyncClient
 
+from app.core import cache
+from app.core.config import settings
+from app.core.pubsub import MemoryBroker, RedisBroker
+from app.main import app
+
 
 # ---------------------------------------------------------------------------
 # URLs
@@ -37,6 +47,10 @@ def _read_url(order_id: str) -> str:
     return f"/api/orders/{order_id}/messages/read"
 
 
+def _ws_url(order_id: str) -> str:
+    return f"/api/orders/{order_id}/messages/ws"
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -482,3 +496,156 @@ async def test_mark_read_order_not_found(client: AsyncClient):
         headers=_auth_header(brand_tokens["access_token"]),
     )
     assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Query budgets
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_chat_query_budgets(client: AsyncClient, query_budget):
+    """Listing and sending messages run a fixed number of queries."""
+    brand_tokens, _, order_id = await _setup_order(client)
+    headers = _auth_header(brand_tokens["access_token"])
+    for i in range(5):
+        await client.post(_messages_url(order_id), headers=headers, json={"message": f"m{i}"})
+
+    with query_budget(4):
+        resp = await client.get(_messages_url(order_id), headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 5
+
+    with query_budget(4):
+        resp = await client.post(_messages_url(order_id), headers=headers, json={"message": "hi"})
+    assert resp.status_code == 201
+
+
+# ---------------------------------------------------------------------------
+# 13. WebSocket delivery
+# ---------------------------------------------------------------------------
+
+
+class _Socket:
+    """In-process WebSocket client speaking ASGI to the app directly."""
+
+    def __init__(self, url: str, headers: dict | None = None) -> None:
+        path, _, query = url.partition("?")
+        self.scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": query.encode(),
+            "headers": [
+                (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+            ],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "subprotocols": [],
+        }
+        self.to_app: asyncio.Queue = asyncio.Queue()
+        self.from_app: asyncio.Queue = asyncio.Queue()
+        self.accepted = False
+        self.close_code = None
+
+    async def __aenter__(self) -> "_Socket":
+        self.task = asyncio.create_task(app(self.scope, self.to_app.get, self.from_app.put))
+        await self.to_app.put({"type": "websocket.connect"})
+        first = await asyncio.wait_for(self.from_app.get(), 5)
+        self.accepted = first["type"] == "websocket.accept"
+        if not self.accepted:
+            self.close_code = first.get("code")
+        return self
+
+    async def receive_json(self) -> dict:
+        message = await asyncio.wait_for(self.from_app.get(), 5)
+        assert message["type"] == "websocket.send"
+        return json.loads(message["text"])
+
+    async def __aexit__(self, *exc) -> None:
+        await self.to_app.put({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self.task, 5)
+
+
+@pytest.mark.asyncio
+async def test_ws_pushes_new_messages(client: AsyncClient):
+    """Both parties receive a sent message without polling."""
+    brand_tokens, creator_tokens, order_id = await _setup_order(client)
+    creator_url = f"{_ws_url(order_id)}?token={creator_tokens['access_token']}"
+    brand_headers = _auth_header(brand_tokens["access_token"])
+
+    async with _Socket(creator_url) as creator_ws, _Socket(
+        _ws_url(order_id), headers=brand_headers
+    ) as brand_ws:
+        assert creator_ws.accepted and brand_ws.accepted
+        resp = await client.post(
+            _messages_url(order_id), headers=brand_headers, json={"message": "Hello!"}
+        )
+        assert resp.status_code == 201
+
+        for ws in (creator_ws, brand_ws):
+            pushed = await ws.receive_json()
+            assert pushed["id"] == resp.json()["id"]
+            assert pushed["message"] == "Hello!"
+            assert pushed["sender"]["nickname"] == "ChatBrand"
+        assert creator_ws.from_app.empty()
+
+
+@pytest.mark.asyncio
+async def test_ws_rejects_unauthorized(client: AsyncClient):
+    """No token, a bad token, a non-party or an unknown order refuse the handshake."""
+    brand_tokens, _, order_id = await _setup_order(client)
+    outsider = await _signup_and_login(client, _creator_payload("outsider@example.com"))
+
+    urls = [
+        _ws_url(order_id),
+        f"{_ws_url(order_id)}?token=not-a-jwt",
+        f"{_ws_url(order_id)}?token={outsider['access_token']}",
+        f"{_ws_url('nonexistent')}?token={brand_tokens['access_token']}",
+    ]
+    for url in urls:
+        async with _Socket(url) as ws:
+            assert not ws.accepted
+            assert ws.close_code == 1008
+
+
+@pytest.mark.asyncio
+async def test_memory_broker_fan_out():
+    """Channels are isolated; a lagging subscriber drops its oldest messages."""
+    broker = MemoryBroker(queue_size=2)
+    async with broker.subscribe("a") as first, broker.subscribe("a") as second:
+        async with broker.subscribe("b") as other:
+            for message in ("1", "2", "3"):
+                await broker.publish("a", message)
+            assert [await first.get(), await first.get()] == ["2", "3"]
+            assert first.dropped == 1
+            assert await second.get() == "2"
+            assert other._queue.empty()
+    assert broker.subscriber_count("a") == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not os.environ.get("TEST_REDIS_URL"),
+    reason="set TEST_REDIS_URL to run the Redis pub/sub check",
+)
+async def test_redis_broker_crosses_processes(monkeypatch):
+    """A message published by one worker's broker reaches another's subscribers."""
+    monkeypatch.setattr(settings, "REDIS_URL", os.environ["TEST_REDIS_URL"])
+    monkeypatch.setattr(cache, "_redis_client", None)
+    publisher, subscriber = RedisBroker(10), RedisBroker(10)
+    try:
+        async with subscriber.subscribe("order-1") as subscription:
+            await asyncio.sleep(0.2)  # let the SUBSCRIBE land
+            await publisher.publish("order-1", "hello")
+            await publisher.publish("order-2", "elsewhere")
+            assert await asyncio.wait_for(subscription.get(), 5) == "hello"
+            await asyncio.sleep(0.2)
+            assert subscription._queue.empty()
+    finally:
+        await subscriber.close()
+        await publisher.close()
+        await cache.get_redis().aclose()
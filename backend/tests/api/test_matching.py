@@ -5,7 +5,8 @@
 RED phase: these tests define the expected behaviour before implementation.
 
 Endpoints:
-    POST /api/matching/recommend - Concept-based AI model recommendation
+    POST /api/matching/recommend       - Concept-based AI model recommendation
+    POST /api/matching/recommend/batch - Many concepts in one request
 """
 from typing import Optional
 
@@ -23,6 +24,7 @@ from app.core.security import get_password_hash
 # ---------------------------------------------------------------------------
 
 MATCHING_URL = "/api/matching/recommend"
+BATCH_MATCHING_URL = "/api/matching/recommend/batch"
 SIGNUP_URL = "/api/auth/signup"
 LOGIN_URL = "/api/auth/login"
 
@@ -132,6 +134,7 @@ async def _seed_active_models(db_session: AsyncSession) -> list[AIModel]:
             creator_id=user.id,
             view_count=0,
             rating=0.0,
+            tag_names=list(tags),
             **model_data,
         )
         db_session.add(ai_model)
@@ -371,3 +374,521 @@ async def test_recommend_response_structure(client: AsyncClient, db_session: Asy
         ]
         for field in required_fields:
             assert field in model, f"Missing field: {field}"
+
+
+# ===========================================================================
+# 4. In-memory matching index
+# ===========================================================================
+
+
+@pytest.mark.asyncio
+async def test_recommend_reflects_model_updates(client: AsyncClient):
+    """Models created/updated through the API are matched without a rebuild."""
+    creator_tokens = await _signup_and_login(client, _creator_payload())
+    creator_headers = _auth_header(creator_tokens["access_token"])
+    brand_tokens = await _signup_and_login(client)
+    brand_headers = _auth_header(brand_tokens["access_token"])
+
+    # Build the (empty) index before any model exists
+    resp = await client.post(
+        MATCHING_URL,
+        headers=brand_headers,
+        json={"concept_description": "sporty running look"},
+    )
+    assert resp.json()["recommendations"] == []
+
+    create_resp = await client.post(
+        "/api/models",
+        headers=creator_headers,
+        json={
+            "name": "Track Star",
+            "description": "Running and gym campaigns",
+            "style": "sporty",
+            "gender": "female",
+            "age_range": "20s",
+            "tags": ["running"],
+        },
+    )
+    model_id = create_resp.json()["id"]
+
+    # Draft models are not matched
+    resp = await client.post(
+        MATCHING_URL,
+        headers=brand_headers,
+        json={"concept_description": "sporty running look"},
+    )
+    assert resp.json()["recommendations"] == []
+
+    await client.patch(
+        f"/api/models/{model_id}",
+        headers=creator_headers,
+        json={"status": "active"},
+    )
+    resp = await client.post(
+        MATCHING_URL,
+        headers=brand_headers,
+        json={"concept_description": "sporty running look"},
+    )
+    recs = resp.json()["recommendations"]
+    assert [rec["model"]["id"] for rec in recs] == [model_id]
+    assert recs[0]["model"]["tags"] == ["running"]
+
+    await client.patch(
+        f"/api/models/{model_id}",
+        headers=creator_headers,
+        json={"status": "inactive"},
+    )
+    resp = await client.post(
+        MATCHING_URL,
+        headers=brand_headers,
+        json={"concept_description": "sporty running look"},
+    )
+    assert resp.json()["recommendations"] == []
+
+
+@pytest.mark.asyncio
+async def test_index_scores_match_full_scan(db_session: AsyncSession):
+    """Index top-k returns the same scores as scoring every model."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+
+    from app.services.matching import (
+        _compute_score,
+        _extract_words,
+        matching_index,
+    )
+
+    await _seed_active_models(db_session)
+    await matching_index.build(db_session)
+
+    result = await db_session.execute(
+        select(AIModel)
+        .where(AIModel.status == "active")
+        .options(selectinload(AIModel.tags))
+    )
+    models = list(result.scalars().all())
+
+    for concept in (
+        "casual summer beach look for women",
+        "formal business suit for a mature man",
+        "retro classic vintage",
+        "nothing relevant here",
+    ):
+        words = _extract_words(concept)
+        expected = sorted(
+            (
+                (_compute_score(words, m, [t.tag for t in m.tags]), m.id)
+                for m in models
+            ),
+            reverse=True,
+        )
+        expected = [(mid, score) for score, mid in expected if score > 0.0]
+        assert matching_index.top_k(words, len(models)) == expected
+
+
+# ===========================================================================
+# 5. Batch recommendation
+# ===========================================================================
+
+
+@pytest.mark.asyncio
+async def test_recommend_batch_success(client: AsyncClient, db_session: AsyncSession):
+    """Batch results come back per concept, in order, matching single calls."""
+    await _seed_active_models(db_session)
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+    concepts = [
+        "formal business professional suit",
+        "sporty fitness model",
+        "retro vintage classic",
+        "zzz unrelated",
+    ]
+
+    resp = await client.post(
+        BATCH_MATCHING_URL,
+        headers=headers,
+        json={"concepts": [{"concept_description": c} for c in concepts]},
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert len(results) == len(concepts)
+
+    assert results[0]["recommendations"][0]["model"]["style"] == "formal"
+    assert results[1]["recommendations"][0]["model"]["style"] == "sporty"
+    assert results[2]["recommendations"][0]["model"]["style"] == "vintage"
+    assert results[3]["recommendations"] == []
+
+    for concept, batch_result in zip(concepts, results):
+        single = await client.post(
+            MATCHING_URL,
+            headers=headers,
+            json={"concept_description": concept},
+        )
+        single_scores = [r["score"] for r in single.json()["recommendations"]]
+        batch_scores = [r["score"] for r in batch_result["recommendations"]]
+        assert batch_scores == pytest.approx(single_scores, abs=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_recommend_batch_unauthenticated(client: AsyncClient):
+    """Unauthenticated user cannot access the batch endpoint."""
+    resp = await client.post(
+        BATCH_MATCHING_URL,
+        json={"concepts": [{"concept_description": "casual"}]},
+    )
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_recommend_batch_validation(client: AsyncClient):
+    """Batch must hold between 1 and 50 valid concepts."""
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+
+    resp = await client.post(BATCH_MATCHING_URL, headers=headers, json={"concepts": []})
+    assert resp.status_code == 422
+
+    too_many = [{"concept_description": f"concept {i}"} for i in range(51)]
+    resp = await client.post(BATCH_MATCHING_URL, headers=headers, json={"concepts": too_many})
+    assert resp.status_code == 422
+
+    resp = await client.post(
+        BATCH_MATCHING_URL,
+        headers=headers,
+        json={"concepts": [{"concept_description": ""}]},
+    )
+    assert resp.status_code == 422
+
+
+# ===========================================================================
+# 6. Semantic backend
+# ===========================================================================
+
+
+def test_encoder_is_deterministic_and_normalized():
+    """Same text -> same unit vector; related texts are closer than unrelated."""
+    import numpy as np
+
+    from app.services.embedding import encode_text
+
+    a = encode_text("formal business suit")
+    assert np.array_equal(a, encode_text("formal business suit"))
+    assert np.isclose(np.linalg.norm(a), 1.0)
+    assert not encode_text("   ").any()
+
+    related = float(a @ encode_text("business formal meeting"))
+    unrelated = float(a @ encode_text("beach summer sunglasses"))
+    assert related > unrelated
+
+
+@pytest.mark.asyncio
+async def test_recommend_semantic_backend(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """With MATCHING_BACKEND=semantic, ranking comes from the vector index."""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "MATCHING_BACKEND", "semantic")
+    await _seed_active_models(db_session)
+    creator_tokens = await _signup_and_login(client, _creator_payload())
+    creator_headers = _auth_header(creator_tokens["access_token"])
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+
+    resp = await client.post(
+        MATCHING_URL,
+        headers=headers,
+        json={"concept_description": "corporate office executive in a suit"},
+    )
+    assert resp.status_code == 200
+    recs = resp.json()["recommendations"]
+    assert recs[0]["model"]["style"] == "formal"
+    assert all(0.0 < rec["score"] <= 1.0 for rec in recs)
+    assert all(rec["model"]["status"] == "active" for rec in recs)
+
+    # Models created through the API are embedded and indexed incrementally
+    create_resp = await client.post(
+        "/api/models",
+        headers=creator_headers,
+        json={
+            "name": "Gym Queen",
+            "description": "Workout and training campaigns",
+            "style": "sporty",
+            "gender": "female",
+            "age_range": "20s",
+            "tags": ["gym"],
+        },
+    )
+    model_id = create_resp.json()["id"]
+    await client.patch(
+        f"/api/models/{model_id}", headers=creator_headers, json={"status": "active"}
+    )
+    resp = await client.post(
+        MATCHING_URL,
+        headers=headers,
+        json={"concept_description": "gym workout training"},
+    )
+    assert resp.json()["recommendations"][0]["model"]["id"] == model_id
+
+
+# ===========================================================================
+# 7. Bounded top-k selection / scan backend
+# ===========================================================================
+
+
+def test_select_top_k_matches_brute_force():
+    """Pruned heap selection returns exactly the brute-force top-k."""
+    import random
+
+    from app.services.matching import (
+        IndexedModel,
+        _extract_words,
+        _score_features,
+        _select_top_k,
+    )
+
+    rng = random.Random(7)
+    vocab = ["summer", "beach", "suit", "office", "gym", "retro", "classic", "street",
+             "man", "woman", "teen", "mature", "running", "casual", "formal"]
+    entries = [
+        IndexedModel(
+            id=f"m{i:04d}",
+            style=rng.choice(["casual", "formal", "sporty", "vintage"]),
+            gender=rng.choice(["male", "female", "neutral"]),
+            age_range=rng.choice(["10s", "20s", "30s", "40s+"]),
+            tag_set=frozenset(rng.sample(vocab, rng.randint(0, 3))),
+            words=frozenset(rng.sample(vocab, rng.randint(0, 6))),
+        )
+        for i in range(500)
+    ]
+
+    for concept in ("casual summer beach woman", "formal office suit mature man",
+                    "gym running teen", "retro classic", "nothing"):
+        words = _extract_words(concept)
+        brute = sorted(
+            (
+                (_score_features(words, e.style, e.gender, e.age_range, e.tag_set, e.words), e.id)
+                for e in entries
+            ),
+            reverse=True,
+        )
+        for k in (1, 5, 20):
+            expected = [(mid, score) for score, mid in brute if score > 0.0][:k]
+            assert _select_top_k(words, entries, k) == expected
+
+
+@pytest.mark.asyncio
+async def test_recommend_scan_backend_matches_index(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The index-free scan backend ranks exactly like the inverted index."""
+    from app.core.config import settings
+
+    await _seed_active_models(db_session)
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+    body = {"concept_description": "casual summer beach look for a woman"}
+
+    indexed = await client.post(MATCHING_URL, headers=headers, json=body)
+    monkeypatch.setattr(settings, "MATCHING_BACKEND", "scan")
+    scanned = await client.post(MATCHING_URL, headers=headers, json=body)
+
+    assert scanned.status_code == 200
+    assert scanned.json() == indexed.json()
+    assert scanned.json()["recommendations"][0]["model"]["name"] == "Casual Summer Girl"
+
+
+
+def test_top_k_batch_matches_loop_and_is_faster():
+    """On a large catalog the sparse batch equals per-concept top_k, faster."""
+    import random
+    import time
+
+    from app.services.matching import (
+        AGE_KEYWORDS,
+        GENDER_KEYWORDS,
+        STYLE_KEYWORDS,
+        IndexedModel,
+        MatchingIndex,
+    )
+
+    rng = random.Random(11)
+    vocab = [f"term{i}" for i in range(400)]
+    keywords = sorted(set().union(
+        *STYLE_KEYWORDS.values(), *GENDER_KEYWORDS.values(), *AGE_KEYWORDS.values()
+    ))
+    index = MatchingIndex()
+    for i in range(5000):
+        index._add(
+            IndexedModel(
+                id=f"m{i:05d}",
+                style=rng.choice(list(STYLE_KEYWORDS)),
+                gender=rng.choice(list(GENDER_KEYWORDS)),
+                age_range=rng.choice(list(AGE_KEYWORDS)),
+                tag_set=frozenset(rng.sample(vocab, 3)),
+                words=frozenset(rng.sample(vocab, 12)),
+            )
+        )
+    concepts = [set(rng.sample(vocab, 15)) | set(rng.sample(keywords, 3)) for _ in range(50)]
+
+    def best_of_3(fn):
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - started)
+        return result, min(timings)
+
+    looped, loop_time = best_of_3(lambda: [index.top_k(c, 5) for c in concepts])
+    batched, batch_time = best_of_3(lambda: index.top_k_batch(concepts, 5))
+
+    assert batched == looped
+    assert all(batched)
+    assert batch_time < loop_time
+
+
+@pytest.mark.asyncio
+async def test_recommend_batch_honours_backend(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The batch endpoint ranks with the configured backend like single calls."""
+    from app.core.config import settings
+
+    await _seed_active_models(db_session)
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+    concepts = ["casual summer beach look for a woman", "formal business suit"]
+    body = {"concepts": [{"concept_description": c} for c in concepts]}
+
+    indexed = await client.post(BATCH_MATCHING_URL, headers=headers, json=body)
+    monkeypatch.setattr(settings, "MATCHING_BACKEND", "scan")
+    scanned = await client.post(BATCH_MATCHING_URL, headers=headers, json=body)
+
+    assert scanned.status_code == 200
+    assert scanned.json() == indexed.json()
+    for concept, result in zip(concepts, scanned.json()["results"]):
+        single = await client.post(
+            MATCHING_URL, headers=headers, json={"concept_description": concept}
+        )
+        assert result["recommendations"] == single.json()["recommendations"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stale_requests_rebuild_index_once(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    """Requests racing on a stale index share one rebuild."""
+    import asyncio
+
+    from app.services import matching
+
+    await _seed_active_models(db_session)
+    fetch = matching._fetch_active_features
+    calls = []
+
+    async def slow_fetch(db):
+        calls.append(db)
+        await asyncio.sleep(0.01)
+        return await fetch(db)
+
+    monkeypatch.setattr(matching, "_fetch_active_features", slow_fetch)
+    await asyncio.gather(*(matching.matching_index.ensure_built(db_session) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert not matching.matching_index.is_stale
+    assert len(matching.matching_index) == 4
+
+# ===========================================================================
+# 8. Result cache
+# ===========================================================================
+
+
+@pytest.mark.asyncio
+async def test_recommend_cache_hits_and_invalidation(client: AsyncClient):
+    """Equivalent concepts hit the cache; model writes invalidate it."""
+    from app.services.matching import matching_cache
+
+    creator_tokens = await _signup_and_login(client, _creator_payload())
+    creator_headers = _auth_header(creator_tokens["access_token"])
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+
+    create_resp = await client.post(
+        "/api/models",
+        headers=creator_headers,
+        json={
+            "name": "Street Kid",
+            "description": "Street style",
+            "style": "casual",
+            "gender": "male",
+            "age_range": "10s",
+            "tags": ["street"],
+        },
+    )
+    model_id = create_resp.json()["id"]
+    await client.patch(
+        f"/api/models/{model_id}", headers=creator_headers, json={"status": "active"}
+    )
+
+    first = await client.post(
+        MATCHING_URL, headers=headers, json={"concept_description": "Casual street teen"}
+    )
+    # Same token set, different order/case/punctuation -> cache hit
+    second = await client.post(
+        MATCHING_URL, headers=headers, json={"concept_description": "teen, STREET casual!"}
+    )
+    assert second.json() == first.json()
+    assert matching_cache.stats()["hits"] == 1
+    assert matching_cache.stats()["misses"] == 1
+
+    # A model write bumps the catalog version
+    await client.patch(
+        f"/api/models/{model_id}", headers=creator_headers, json={"status": "inactive"}
+    )
+    third = await client.post(
+        MATCHING_URL, headers=headers, json={"concept_description": "Casual street teen"}
+    )
+    assert third.json()["recommendations"] == []
+    assert matching_cache.stats()["misses"] == 2
+
+    health = await client.get("/health")
+    assert health.json()["caches"]["matching"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_recommend_cache_skips_results_of_invalidated_version(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """A result computed while the catalog changed is not cached."""
+    from app.services import matching
+    from app.services.matching import matching_cache
+
+    await _seed_active_models(db_session)
+    tokens = await _signup_and_login(client)
+    headers = _auth_header(tokens["access_token"])
+    body = {"concept_description": "formal business suit"}
+
+    load_winners = matching._load_active_models
+
+    async def load_during_write(db, model_ids):
+        # A model write commits between the cache lookup and the set
+        await matching_cache.bump_version()
+        return await load_winners(db, model_ids)
+
+    monkeypatch.setattr(matching, "_load_active_models", load_during_write)
+    await client.post(MATCHING_URL, headers=headers, json=body)
+    monkeypatch.setattr(matching, "_load_active_models", load_winners)
+
+    await client.post(MATCHING_URL, headers=headers, json=body)
+    assert matching_cache.stats()["hits"] == 0
+    assert matching_cache.stats()["misses"] == 2
+    await client.post(MATCHING_URL, headers=headers, json=body)
+    assert matching_cache.stats()["hits"] == 1
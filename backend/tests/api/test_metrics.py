@@ -0,0 +1,99 @@
+# @TASK P0-T0.3 - Metrics endpoint tests
+# @SPEC docs/planning/02-trd.md#31-성능
+"""Tests for the Prometheus-style metrics endpoint.
+
+Endpoint:
+    GET /metrics - Process metrics in the Prometheus text format
+"""
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.metrics import reset_metrics
+
+METRICS_URL = "/metrics"
+STATS_URL = "/api/stats"
+
+
+def _sample(body: str, name: str, labels: str) -> float:
+    """Value of one sample line, e.g. _sample(body, "x_count", 'route="/a"')."""
+    match = re.search(rf"^{re.escape(name)}\{{{re.escape(labels)}\}} (\S+)$", body, re.M)
+    assert match, f"{name}{{{labels}}} not exported"
+    return float(match.group(1))
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_route_latency_and_queries(client: AsyncClient):
+    """A request shows up under its route template with its SQL statements."""
+    reset_metrics()
+    assert (await client.get(STATS_URL)).status_code == 200
+    assert (await client.get(STATS_URL)).status_code == 200
+
+    resp = await client.get(METRICS_URL)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    body = resp.text
+
+    assert _sample(body, "http_requests_total", 'method="GET",route="/api/stats",status="200"') == 2
+    assert _sample(body, "http_request_duration_seconds_count", 'method="GET",route="/api/stats"') == 2
+    assert _sample(body, "db_queries_per_request_count", 'route="/api/stats"') == 2
+    assert _sample(body, "db_queries_per_request_sum", 'route="/api/stats"') > 0
+    assert _sample(body, "db_query_duration_seconds_count", 'verb="SELECT"') > 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_expose_cache_ratios(client: AsyncClient):
+    """Registered caches are exported with their hit ratio."""
+    body = (await client.get(METRICS_URL)).text
+    assert 'cache_hit_ratio{cache="model_detail"}' in body
+    assert "# TYPE http_request_duration_seconds histogram" in body
+
+
+def test_repeated_statement_shapes_are_detected():
+    """Statements differing only in parameters or IN-list size share a shape."""
+    from collections import Counter
+
+    from app.core.metrics import repeated_statements, statement_shape
+
+    statements = [
+        "SELECT * FROM users WHERE id = ?",
+        "SELECT * FROM users WHERE id = ?",
+        "SELECT * FROM users WHERE id = ?",
+        "SELECT * FROM tags WHERE model_id IN (?, ?)",
+        "SELECT * FROM tags WHERE model_id IN (?, ?, ?)",
+    ]
+    shapes = Counter(map(statement_shape, statements))
+    assert repeated_statements(shapes, threshold=3) == [("SELECT * FROM users WHERE id = ?", 3)]
+    assert shapes["SELECT * FROM tags WHERE model_id IN (?)"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_does_not_leak_query_timer(db_session):
+    """A statement that errors pops its start time like a successful one."""
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    conn = await db_session.connection()
+    for _ in range(3):
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT * FROM no_such_table"))
+        await db_session.rollback()
+        conn = await db_session.connection()
+    await conn.execute(text("SELECT 1"))
+
+    assert conn.sync_connection.info.get("query_start") == []
+
+
+def test_metric_types_must_implement_clear():
+    """_Metric is abstract: a metric type without clear/render cannot be created."""
+    from app.core.metrics import _Metric
+
+    class Incomplete(_Metric):
+        kind = "gauge"
+
+        def render(self) -> list[str]:
+            return []
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "Missing clear.")
@@ -11,6 +11,8 @@ Endpoints:
     PATCH  /api/models/:id          - Update model (owner only)
     POST   /api/models/:id/images   - Upload model image (owner only)
 """
+import asyncio
+import logging
 from typing import Optional, Tuple
 
 import pytest
@@ -120,6 +122,8 @@ async def _seed_creator_with_model(
         view_count=10,
         rating=4.5,
         status="active",
+        thumbnail_url="https://example.com/thumb.jpg",
+        tag_names=["fashion", "formal"],
     )
     db_session.add(model)
     await db_session.flush()
@@ -429,6 +433,45 @@ async def test_get_model_detail_increments_view_count(
     assert data["view_count"] == initial_view_count + 2
 
 
+@pytest.mark.asyncio
+async def test_get_model_detail_view_count_flush(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Buffered views are written with one additive UPDATE per model on flush."""
+    from sqlalchemy import select
+
+    from app.services.model import flush_view_counts
+    from app.services.view_counter import view_counter
+
+    user, model = await _seed_creator_with_model(db_session)
+    model_id, initial_view_count = model.id, model.view_count
+
+    responses = await asyncio.gather(
+        *(client.get(f"{MODELS_URL}/{model_id}") for _ in range(10))
+    )
+    assert all(r.status_code == 200 for r in responses)
+
+    # Nothing is written until the flush
+    stored = await db_session.scalar(
+        select(AIModel.view_count).where(AIModel.id == model_id)
+    )
+    assert stored == initial_view_count
+
+    written = await flush_view_counts(db_session)
+    assert written == 10
+    stored = await db_session.scalar(
+        select(AIModel.view_count).where(AIModel.id == model_id)
+    )
+    assert stored == initial_view_count + 10
+    assert await view_counter.pending(model_id) == 0
+
+    # Flushed and buffered views add up in the response (the test client
+    # shares this session, so drop its cached copy of the row first)
+    db_session.expire_all()
+    resp = await client.get(f"{MODELS_URL}/{model_id}")
+    assert resp.json()["view_count"] == initial_view_count + 11
+
+
 @pytest.mark.asyncio
 async def test_get_model_not_found(client: AsyncClient):
     """Non-existent model ID returns 404."""
@@ -660,3 +703,382 @@ async def test_list_models_combined_filters(client: AsyncClient):
     data = resp.json()
     assert data["total"] == 1
     assert data["items"][0]["name"] == "Casual Old"
+
+
+# ===========================================================================
+# 7. Keyset (cursor) pagination
+# ===========================================================================
+
+
+async def _walk_cursor_pages(client: AsyncClient, params: dict) -> list[str]:
+    """Follow next_cursor until the last page; return the ids in order."""
+    seen: list[str] = []
+    resp = await client.get(MODELS_URL, params=params)
+    while True:
+        assert resp.status_code == 200
+        data = resp.json()
+        seen.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            return seen
+        resp = await client.get(
+            MODELS_URL, params={**params, "cursor": data["next_cursor"]}
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", ["recent", "popular", "rating"])
+async def test_list_models_cursor_walk(client: AsyncClient, sort: str):
+    """Walking next_cursor visits every model once, in the offset order."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    for i in range(7):
+        await _create_model_via_api(
+            client, tokens["access_token"], {"name": f"Model {i}"}
+        )
+
+    walked = await _walk_cursor_pages(client, {"sort": sort, "limit": 3})
+
+    full = await client.get(MODELS_URL, params={"sort": sort, "limit": 100})
+    expected = [item["id"] for item in full.json()["items"]]
+    assert walked == expected
+    assert len(set(walked)) == 7
+
+
+@pytest.mark.asyncio
+async def test_list_models_cursor_ties_broken_by_id(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Models sharing a sort value are split across pages without loss."""
+    user, _ = await _seed_creator_with_model(db_session)
+    for i in range(4):
+        db_session.add(
+            AIModel(
+                creator_id=user.id,
+                name=f"Tied {i}",
+                style="casual",
+                gender="female",
+                age_range="20s",
+                view_count=10,
+                rating=4.5,
+                status="active",
+            )
+        )
+    await db_session.commit()
+
+    walked = await _walk_cursor_pages(client, {"sort": "popular", "limit": 2})
+    assert len(walked) == 5
+    assert walked == sorted(walked, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_list_models_cursor_last_page(client: AsyncClient):
+    """The last page has no next_cursor."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    await _create_model_via_api(client, tokens["access_token"])
+
+    resp = await client.get(MODELS_URL, params={"limit": 5})
+    assert resp.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_models_without_total(client: AsyncClient):
+    """include_total=false skips the count and returns total=null."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    await _create_model_via_api(client, tokens["access_token"])
+
+    resp = await client.get(MODELS_URL, params={"include_total": "false"})
+    data = resp.json()
+    assert data["total"] is None
+    assert len(data["items"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_models_invalid_cursor(client: AsyncClient):
+    """A malformed cursor returns 400."""
+    resp = await client.get(MODELS_URL, params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_models_cursor_sort_mismatch(client: AsyncClient):
+    """A cursor issued for one sort is rejected for another."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    for i in range(2):
+        await _create_model_via_api(
+            client, tokens["access_token"], {"name": f"Model {i}"}
+        )
+
+    resp = await client.get(MODELS_URL, params={"sort": "recent", "limit": 1})
+    cursor = resp.json()["next_cursor"]
+
+    resp = await client.get(
+        MODELS_URL, params={"sort": "rating", "limit": 1, "cursor": cursor}
+    )
+    assert resp.status_code == 400
+
+
+# ===========================================================================
+# 8. Keyword search (full-text index)
+# ===========================================================================
+
+
+@pytest.mark.asyncio
+async def test_list_models_keyword_matches_tags(client: AsyncClient):
+    """Keyword search covers tags, not only name/description."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    await _create_model_via_api(
+        client, tokens["access_token"], {"name": "Plain", "tags": ["streetwear"]}
+    )
+    await _create_model_via_api(
+        client, tokens["access_token"], {"name": "Other", "tags": ["office"]}
+    )
+
+    resp = await client.get(MODELS_URL, params={"keyword": "street"})
+    data = resp.json()
+    assert data["total"] == 1
+    assert data["items"][0]["name"] == "Plain"
+
+
+@pytest.mark.asyncio
+async def test_list_models_keyword_korean(client: AsyncClient):
+    """Korean keywords match inside longer words (particles, compounds)."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    await _create_model_via_api(
+        client,
+        tokens["access_token"],
+        {"name": "여름 캐주얼룩 모델", "description": "밝은 분위기의 데일리 스타일", "tags": ["데일리룩"]},
+    )
+    await _create_model_via_api(
+        client, tokens["access_token"], {"name": "겨울 포멀 모델", "tags": ["비즈니스"]}
+    )
+
+    for keyword in ("캐주얼", "분위기", "데일리"):
+        resp = await client.get(MODELS_URL, params={"keyword": keyword})
+        data = resp.json()
+        assert data["total"] == 1, keyword
+        assert data["items"][0]["name"] == "여름 캐주얼룩 모델"
+
+
+@pytest.mark.asyncio
+async def test_list_models_keyword_follows_updates(client: AsyncClient):
+    """Updating name or tags re-indexes the model."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    created = await _create_model_via_api(
+        client, tokens["access_token"], {"name": "Before", "tags": ["alpha"]}
+    )
+
+    await client.patch(
+        f"{MODELS_URL}/{created['id']}",
+        headers=_auth_header(tokens["access_token"]),
+        json={"name": "After", "tags": ["omega"]},
+    )
+
+    assert (await client.get(MODELS_URL, params={"keyword": "Before"})).json()["total"] == 0
+    assert (await client.get(MODELS_URL, params={"keyword": "alpha"})).json()["total"] == 0
+    assert (await client.get(MODELS_URL, params={"keyword": "After"})).json()["total"] == 1
+    assert (await client.get(MODELS_URL, params={"keyword": "omega"})).json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_models_sort_relevance(client: AsyncClient):
+    """sort=relevance ranks the model matching the keyword most often first."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    await _create_model_via_api(
+        client,
+        tokens["access_token"],
+        {"name": "Vintage Vintage", "description": "vintage styling", "tags": ["vintage"]},
+    )
+    await _create_model_via_api(
+        client,
+        tokens["access_token"],
+        {"name": "Modern", "description": "a touch of vintage", "tags": ["modern"]},
+    )
+
+    resp = await client.get(
+        MODELS_URL, params={"keyword": "vintage", "sort": "relevance"}
+    )
+    data = resp.json()
+    assert data["total"] == 2
+    assert data["items"][0]["name"] == "Vintage Vintage"
+
+
+# ===========================================================================
+# 9. Denormalized list columns (thumbnail_url, tags)
+# ===========================================================================
+
+
+@pytest.mark.asyncio
+async def test_list_models_reflects_thumbnail_upload(client: AsyncClient):
+    """Uploading a thumbnail updates the list item; later thumbnails do not replace it."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    created = await _create_model_via_api(client, tokens["access_token"])
+    headers = _auth_header(tokens["access_token"])
+
+    resp = await client.get(MODELS_URL)
+    assert resp.json()["items"][0]["thumbnail_url"] is None
+
+    await client.post(
+        f"{MODELS_URL}/{created['id']}/images",
+        headers=headers,
+        files={"file": ("plain.jpg", b"fake-image-data", "image/jpeg")},
+        data={"is_thumbnail": "false"},
+    )
+    first = await client.post(
+        f"{MODELS_URL}/{created['id']}/images",
+        headers=headers,
+        files={"file": ("cover.jpg", b"fake-image-data", "image/jpeg")},
+        data={"is_thumbnail": "true"},
+    )
+    await client.post(
+        f"{MODELS_URL}/{created['id']}/images",
+        headers=headers,
+        files={"file": ("cover2.jpg", b"fake-image-data", "image/jpeg")},
+        data={"is_thumbnail": "true"},
+    )
+
+    item = (await client.get(MODELS_URL)).json()["items"][0]
+    assert item["thumbnail_url"] == first.json()["image_url"]
+
+    detail = (await client.get(f"{MODELS_URL}/{created['id']}")).json()
+    assert detail["thumbnail_url"] == item["thumbnail_url"]
+
+
+@pytest.mark.asyncio
+async def test_list_models_reflects_tag_update(client: AsyncClient):
+    """Replacing tags (including clearing them) updates the list item."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    created = await _create_model_via_api(
+        client, tokens["access_token"], {"tags": ["a1", "b2"]}
+    )
+    headers = _auth_header(tokens["access_token"])
+
+    assert (await client.get(MODELS_URL)).json()["items"][0]["tags"] == ["a1", "b2"]
+
+    await client.patch(
+        f"{MODELS_URL}/{created['id']}", headers=headers, json={"tags": ["c3"]}
+    )
+    assert (await client.get(MODELS_URL)).json()["items"][0]["tags"] == ["c3"]
+
+    await client.patch(
+        f"{MODELS_URL}/{created['id']}", headers=headers, json={"tags": []}
+    )
+    assert (await client.get(MODELS_URL)).json()["items"][0]["tags"] == []
+
+
+# ===========================================================================
+# 10. Model detail cache (ETag / If-None-Match)
+# ===========================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_model_detail_etag_not_modified(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """A matching If-None-Match returns 304 without a body; the view still counts."""
+    from app.services.view_counter import view_counter
+
+    user, model = await _seed_creator_with_model(db_session)
+
+    first = await client.get(f"{MODELS_URL}/{model.id}")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    resp = await client.get(
+        f"{MODELS_URL}/{model.id}", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert await view_counter.pending(model.id) == 2
+
+    resp = await client.get(
+        f"{MODELS_URL}/{model.id}", headers={"If-None-Match": 'W/"other"'}
+    )
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_get_model_detail_served_from_cache(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Repeated reads are cache hits with an identical body apart from view_count."""
+    from app.services.model import model_detail_cache
+
+    user, model = await _seed_creator_with_model(db_session)
+
+    first = (await client.get(f"{MODELS_URL}/{model.id}")).json()
+    hits_before = model_detail_cache.hits
+    second = (await client.get(f"{MODELS_URL}/{model.id}")).json()
+
+    assert model_detail_cache.hits == hits_before + 1
+    assert second["view_count"] == first["view_count"] + 1
+    first.pop("view_count")
+    second.pop("view_count")
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_get_model_detail_invalidated_by_update_and_upload(client: AsyncClient):
+    """update_model and add_model_image drop the cached response and change the ETag."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    created = await _create_model_via_api(client, tokens["access_token"])
+    headers = _auth_header(tokens["access_token"])
+    url = f"{MODELS_URL}/{created['id']}"
+
+    etag = (await client.get(url)).headers["etag"]
+
+    await client.patch(url, headers=headers, json={"name": "Renamed"})
+    resp = await client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["name"] == "Renamed"
+    etag = resp.headers["etag"]
+
+    upload = await client.post(
+        f"{url}/images",
+        headers=headers,
+        files={"file": ("new.jpg", b"fake-image-data", "image/jpeg")},
+        data={"is_thumbnail": "true"},
+    )
+    resp = await client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert [img["id"] for img in resp.json()["images"]] == [upload.json()["id"]]
+    assert resp.json()["thumbnail_url"] == upload.json()["image_url"]
+
+
+@pytest.mark.asyncio
+async def test_request_log_uses_route_template(client: AsyncClient, caplog):
+    """The request log line names the route template and response size."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    created = await _create_model_via_api(client, tokens["access_token"])
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="app.core.middleware"):
+        resp = await client.get(f"{MODELS_URL}/{created['id']}")
+
+    lines = [r.getMessage() for r in caplog.records if r.name == "app.core.middleware"]
+    assert len(lines) == 1
+    assert lines[0].startswith(f"GET /api/models/{{model_id}} -> 200 {len(resp.content)}B")
+
+
+@pytest.mark.asyncio
+async def test_model_query_budgets(client: AsyncClient, query_budget):
+    """List and detail queries do not grow with the number of models."""
+    tokens = await _signup_and_login(client, _creator_payload())
+    for _ in range(5):
+        created = await _create_model_via_api(client, tokens["access_token"])
+
+    with query_budget(2):
+        resp = await client.get(MODELS_URL, params={"keyword": "model"})
+    assert resp.status_code == 200
+
+    url = f"{MODELS_URL}/{created['id']}"
+    with query_budget(4):
+        assert (await client.get(url)).status_code == 200
+    with query_budget(0):
+        assert (await client.get(url)).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_db_queries_header_in_debug_mode(client: AsyncClient):
+    """Debug mode reports the request's query count in X-DB-Queries."""
+    resp = await client.get(MODELS_URL)
+    assert resp.headers["x-db-queries"] == "2"
@@ -4,12 +4,20 @@
 
 Covers:
     - Order creation (brand only)
-    - Order listing with role-based filtering
+    - Order listing with role-based filtering (offset and keyset pages)
     - Order detail retrieval
     - Status transitions (accept/reject/complete/cancel)
     - Permission checks per status change
+    - Single-statement, race-safe status updates
     - Validation (package_type, image_count, etc.)
 """
+import asyncio
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
 import pytest
 from httpx import AsyncClient
 
@@ -220,6 +228,94 @@ async def test_create_order_auto_order_number(client: AsyncClient):
     assert order1["order_number"] != order2["order_number"]
 
 
+@pytest.mark.asyncio
+async def test_create_order_bench_no_duplicate_numbers(tmp_path, monkeypatch, caplog):
+    """1000 concurrent create_order calls, each in its own session, get distinct numbers.
+
+    Runs on a file-backed database with a real connection pool so every
+    create has its own connection, as it would on PostgreSQL.
+    """
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from app.db.base import Base
+    from app.models.ai_model import AIModel
+    from app.models.order import Order
+    from app.models.user import User
+    from app.schemas.order import OrderCreate
+    from app.services.order import create_order
+    from app.services.order_number import OrderNumberAllocator
+
+    # Statement logging would dominate the timing
+    for name in (None, "sqlalchemy.engine", "aiosqlite"):
+        caplog.set_level(logging.WARNING, logger=name)
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}",
+        connect_args={"timeout": 60},
+        pool_timeout=300,
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        Session = async_sessionmaker(engine, expire_on_commit=False)
+        async with Session() as session:
+            brand = User(email="b@example.com", password_hash="x", nickname="B", role="brand")
+            creator = User(email="c@example.com", password_hash="x", nickname="C", role="creator")
+            session.add_all([brand, creator])
+            await session.flush()
+            model = AIModel(
+                creator_id=creator.id, name="M", style="casual",
+                gender="female", age_range="20s", status="active",
+            )
+            session.add(model)
+            await session.commit()
+
+        monkeypatch.setattr(
+            "app.services.order.order_number_allocator",
+            OrderNumberAllocator(engine, block_size=7),
+        )
+        order_in = OrderCreate(**_order_payload(model.id, creator.id))
+
+        async def create() -> str:
+            async with Session() as session:
+                return (await create_order(session, brand.id, order_in)).order_number
+
+        started = datetime.utcnow()
+        numbers = await asyncio.gather(*(create() for _ in range(1000)))
+        elapsed = (datetime.utcnow() - started).total_seconds()
+
+        assert len(set(numbers)) == 1000
+        async with Session() as session:
+            stored = await session.execute(
+                select(func.count(func.distinct(Order.order_number)))
+            )
+            assert stored.scalar_one() == 1000
+        sequences = sorted(int(number.rsplit("-", 1)[1]) for number in numbers)
+        assert sequences == list(range(1, 1001))
+        print(f"1000 concurrent creates: {elapsed:.2f}s")
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_create_order_does_not_count_orders(client: AsyncClient, query_budget):
+    """Order creation takes its number from the reserved block."""
+    brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
+    payload = _order_payload(model_id, creator_tokens["user"]["id"])
+    headers = _auth_header(brand_tokens["access_token"])
+    first = await client.post(ORDERS_URL, headers=headers, json=payload)
+
+    with query_budget(10) as statements:
+        second = await client.post(ORDERS_URL, headers=headers, json=payload)
+    assert second.status_code == 201
+    assert not any("order_number LIKE" in statement for statement in statements)
+
+    first_seq = int(first.json()["order_number"].rsplit("-", 1)[1])
+    second_seq = int(second.json()["order_number"].rsplit("-", 1)[1])
+    assert second_seq == first_seq + 1
+
+
 # ---------------------------------------------------------------------------
 # 2. Order listing
 # ---------------------------------------------------------------------------
@@ -374,6 +470,139 @@ async def test_list_orders_filter_by_status(client: AsyncClient):
     assert data2["total"] == 0
 
 
+@pytest.mark.asyncio
+async def test_list_orders_cursor_pagination(client: AsyncClient):
+    """next_cursor walks every order once, newest first, without OFFSET."""
+    brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
+    headers = _auth_header(brand_tokens["access_token"])
+    payload = _order_payload(model_id, creator_tokens["user"]["id"])
+    created = []
+    for _ in range(5):
+        resp = await client.post(ORDERS_URL, headers=headers, json=payload)
+        created.append(resp.json()["id"])
+
+    seen = []
+    params = {"limit": 2, "include_total": "false"}
+    while True:
+        resp = await client.get(ORDERS_URL, headers=headers, params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] is None
+        seen.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params["cursor"] = data["next_cursor"]
+
+    assert sorted(seen) == sorted(created)
+    offset = await client.get(ORDERS_URL, headers=headers, params={"limit": 5})
+    assert [item["id"] for item in offset.json()["items"]] == seen
+
+    resp = await client.get(ORDERS_URL, headers=headers, params={"cursor": "garbage"})
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not os.environ.get("TEST_POSTGRES_URL"),
+    reason="set TEST_POSTGRES_URL to run the PostgreSQL plan check",
+)
+async def test_list_orders_plan_uses_composite_index_on_postgres():
+    """EXPLAIN of the role-filtered listing uses the (party, status, created_at, id) index."""
+    from sqlalchemy import insert, text
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.db.base import Base
+    from app.models.ai_model import AIModel
+    from app.models.order import Order
+    from app.models.user import User
+    from app.services.order import build_order_list_query
+
+    schema = f"test_orders_plan_{uuid.uuid4().hex[:8]}"
+    engine = create_async_engine(
+        os.environ["TEST_POSTGRES_URL"],
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    tables = [User.__table__, AIModel.__table__, Order.__table__]
+    brands = [SimpleNamespace(id=str(uuid.uuid4()), role="brand") for _ in range(50)]
+    creator = SimpleNamespace(id=str(uuid.uuid4()), role="creator")
+    model_id = str(uuid.uuid4())
+    statuses = ["pending", "accepted", "in_progress", "completed", "cancelled"]
+    now = datetime.utcnow()
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await conn.run_sync(Base.metadata.create_all, tables=tables)
+            await conn.execute(
+                insert(User.__table__),
+                [
+                    {"id": u.id, "email": f"{u.id}@example.com", "nickname": "u", "role": u.role}
+                    for u in brands + [creator]
+                ],
+            )
+            await conn.execute(
+                insert(AIModel.__table__),
+                [
+                    {
+                        "id": model_id,
+                        "creator_id": creator.id,
+                        "name": "m",
+                        "style": "casual",
+                        "gender": "female",
+                        "age_range": "20s",
+                    }
+                ],
+            )
+            await conn.execute(
+                insert(Order.__table__),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "brand_id": brands[i % len(brands)].id,
+                        "creator_id": creator.id,
+                        "model_id": model_id,
+                        "order_number": f"ORD-PLAN-{i:06d}",
+                        "concept_description": "plan",
+                        "package_type": "basic",
+                        "image_count": 3,
+                        "total_price": 100000,
+                        "status": statuses[i % len(statuses)],
+                        "created_at": now - timedelta(minutes=i),
+                        "updated_at": now,
+                    }
+                    for i in range(20000)
+                ],
+            )
+            await conn.execute(text("ANALYZE orders"))
+
+        cases = [
+            (brands[0], "pending", None, "idx_order_brand_status_created_id"),
+            (brands[0], "pending", (now, "~"), "idx_order_brand_status_created_id"),
+            (creator, "completed", None, "idx_order_creator_status_created_id"),
+            (creator, "completed", (now, "~"), "idx_order_creator_status_created_id"),
+        ]
+        async with engine.connect() as conn:
+            for user, status_filter, after, index in cases:
+                stmt = build_order_list_query(
+                    user, status_filter=status_filter, after=after
+                ).limit(21)
+                sql = stmt.compile(
+                    dialect=postgresql.dialect(),
+                    compile_kwargs={"literal_binds": True},
+                )
+                plan = "\n".join(
+                    (await conn.exec_driver_sql(f"EXPLAIN {sql}")).scalars()
+                )
+                assert index in plan, plan
+                assert "Seq Scan" not in plan, plan
+                # The index already yields (created_at, id) DESC order
+                assert "Sort" not in plan, plan
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await engine.dispose()
+
+
 # ---------------------------------------------------------------------------
 # 3. Order detail
 # ---------------------------------------------------------------------------
@@ -705,3 +934,83 @@ async def test_status_invalid_action(client: AsyncClient):
         json={"action": "invalid_action"},
     )
     assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_status_transition_is_one_update(client: AsyncClient, query_budget):
+    """A transition is a single UPDATE .. RETURNING; parties come from cache."""
+    brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
+    payload = _order_payload(model_id, creator_tokens["user"]["id"])
+    create_resp = await client.post(
+        ORDERS_URL,
+        headers=_auth_header(brand_tokens["access_token"]),
+        json=payload,
+    )
+    assert create_resp.json()["brand"]["company_name"] == "TestCorp"
+    order_id = create_resp.json()["id"]
+
+    with query_budget(1) as statements:
+        resp = await client.patch(
+            f"{ORDERS_URL}/{order_id}/status",
+            headers=_auth_header(creator_tokens["access_token"]),
+            json={"action": "accept"},
+        )
+    assert resp.status_code == 200
+    assert statements[0].startswith("UPDATE orders")
+    data = resp.json()
+    assert data["status"] == "accepted"
+    assert data["brand"]["id"] == brand_tokens["user"]["id"]
+    assert data["creator"]["id"] == creator_tokens["user"]["id"]
+    assert data["model"]["id"] == model_id
+
+
+@pytest.mark.asyncio
+async def test_status_stale_transition_rejected(client: AsyncClient):
+    """A transition from a status the order has already left is a 400."""
+    brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
+    payload = _order_payload(model_id, creator_tokens["user"]["id"])
+    create_resp = await client.post(
+        ORDERS_URL,
+        headers=_auth_header(brand_tokens["access_token"]),
+        json=payload,
+    )
+    order_id = create_resp.json()["id"]
+    url = f"{ORDERS_URL}/{order_id}/status"
+    creator_headers = _auth_header(creator_tokens["access_token"])
+
+    first = await client.patch(url, headers=creator_headers, json={"action": "accept"})
+    second = await client.patch(url, headers=creator_headers, json={"action": "accept"})
+    reject = await client.patch(url, headers=creator_headers, json={"action": "reject"})
+    assert first.status_code == 200
+    assert second.status_code == 400
+    assert reject.status_code == 400
+
+    detail = await client.get(
+        f"{ORDERS_URL}/{order_id}", headers=_auth_header(brand_tokens["access_token"])
+    )
+    assert detail.json()["status"] == "accepted"
+
+
+@pytest.mark.asyncio
+async def test_status_non_party_and_unknown_order(client: AsyncClient):
+    """Other users get 403 and unknown orders 404 without a status change."""
+    brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
+    other_tokens = await _signup_and_login(client, _creator_payload("other@example.com"))
+    payload = _order_payload(model_id, creator_tokens["user"]["id"])
+    create_resp = await client.post(
+        ORDERS_URL,
+        headers=_auth_header(brand_tokens["access_token"]),
+        json=payload,
+    )
+    order_id = create_resp.json()["id"]
+    other_headers = _auth_header(other_tokens["access_token"])
+
+    resp = await client.patch(
+        f"{ORDERS_URL}/{order_id}/status", headers=other_headers, json={"action": "accept"}
+    )
+    assert resp.status_code == 403
+
+    resp = await client.patch(
+        f"{ORDERS_URL}/nonexistent/status", headers=other_headers, json={"action": "accept"}
+    )
+    assert resp.status_code == 404
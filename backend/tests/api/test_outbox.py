@@ -0,0 +1,269 @@
+# @TASK P3-R2-T1 - Orders outbox tests
+# @SPEC docs/planning/04-database-design.md#outbox
+"""Tests for the transactional outbox and its worker.
+
+Covers:
+    1. Completing an order writes the event in its transaction, not the settlement
+    2. Draining runs the handler once; duplicate keys are dropped
+    3. Failed handlers are rolled back and retried with backoff, then parked
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.outbox import OutboxEvent
+from app.models.settlement import Settlement
+from app.models.user import User
+from app.services import outbox
+from app.services.outbox import drain_outbox, enqueue_event
+
+
+# ---------------------------------------------------------------------------
+# URLs
+# ---------------------------------------------------------------------------
+
+SIGNUP_URL = "/api/auth/signup"
+LOGIN_URL = "/api/auth/login"
+ORDERS_URL = "/api/orders"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _signup_and_login(client: AsyncClient, payload: dict) -> dict:
+    """Sign up then login, return full token response JSON."""
+    await client.post(SIGNUP_URL, json=payload)
+    resp = await client.post(
+        LOGIN_URL,
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    return resp.json()
+
+
+def _auth_header(tokens: dict) -> dict:
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+async def _in_progress_order(client: AsyncClient) -> tuple[dict, str]:
+    """Creator tokens and an order ready to be completed."""
+    creator = await _signup_and_login(
+        client,
+        {
+            "email": "creator@example.com",
+            "password": "StrongPass1!",
+            "nickname": "CreatorUser",
+            "role": "creator",
+        },
+    )
+    brand = await _signup_and_login(
+        client,
+        {
+            "email": "brand@example.com",
+            "password": "StrongPass1!",
+            "nickname": "BrandUser",
+            "role": "brand",
+            "company_name": "TestCorp",
+        },
+    )
+    resp = await client.post(
+        "/api/models",
+        headers=_auth_header(creator),
+        json={
+            "name": "TestModel",
+            "description": "A test AI model",
+            "style": "casual",
+            "gender": "female",
+            "age_range": "20s",
+        },
+    )
+    resp = await client.post(
+        ORDERS_URL,
+        headers=_auth_header(brand),
+        json={
+            "model_id": resp.json()["id"],
+            "creator_id": creator["user"]["id"],
+            "concept_description": "Summer fashion campaign for social media",
+            "package_type": "standard",
+            "image_count": 10,
+            "is_exclusive": False,
+            "total_price": 500000,
+        },
+    )
+    order_id = resp.json()["id"]
+    for action in ("accept", "start"):
+        await client.patch(
+            f"{ORDERS_URL}/{order_id}/status",
+            headers=_auth_header(creator),
+            json={"action": action},
+        )
+    return creator, order_id
+
+
+async def _count(db: AsyncSession, model) -> int:
+    return (await db.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+@pytest.fixture
+def flaky_handler():
+    """Register a ``test.flaky`` handler that fails ``failures[0]`` times."""
+    failures = [1]
+
+    async def handler(db: AsyncSession, event: OutboxEvent) -> None:
+        # A write that must be rolled back with the failure
+        await db.execute(update(User).values(nickname="changed"))
+        if failures[0] > 0:
+            failures[0] -= 1
+            raise RuntimeError("downstream unavailable")
+
+    outbox.outbox_handler("test.flaky")(handler)
+    yield failures
+    outbox._handlers.pop("test.flaky", None)
+
+
+async def _make_due(db: AsyncSession) -> None:
+    await db.execute(
+        update(OutboxEvent).values(available_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+    await db.commit()
+
+
+# ---------------------------------------------------------------------------
+# 1. Enqueue in the request transaction
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_complete_enqueues_settlement_event(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    query_budget,
+    run_outbox,
+):
+    """Completion inserts one outbox row; the settlement waits for the worker."""
+    creator, order_id = await _in_progress_order(client)
+
+    with query_budget(5) as statements:
+        resp = await client.patch(
+            f"{ORDERS_URL}/{order_id}/status",
+            headers=_auth_header(creator),
+            json={"action": "complete"},
+        )
+    assert resp.status_code == 200
+    assert sum("INSERT INTO outbox_events" in s for s in statements) == 1
+    assert not any("settlements" in s for s in statements)
+
+    event = (await db_session.execute(select(OutboxEvent))).scalar_one()
+    assert event.event_type == "order.completed"
+    assert event.aggregate_id == order_id
+    assert event.idempotency_key == f"order.completed:{order_id}"
+    assert await _count(db_session, Settlement) == 0
+
+    assert await run_outbox() == 1
+    settlement = (await db_session.execute(select(Settlement))).scalar_one()
+    assert settlement.order_id == order_id
+    assert settlement.settlement_amount == 450000
+
+
+# ---------------------------------------------------------------------------
+# 2. Idempotency
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_drain_is_idempotent(client: AsyncClient, db_session: AsyncSession):
+    """Events run once; a duplicate key or a redelivered event changes nothing."""
+    creator, order_id = await _in_progress_order(client)
+    await client.patch(
+        f"{ORDERS_URL}/{order_id}/status",
+        headers=_auth_header(creator),
+        json={"action": "complete"},
+    )
+    await enqueue_event(db_session, "order.completed", order_id)
+    await db_session.commit()
+    assert await _count(db_session, OutboxEvent) == 1
+
+    assert await drain_outbox(db_session) == 1
+    assert await drain_outbox(db_session) == 0
+    event = (await db_session.execute(select(OutboxEvent))).scalar_one()
+    assert event.status == "done"
+    assert event.processed_at is not None
+
+    # Redelivery (e.g. an expired lease) finds the settlement already there
+    await db_session.execute(update(OutboxEvent).values(status="pending"))
+    await _make_due(db_session)
+    assert await drain_outbox(db_session) == 1
+    assert await _count(db_session, Settlement) == 1
+
+
+# ---------------------------------------------------------------------------
+# 3. Retries
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_failed_event_is_rolled_back_and_retried(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    flaky_handler,
+):
+    """A failure undoes the handler's writes and backs the event off."""
+    await _signup_and_login(
+        client,
+        {
+            "email": "creator@example.com",
+            "password": "StrongPass1!",
+            "nickname": "CreatorUser",
+            "role": "creator",
+        },
+    )
+    await enqueue_event(db_session, "test.flaky", "agg-1")
+    await db_session.commit()
+
+    assert await drain_outbox(db_session) == 1
+    event = (await db_session.execute(select(OutboxEvent))).scalar_one()
+    assert event.status == "pending"
+    assert event.attempts == 1
+    assert "downstream unavailable" in event.last_error
+    assert event.available_at > datetime.utcnow()
+    nickname = (await db_session.execute(select(User.nickname))).scalar_one()
+    assert nickname == "CreatorUser"
+
+    # Not due until the backoff has passed
+    assert await drain_outbox(db_session) == 0
+
+    await _make_due(db_session)
+    assert await drain_outbox(db_session) == 1
+    status = (await db_session.execute(select(OutboxEvent.status))).scalar_one()
+    assert status == "done"
+    nickname = (await db_session.execute(select(User.nickname))).scalar_one()
+    assert nickname == "changed"
+
+
+@pytest.mark.asyncio
+async def test_event_parked_after_max_attempts(
+    db_session: AsyncSession,
+    flaky_handler,
+    monkeypatch,
+):
+    """Events that keep failing, or have no handler, end up failed."""
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 2)
+    flaky_handler[0] = 10
+    await enqueue_event(db_session, "test.flaky", "agg-1")
+    await enqueue_event(db_session, "test.unknown", "agg-2")
+    await db_session.commit()
+
+    for _ in range(2):
+        await _make_due(db_session)
+        assert await drain_outbox(db_session) == 2
+
+    await _make_due(db_session)
+    assert await drain_outbox(db_session) == 0
+    events = (await db_session.execute(select(OutboxEvent))).scalars().all()
+    assert {event.status for event in events} == {"failed"}
+    assert {event.attempts for event in events} == {2}
@@ -106,12 +106,13 @@ def _order_payload(model_id: str, creator_id: str, total_price: int = 500000) ->
 
 async def _create_and_complete_order(
     client: AsyncClient,
+    run_outbox,
     brand_tokens: dict,
     creator_tokens: dict,
     model_id: str,
     total_price: int = 500000,
 ) -> str:
-    """Create an order and advance it to 'completed'. Returns order_id."""
+    """Create an order, advance it to 'completed' and settle it. Returns order_id."""
     creator_id = creator_tokens["user"]["id"]
     payload = _order_payload(model_id, creator_id, total_price=total_price)
 
@@ -145,6 +146,8 @@ async def _create_and_complete_order(
     assert resp.status_code == 200
     assert resp.json()["status"] == "completed"
 
+    # Settlement is created by the outbox worker
+    await run_outbox()
     return order_id
 
 
@@ -154,10 +157,10 @@ async def _create_and_complete_order(
 
 
 @pytest.mark.asyncio
-async def test_list_settlements_creator(client: AsyncClient):
+async def test_list_settlements_creator(client: AsyncClient, run_outbox):
     """Creator can list their own settlements after order completion."""
     brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
-    await _create_and_complete_order(client, brand_tokens, creator_tokens, model_id)
+    await _create_and_complete_order(client, run_outbox, brand_tokens, creator_tokens, model_id)
 
     resp = await client.get(
         SETTLEMENTS_URL,
@@ -176,10 +179,10 @@ async def test_list_settlements_creator(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_list_settlements_brand_forbidden(client: AsyncClient):
+async def test_list_settlements_brand_forbidden(client: AsyncClient, run_outbox):
     """Brand user cannot list settlements (only creators can)."""
     brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
-    await _create_and_complete_order(client, brand_tokens, creator_tokens, model_id)
+    await _create_and_complete_order(client, run_outbox, brand_tokens, creator_tokens, model_id)
 
     resp = await client.get(
         SETTLEMENTS_URL,
@@ -226,14 +229,14 @@ async def test_list_settlements_empty(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_list_settlements_pagination(client: AsyncClient):
+async def test_list_settlements_pagination(client: AsyncClient, run_outbox):
     """Settlement listing supports pagination."""
     brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
 
     # Create 3 completed orders (each generates a settlement)
     for _ in range(3):
         await _create_and_complete_order(
-            client, brand_tokens, creator_tokens, model_id
+            client, run_outbox, brand_tokens, creator_tokens, model_id
         )
 
     # Page 1, limit 2
@@ -263,10 +266,10 @@ async def test_list_settlements_pagination(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_settlement_detail(client: AsyncClient):
+async def test_get_settlement_detail(client: AsyncClient, run_outbox):
     """Creator can view settlement detail."""
     brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
-    await _create_and_complete_order(client, brand_tokens, creator_tokens, model_id)
+    await _create_and_complete_order(client, run_outbox, brand_tokens, creator_tokens, model_id)
 
     # Get the settlement ID from list
     list_resp = await client.get(
@@ -295,10 +298,10 @@ async def test_get_settlement_detail(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_settlement_other_creator_forbidden(client: AsyncClient):
+async def test_get_settlement_other_creator_forbidden(client: AsyncClient, run_outbox):
     """Another creator cannot view someone else's settlement."""
     brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
-    await _create_and_complete_order(client, brand_tokens, creator_tokens, model_id)
+    await _create_and_complete_order(client, run_outbox, brand_tokens, creator_tokens, model_id)
 
     # Get settlement ID from list
     list_resp = await client.get(
@@ -343,13 +346,13 @@ async def test_get_settlement_not_found(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_settlement_fee_calculation(client: AsyncClient):
+async def test_settlement_fee_calculation(client: AsyncClient, run_outbox):
     """Settlement correctly applies 10% platform fee."""
     brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
     total_price = 1000000  # 1,000,000 won
 
     await _create_and_complete_order(
-        client, brand_tokens, creator_tokens, model_id, total_price=total_price
+        client, run_outbox, brand_tokens, creator_tokens, model_id, total_price=total_price
     )
 
     # Get settlement detail
@@ -370,7 +373,7 @@ async def test_settlement_fee_calculation(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_auto_settlement_on_order_complete(client: AsyncClient):
+async def test_auto_settlement_on_order_complete(client: AsyncClient, run_outbox):
     """Settlement is automatically created when order is completed."""
     brand_tokens, creator_tokens, model_id = await _setup_brand_creator_model(client)
 
@@ -384,7 +387,7 @@ async def test_auto_settlement_on_order_complete(client: AsyncClient):
 
     # Complete an order
     order_id = await _create_and_complete_order(
-        client, brand_tokens, creator_tokens, model_id, total_price=500000
+        client, run_outbox, brand_tokens, creator_tokens, model_id, total_price=500000
     )
 
     # After completion, settlement should exist
@@ -25,6 +25,7 @@ from app.models.ai_model import AIModel
 from app.models.order import Order
 from app.models.user import User
 from app.core.security import get_password_hash
+from app.services.stats import reconcile_platform_stats
 
 
 # ---------------------------------------------------------------------------
@@ -262,3 +263,106 @@ async def test_stats_response_has_correct_fields(client: AsyncClient):
     for key in expected_keys:
         assert isinstance(data[key], int)
         assert data[key] >= 0
+
+
+@pytest.mark.asyncio
+async def test_stats_query_budget(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    query_budget,
+):
+    """Stats are a single read of the materialized row."""
+    await reconcile_platform_stats(db_session)
+
+    with query_budget(1):
+        resp = await client.get(STATS_URL)
+    assert resp.status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# 6. GET /api/stats - Materialized counters
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_stats_reconcile_matches_source_tables(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """Reconciliation stores the same figures the fallback counts."""
+    brand = await _create_user(db_session, email="brand@example.com", role="brand")
+    creator = await _create_user(db_session, email="creator@example.com", role="creator")
+    model = await _create_ai_model(db_session, creator.id, status="active")
+    await _create_order(db_session, brand.id, creator.id, model.id, status="completed")
+
+    counted = (await client.get(STATS_URL)).json()
+    assert await reconcile_platform_stats(db_session) == counted
+    assert (await client.get(STATS_URL)).json() == counted
+
+
+@pytest.mark.asyncio
+async def test_stats_counters_follow_writes(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """Signup, account deletion and model activation move the counters."""
+    await reconcile_platform_stats(db_session)
+
+    await client.post(
+        SIGNUP_URL,
+        json={
+            "email": "brand@example.com",
+            "password": "StrongPass1!",
+            "nickname": "BrandUser",
+            "role": "brand",
+            "company_name": "TestCorp",
+        },
+    )
+    assert (await client.get(STATS_URL)).json()["total_brands"] == 1
+
+    login = await client.post(
+        LOGIN_URL,
+        json={"email": "brand@example.com", "password": "StrongPass1!"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    resp = await client.delete("/api/users/me", headers=headers)
+    assert resp.status_code == 204
+    assert (await client.get(STATS_URL)).json()["total_brands"] == 0
+
+    await client.post(
+        SIGNUP_URL,
+        json={
+            "email": "creator@example.com",
+            "password": "StrongPass1!",
+            "nickname": "CreatorUser",
+            "role": "creator",
+        },
+    )
+    login = await client.post(
+        LOGIN_URL,
+        json={"email": "creator@example.com", "password": "StrongPass1!"},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    created = await client.post(
+        "/api/models",
+        json={
+            "name": "Test Model",
+            "description": "A beautiful test model",
+            "style": "casual",
+            "gender": "female",
+            "age_range": "20s",
+        },
+        headers=headers,
+    )
+    model_id = created.json()["id"]
+    resp = await client.patch(
+        f"/api/models/{model_id}", json={"status": "active"}, headers=headers
+    )
+    assert resp.status_code == 200
+    assert (await client.get(STATS_URL)).json()["total_models"] == 1
+
+    resp = await client.patch(
+        f"/api/models/{model_id}", json={"status": "inactive"}, headers=headers
+    )
+    assert resp.status_code == 200
+    assert (await client.get(STATS_URL)).json()["total_models"] == 0
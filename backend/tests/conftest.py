@@ -2,20 +2,35 @@
 # @SPEC docs/planning/02-trd.md#auth-api
 """Shared test fixtures: async DB engine, session override, HTTP client."""
 import asyncio
-from typing import AsyncGenerator, Generator
+import os
+from collections import Counter
+from contextlib import contextmanager
+from typing import AsyncGenerator, Callable, ContextManager, Generator
+
+# Cheap bcrypt cost for tests (read when Settings is first imported)
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
 )
 
+from app.core.cache import clear_caches
+from app.core.metrics import repeated_statements, statement_shape
+from app.core.pubsub import close_broker
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.main import app
+from app.models.order import OrderNumberSequence
+from app.services.matching import matching_index, reset_vector_index
+from app.services.order_number import order_number_allocator
+from app.services.outbox import drain_outbox
+from app.services.view_counter import view_counter
 
 # ---------------------------------------------------------------------------
 # Event loop fixture (required for pytest-asyncio)
@@ -47,6 +62,11 @@ TestSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Order number blocks are reserved on their own connection, which the single
+# shared connection of test_engine cannot provide.
+sequence_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+order_number_allocator.engine = sequence_engine
+
 
 # ---------------------------------------------------------------------------
 # DB setup / teardown
@@ -58,9 +78,35 @@ async def setup_database():
     """Create all tables before each test, drop after."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    async with sequence_engine.begin() as conn:
+        await conn.run_sync(OrderNumberSequence.__table__.create)
     yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    async with sequence_engine.begin() as conn:
+        await conn.run_sync(OrderNumberSequence.__table__.drop)
+
+
+# ---------------------------------------------------------------------------
+# Process-local state reset
+# ---------------------------------------------------------------------------
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_process_state():
+    """Clear in-memory indexes and caches so state never leaks between tests."""
+    matching_index.clear()
+    reset_vector_index()
+    await clear_caches()
+    await view_counter.clear()
+    order_number_allocator.reset()
+    yield
+    matching_index.clear()
+    reset_vector_index()
+    await clear_caches()
+    await view_counter.clear()
+    order_number_allocator.reset()
+    await close_broker()
 
 
 # ---------------------------------------------------------------------------
@@ -75,6 +121,17 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest_asyncio.fixture
+async def run_outbox(db_session: AsyncSession):
+    """Drain every due outbox event on the test session, as the worker does."""
+    async def run() -> int:
+        total = 0
+        while claimed := await drain_outbox(db_session):
+            total += claimed
+        return total
+    return run
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Provide an httpx AsyncClient with DB dependency overridden."""
@@ -83,7 +140,50 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
         yield ac
     app.dependency_overrides.clear()
+
+
+# ---------------------------------------------------------------------------
+# Query budget
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[list[str]]]:
+    """Assert a maximum number of SQL statements for a block.
+
+    Usage::
+
+        with query_budget(3):
+            await client.get("/api/models")
+
+    The block fails when it runs more statements than allowed, or (unless
+    ``allow_repeats``) the same statement shape 3+ times, a likely N+1.
+    """
+
+    @contextmanager
+    def budget(max_queries: int, *, allow_repeats: bool = False):
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+        listing = "\n".join(f"  {i + 1}. {s}" for i, s in enumerate(statements))
+        assert len(statements) <= max_queries, (
+            f"{len(statements)} queries, budget {max_queries}:\n{listing}"
+        )
+        if not allow_repeats:
+            repeats = repeated_statements(Counter(map(statement_shape, statements)))
+            assert not repeats, f"Repeated statements (N+1?): {repeats}"
+
+    return budget